@@ -0,0 +1,43 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later OR LicenseRef-Inventzia-Commercial
+# Copyright (c) 2013-2026 Magrino Bini, Paola Apruzzese, Inventzia Science and Technology Ltd.
+#
+# This file is part of pulse-data.
+#
+# pulse-data is dual-licensed:
+#   - Under the GNU Affero General Public License v3.0 or later (see LICENSE-AGPL-3.0).
+#   - Under a commercial license (see LICENSE-COMMERCIAL.txt).
+#     Contact operations@inventzia.com.
+"""
+Canonical wire form of a YAML schema, shared by generate_python.py and generate_java.py.
+
+Both generators emit it verbatim as a ``SCHEMA`` constant on the generated type,
+so every language hashes the same string into a session's schema fingerprint
+(see ``datum/session.py``). It is compact JSON::
+
+    [type id, type version, [[wire name, yaml type, required], ...]]
+
+with the fields in YAML declaration order (the order of the wire payload). The
+yaml type is ``type`` or ``type/format`` (``"integer/int64"``), and
+``array<item type>`` for arrays. Only what changes the wire encoding is
+included: descriptions and generator hints are not.
+"""
+
+import json
+
+TYPE_VERSION = 1
+
+
+def _yaml_type(prop: dict) -> str:
+    t = prop.get("type", "string")
+    if t == "array":
+        return f"array<{_yaml_type(prop.get('items', {}))}>"
+    fmt = prop.get("format")
+    return f"{t}/{fmt}" if fmt else t
+
+
+def canonical_schema(schema: dict) -> str:
+    """The canonical wire form of a parsed YAML schema (see the module docstring)."""
+    required = set(schema.get("required", []))
+    fields = [[name, _yaml_type(prop), name in required]
+              for name, prop in schema.get("properties", {}).items()]
+    return json.dumps([schema.get("$id", ""), TYPE_VERSION, fields], separators=(",", ":"))
@@ -14,7 +14,7 @@ Generate immutable Java record classes from YAML schemas.
 Each generated class:
   - Lives under com.inventzia.pulse.data.schemas.<subpackage>
   - Implements com.inventzia.pulse.data.datum.Datum
-  - Declares TYPE_ID (equals the schema $id) and TYPE_VERSION
+  - Declares TYPE_ID (equals the schema $id), TYPE_VERSION and SCHEMA (canonical.py)
   - Provides getDatumKey() and getDatumTime() driven by x-datum-key /
     x-datum-time YAML annotations
 
@@ -26,15 +26,25 @@ Usage:
 
     # Dry run (print without writing):
     python generate_java.py --schemas-dir ../schemas_yaml --dry-run -v
+
+Runs are incremental and parallel like generate_python.py (see incremental.py);
+``--force`` regenerates everything.
 """
 
 import argparse
+import json
 import re
 import sys
+from functools import partial
 from pathlib import Path
 
 import yaml
 
+from canonical import TYPE_VERSION, canonical_schema
+from incremental import Manifest, fingerprint, generate_all
+
+_MANIFEST_NAME = ".generate_java.manifest.json"          # under the output dir; see incremental.py
+
 # ---------------------------------------------------------------------------
 # License / generation header
 # ---------------------------------------------------------------------------
@@ -231,7 +241,9 @@ def generate_record(schema_path: Path, schemas_root: Path, output_root: Path,
         lines.append(f"    }}")
         lines.append("")
     lines.append(f"    public static final String TYPE_ID      = \"{schema_id}\";")
-    lines.append(f"    public static final int    TYPE_VERSION = 1;")
+    lines.append(f"    public static final int    TYPE_VERSION = {TYPE_VERSION};")
+    lines.append(f"    /** Canonical wire schema (canonical.py), hashed into session fingerprints. */")
+    lines.append(f"    public static final String SCHEMA       = {json.dumps(canonical_schema(schema))};")
     lines.append("")
     lines.append(f"    @Override public String getDatumKey()  {{ return {datum_key_field}; }}")
     lines.append(f"    @Override public long   getDatumTime() {{ return {datum_time_field}; }}")
@@ -239,7 +251,8 @@ def generate_record(schema_path: Path, schemas_root: Path, output_root: Path,
     lines.append("")
 
     source = "\n".join(lines)
-    meta = {"type_id": schema_id, "package": package, "class_name": class_name}
+    meta = {"type_id": schema_id, "package": package, "class_name": class_name,
+            "output": str(output_file)}
 
     if dry_run:
         if verbose:
@@ -258,6 +271,10 @@ def generate_record(schema_path: Path, schemas_root: Path, output_root: Path,
     return meta
 
 
+def registry_path(output_root: Path, base_package: str) -> Path:
+    return output_root / Path(*base_package.split(".")) / "DatumTypeRegistry.java"
+
+
 def generate_registry(models: list[dict], output_root: Path, base_package: str,
                       dry_run: bool, verbose: bool) -> None:
     """Emit DatumTypeRegistry.java: TYPE_ID <-> Class, code-generated and exhaustive."""
@@ -324,7 +341,7 @@ def generate_registry(models: list[dict], output_root: Path, base_package: str,
     lines.append("")
 
     source = "\n".join(lines)
-    registry_file = output_root / Path(*registry_pkg.split(".")) / "DatumTypeRegistry.java"
+    registry_file = registry_path(output_root, registry_pkg)
 
     if dry_run:
         print(f"  registry  →  {registry_file.relative_to(output_root)} ({len(models)} types)")
@@ -353,6 +370,10 @@ def main() -> int:
                         help="Base Java package for all generated classes")
     parser.add_argument("--dry-run", action="store_true",
                         help="Print generated output without writing files")
+    parser.add_argument("-j", "--jobs", type=int, default=0,
+                        help="Worker processes for changed schemas (0 = one per CPU)")
+    parser.add_argument("--force", action="store_true",
+                        help="Regenerate everything, ignoring the manifest of the last run")
     parser.add_argument("-v", "--verbose", action="store_true")
     args = parser.parse_args()
 
@@ -369,20 +390,21 @@ def main() -> int:
         return 0
 
     print(f"{'[dry-run] ' if args.dry_run else ''}Generating Java records from {schemas_root}")
-    models: list[dict] = []
-    fail = 0
-    for sf in schema_files:
-        meta = generate_record(sf, schemas_root, output_root,
-                               args.base_package, args.dry_run, args.verbose)
-        if meta:
-            models.append(meta)
-        else:
-            fail += 1
-
-    if models:
+    manifest = None if args.dry_run else Manifest(
+        output_root / _MANIFEST_NAME, fingerprint(Path(__file__), args.base_package), args.force)
+    generate = partial(generate_record, schemas_root=schemas_root, output_root=output_root,
+                       base_package=args.base_package, dry_run=args.dry_run, verbose=args.verbose)
+    generated, reused, fail = generate_all(schema_files, generate, manifest, args.jobs, args.verbose)
+    models = [meta for _, meta in generated.values()]
+
+    registry_file = registry_path(output_root, args.base_package)
+    if models and (manifest is None or not manifest.registry_fresh(models, registry_file)):
         generate_registry(models, output_root, args.base_package, args.dry_run, args.verbose)
+    if manifest is not None:
+        manifest.save(generated, registry_file)
 
-    print(f"\n{'✅' if fail == 0 else '⚠ '} {len(models)} generated" +
+    print(f"\n{'✅' if fail == 0 else '⚠ '} {len(models) - reused} generated" +
+          (f", {reused} unchanged" if reused else "") +
           (f", {fail} skipped/failed" if fail else ""))
     return 0 if fail == 0 else 1
 
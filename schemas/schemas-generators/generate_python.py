@@ -18,7 +18,8 @@ Each generated class:
   - Extends pydantic.BaseModel with model_config(extra='ignore') so unknown
     fields from a newer producer are tolerated (forward compatibility, matching
     the Java DatumCodec which disables FAIL_ON_UNKNOWN_PROPERTIES)
-  - Declares TYPE_ID (equals the schema $id) and TYPE_VERSION as ClassVars
+  - Declares TYPE_ID (equals the schema $id), TYPE_VERSION and SCHEMA (the
+    canonical wire schema, see canonical.py) as ClassVars
   - Implements datum_key and datum_time properties driven by x-datum-key /
     x-datum-time YAML annotations
   - Satisfies the inventzia.pulse.data.datum.Datum Protocol structurally
@@ -43,15 +44,25 @@ pulse-data/src/inventzia/pulse/data/schemas/, so this works from any directory):
 
     # Dry run:
     python generate_python.py --dry-run -v
+
+Runs are incremental: only schemas whose YAML (or output) changed since the
+last run are regenerated, in parallel (``--jobs``), and the registry only when
+the generated types change; ``--force`` regenerates everything (see
+incremental.py). The result is byte-identical to a full run either way.
 """
 
 import argparse
+import json
 import re
 import sys
+from functools import partial
 from pathlib import Path
 
 import yaml
 
+from canonical import TYPE_VERSION, canonical_schema
+from incremental import Manifest, fingerprint, generate_all
+
 # ---------------------------------------------------------------------------
 # Script-relative defaults: input YAML lives next to this generator, output goes
 # to the installable src/ tree — so `python generate_python.py` regenerates the
@@ -60,6 +71,7 @@ import yaml
 _HERE = Path(__file__).resolve().parent                  # .../schemas/schemas-generators
 _DEFAULT_SCHEMAS_DIR = _HERE.parent / "schemas_yaml"     # .../schemas/schemas_yaml
 _DEFAULT_OUTPUT_DIR = _HERE.parent.parent / "src"        # .../pulse-data/src
+_MANIFEST_NAME = ".generate_python.manifest.json"        # under the output dir; see incremental.py
 
 # ---------------------------------------------------------------------------
 # License / generation header
@@ -214,6 +226,29 @@ def generate_model(schema_path: Path, schemas_root: Path, output_root: Path,
         syms = sorted(imports_from[mod])
         lines.append(f"from {mod} import {', '.join(syms)}")
     lines.append("")
+    field_order = [pfn for _, pfn, _, req, _ in fields if req] + [pfn for _, pfn, _, req, _ in fields if not req]
+    lines.append("_FIELDS = (" + ", ".join(f'"{name}"' for name in field_order)
+                 + ("," if len(field_order) == 1 else "") + ")")
+    lines.append('"""Field names in declaration order: the layout of a pickled instance."""')
+    lines.append("")
+    lines.append("")
+    lines.append("def _restore(model_class: type, values: tuple):")
+    lines.append('    """An instance from already-valid field values in _FIELDS order, without validation.')
+    lines.append("")
+    lines.append("    Unpickling and the package's bulk constructors (DatumBlock, HeartBeatClock) build")
+    lines.append("    instances here; the literal dict and set beat dict(zip(_FIELDS, values)).")
+    lines.append('    """')
+    lines.append("    datum = model_class.__new__(model_class)")
+    lines.append('    object.__setattr__(datum, "__dict__", {')
+    lines.extend(f'        "{name}": values[{i}],' for i, name in enumerate(field_order))
+    lines.append("    })")
+    lines.append('    object.__setattr__(datum, "__pydantic_fields_set__", {')
+    lines.extend(f'        "{name}",' for name in field_order)
+    lines.append("    })")
+    lines.append('    object.__setattr__(datum, "__pydantic_extra__", None)')
+    lines.append('    object.__setattr__(datum, "__pydantic_private__", None)')
+    lines.append("    return datum")
+    lines.append("")
     lines.append("")
 
     lines.append(f'class {title}(BaseModel):')
@@ -225,7 +260,13 @@ def generate_model(schema_path: Path, schemas_root: Path, output_root: Path,
     lines.append(f'    model_config = ConfigDict(extra="ignore", frozen=True)')
     lines.append(f'')
     lines.append(f'    TYPE_ID:      ClassVar[str] = "{schema_id}"')
-    lines.append(f'    TYPE_VERSION: ClassVar[int] = 1')
+    lines.append(f'    TYPE_VERSION: ClassVar[int] = {TYPE_VERSION}')
+    lines.append(f'    SCHEMA:       ClassVar[str] = {json.dumps(canonical_schema(schema))}')
+    lines.append(f'    """Canonical wire schema (canonical.py), hashed into TypeTable fingerprints"""')
+    lines.append(f'')
+    lines.append(f'    DATUM_KEY_FIELD:  ClassVar[str] = "{datum_key_field}"')
+    lines.append(f'    DATUM_TIME_FIELD: ClassVar[str] = "{datum_time_field}"')
+    lines.append(f'    """Python fields behind datum_key / datum_time (x-datum-key / x-datum-time)"""')
     lines.append(f'')
 
     # Required fields first, then optional
@@ -271,9 +312,16 @@ def generate_model(schema_path: Path, schemas_root: Path, output_root: Path,
     lines.append(f'    def datum_time(self) -> int:')
     lines.append(f'        return self.{datum_time_field}')
     lines.append(f'')
+    lines.append(f'    # -- Pickling ---------------------------------------------------------')
+    lines.append(f'')
+    lines.append(f'    def __reduce__(self):')
+    lines.append(f'        # The field values only: no field names, and no revalidation on load.')
+    lines.append(f'        return _restore, (type(self), tuple(self.__dict__.values()))')
+    lines.append(f'')
 
     source = "\n".join(lines)
-    meta = {"type_id": schema_id, "package": package, "module": module, "class_name": title}
+    meta = {"type_id": schema_id, "package": package, "module": module, "class_name": title,
+            "output": str(output_file)}
 
     if dry_run:
         if verbose:
@@ -294,6 +342,10 @@ def generate_model(schema_path: Path, schemas_root: Path, output_root: Path,
     return meta
 
 
+def registry_path(output_root: Path, base_package: str) -> Path:
+    return output_root / Path(*base_package.split(".")) / "registry.py"
+
+
 def generate_registry(models: list[dict], output_root: Path, base_package: str,
                       dry_run: bool, verbose: bool) -> None:
     """Emit registry.py: TYPE_ID -> model class (mirror of Java DatumTypeRegistry)."""
@@ -319,13 +371,21 @@ def generate_registry(models: list[dict], output_root: Path, base_package: str,
     lines.append('        raise KeyError(f"Unknown TYPE_ID: {type_id!r}") from None')
     lines.append("")
     lines.append("")
+    lines.append("def class_for_name(name: str) -> type:")
+    lines.append('    """Return the model class registered under a TYPE_ID or a class name (command-line lookups)."""')
+    lines.append("    for type_id, model_class in REGISTRY.items():")
+    lines.append("        if name in (type_id, model_class.__name__):")
+    lines.append("            return model_class")
+    lines.append('    raise KeyError(f"Unknown type {name!r}; registered: {sorted(c.__name__ for c in REGISTRY.values())}")')
+    lines.append("")
+    lines.append("")
     lines.append("def type_id_of(datum) -> str:")
     lines.append('    """Return the TYPE_ID of a datum instance."""')
     lines.append("    return type(datum).TYPE_ID")
     lines.append("")
 
     source = "\n".join(lines)
-    registry_file = output_root / Path(*base_package.split(".")) / "registry.py"
+    registry_file = registry_path(output_root, base_package)
 
     if dry_run:
         print(f"  registry  →  {registry_file.relative_to(output_root)} ({len(models)} types)")
@@ -353,6 +413,10 @@ def main() -> int:
     parser.add_argument("--base-package", default="inventzia.pulse.data.schemas",
                         help="Base Python package for all generated models")
     parser.add_argument("--dry-run", action="store_true")
+    parser.add_argument("-j", "--jobs", type=int, default=0,
+                        help="Worker processes for changed schemas (0 = one per CPU)")
+    parser.add_argument("--force", action="store_true",
+                        help="Regenerate everything, ignoring the manifest of the last run")
     parser.add_argument("-v", "--verbose", action="store_true")
     args = parser.parse_args()
 
@@ -369,20 +433,21 @@ def main() -> int:
         return 0
 
     print(f"{'[dry-run] ' if args.dry_run else ''}Generating Python models from {schemas_root}")
-    models: list[dict] = []
-    fail = 0
-    for sf in schema_files:
-        meta = generate_model(sf, schemas_root, output_root,
-                              args.base_package, args.dry_run, args.verbose)
-        if meta:
-            models.append(meta)
-        else:
-            fail += 1
-
-    if models:
+    manifest = None if args.dry_run else Manifest(
+        output_root / _MANIFEST_NAME, fingerprint(Path(__file__), args.base_package), args.force)
+    generate = partial(generate_model, schemas_root=schemas_root, output_root=output_root,
+                       base_package=args.base_package, dry_run=args.dry_run, verbose=args.verbose)
+    generated, reused, fail = generate_all(schema_files, generate, manifest, args.jobs, args.verbose)
+    models = [meta for _, meta in generated.values()]
+
+    registry_file = registry_path(output_root, args.base_package)
+    if models and (manifest is None or not manifest.registry_fresh(models, registry_file)):
         generate_registry(models, output_root, args.base_package, args.dry_run, args.verbose)
+    if manifest is not None:
+        manifest.save(generated, registry_file)
 
-    print(f"\n{'✅' if fail == 0 else '⚠ '} {len(models)} generated" +
+    print(f"\n{'✅' if fail == 0 else '⚠ '} {len(models) - reused} generated" +
+          (f", {reused} unchanged" if reused else "") +
           (f", {fail} skipped/failed" if fail else ""))
     return 0 if fail == 0 else 1
 
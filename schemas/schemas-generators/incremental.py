@@ -0,0 +1,136 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later OR LicenseRef-Inventzia-Commercial
+# Copyright (c) 2013-2026 Magrino Bini, Paola Apruzzese, Inventzia Science and Technology Ltd.
+#
+# This file is part of pulse-data.
+#
+# pulse-data is dual-licensed:
+#   - Under the GNU Affero General Public License v3.0 or later (see LICENSE-AGPL-3.0).
+#   - Under a commercial license (see LICENSE-COMMERCIAL.txt).
+#     Contact operations@inventzia.com.
+"""
+Incremental, parallel driver shared by generate_python.py and generate_java.py.
+
+A run records, in a JSON manifest under the output directory, the SHA-256 of
+every schema it generated and of the file it wrote. The next run skips a schema
+when its YAML and its output are both unchanged, generates the rest across
+worker processes, and rewrites the registry only when the set of generated
+types differs from the one the registry was written for. A manifest is valid
+only for the same generator sources and options; anything else (a changed
+generator, another ``--base-package``, a missing or hand-edited output) makes
+the affected files regenerate, so the output is always byte-identical to a
+full run. ``--force`` ignores the manifest.
+"""
+
+import hashlib
+import json
+import os
+import sys
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+_VERSION = 1
+
+
+def file_hash(path: Path) -> str | None:
+    """SHA-256 of a file's bytes, or None if it does not exist."""
+    try:
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+    except FileNotFoundError:
+        return None
+
+
+def fingerprint(generator: Path, *options: str) -> str:
+    """Identity of a generator run: its sources and the options that shape the output."""
+    digest = hashlib.sha256()
+    for source in (generator, Path(__file__), Path(__file__).with_name("canonical.py")):
+        digest.update(source.read_bytes())
+    for option in options:
+        digest.update(b"\0" + option.encode("utf-8"))
+    return digest.hexdigest()
+
+
+class Manifest:
+    """Schema and output hashes of the last run, keyed by schema path."""
+
+    def __init__(self, path: Path, fingerprint: str, force: bool = False):
+        self.path = path
+        self.fingerprint = fingerprint
+        self.entries: dict[str, dict] = {}
+        self.registry: dict = {}
+        if force:
+            return
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (FileNotFoundError, ValueError):
+            return
+        if data.get("version") == _VERSION and data.get("fingerprint") == fingerprint:
+            self.entries = data.get("schemas", {})
+            self.registry = data.get("registry", {})
+
+    def fresh(self, key: str, schema_hash: str) -> dict | None:
+        """The recorded metadata if the schema and its output are unchanged, else None."""
+        entry = self.entries.get(key)
+        if entry is None or entry["schema"] != schema_hash:
+            return None
+        if file_hash(Path(entry["meta"]["output"])) != entry["output"]:
+            return None
+        return entry["meta"]
+
+    def registry_fresh(self, models: list[dict], registry_file: Path) -> bool:
+        """Whether the registry was written for exactly these types and is untouched."""
+        return (self.registry.get("models") == _models_key(models)
+                and file_hash(registry_file) == self.registry.get("output"))
+
+    def save(self, models: dict[str, tuple[str, dict]], registry_file: Path) -> None:
+        """Record this run: ``models`` maps schema key -> (schema hash, metadata)."""
+        data = {
+            "version": _VERSION,
+            "fingerprint": self.fingerprint,
+            "schemas": {key: {"schema": schema_hash, "output": file_hash(Path(meta["output"])),
+                              "meta": meta}
+                        for key, (schema_hash, meta) in sorted(models.items())},
+            "registry": {"models": _models_key([meta for _, meta in models.values()]),
+                         "output": file_hash(registry_file)},
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(json.dumps(data, indent=1) + "\n", encoding="utf-8")
+
+
+def _models_key(models: list[dict]) -> str:
+    metas = sorted(json.dumps(m, sort_keys=True) for m in models)
+    return hashlib.sha256("\n".join(metas).encode("utf-8")).hexdigest()
+
+
+def generate_all(schema_files: list[Path], generate: Callable[[Path], dict | None],
+                 manifest: Manifest | None, jobs: int,
+                 verbose: bool) -> tuple[dict[str, tuple[str, dict]], int, int]:
+    """Run ``generate`` over the schemas that need it, in parallel when ``jobs`` > 1.
+
+    Returns ({schema key: (schema hash, metadata)}, reused count, failed count)
+    for every schema in ``schema_files`` order; ``manifest`` None disables reuse.
+    """
+    hashes = {sf: file_hash(sf) for sf in schema_files}
+    results: dict[Path, dict | None] = {}
+    pending = []
+    for sf in schema_files:
+        meta = manifest.fresh(str(sf), hashes[sf]) if manifest is not None else None
+        if meta is not None:
+            results[sf] = meta
+            if verbose:
+                print(f"  ·  {sf.name} unchanged")
+        else:
+            pending.append(sf)
+    reused = len(results)
+
+    if jobs <= 0:
+        jobs = os.cpu_count() or 1
+    if jobs > 1 and len(pending) > 1:
+        sys.stdout.flush()
+        with ProcessPoolExecutor(min(jobs, len(pending))) as pool:
+            results.update(zip(pending, pool.map(generate, pending)))
+    else:
+        results.update((sf, generate(sf)) for sf in pending)
+
+    models = {str(sf): (hashes[sf], results[sf]) for sf in schema_files if results[sf]}
+    return models, reused, len(schema_files) - len(models)
@@ -49,6 +49,8 @@ public record VectorValue(
 
     public static final String TYPE_ID      = "com.inventzia.pulse.data.schemas.common.VectorValue";
     public static final int    TYPE_VERSION = 1;
+    /** Canonical wire schema (canonical.py), hashed into session fingerprints. */
+    public static final String SCHEMA       = "[\"com.inventzia.pulse.data.schemas.common.VectorValue\",1,[[\"key\",\"string\",true],[\"time\",\"integer/int64\",true],[\"values\",\"array<number/decimal>\",true],[\"valueIds\",\"array<string>\",false]]]";
 
     @Override public String getDatumKey()  { return key; }
     @Override public long   getDatumTime() { return time; }
@@ -61,6 +61,8 @@ public record CdfBar(
 
     public static final String TYPE_ID      = "com.inventzia.pulse.data.schemas.marketdata.CdfBar";
     public static final int    TYPE_VERSION = 1;
+    /** Canonical wire schema (canonical.py), hashed into session fingerprints. */
+    public static final String SCHEMA       = "[\"com.inventzia.pulse.data.schemas.marketdata.CdfBar\",1,[[\"symb\",\"string\",true],[\"timestamp\",\"integer/int64\",true],[\"op\",\"number/decimal\",true],[\"hi\",\"number/decimal\",true],[\"lo\",\"number/decimal\",true],[\"cl\",\"number/decimal\",true],[\"vlm\",\"number/decimal\",true],[\"vwap\",\"number/decimal\",false],[\"datetime\",\"string/date-time\",true],[\"count\",\"integer\",false],[\"date\",\"string/date\",true],[\"expiry\",\"string\",false],[\"strike\",\"number/decimal\",false],[\"symExp\",\"string\",false]]]";
 
     @Override public String getDatumKey()  { return symb; }
     @Override public long   getDatumTime() { return timestamp; }
@@ -38,6 +38,8 @@ public record HeartBeat(
 
     public static final String TYPE_ID      = "com.inventzia.pulse.data.schemas.platform.HeartBeat";
     public static final int    TYPE_VERSION = 1;
+    /** Canonical wire schema (canonical.py), hashed into session fingerprints. */
+    public static final String SCHEMA       = "[\"com.inventzia.pulse.data.schemas.platform.HeartBeat\",1,[[\"beatKey\",\"string\",true],[\"beatTime\",\"integer/int64\",true]]]";
 
     @Override public String getDatumKey()  { return beatKey; }
     @Override public long   getDatumTime() { return beatTime; }
@@ -40,6 +40,8 @@ public record TextMessage(
 
     public static final String TYPE_ID      = "com.inventzia.pulse.data.schemas.platform.TextMessage";
     public static final int    TYPE_VERSION = 1;
+    /** Canonical wire schema (canonical.py), hashed into session fingerprints. */
+    public static final String SCHEMA       = "[\"com.inventzia.pulse.data.schemas.platform.TextMessage\",1,[[\"msgKey\",\"string\",true],[\"msgTime\",\"integer/int64\",true],[\"text\",\"string\",true]]]";
 
     @Override public String getDatumKey()  { return msgKey; }
     @Override public long   getDatumTime() { return msgTime; }
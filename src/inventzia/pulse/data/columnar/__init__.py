@@ -0,0 +1,38 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later OR LicenseRef-Inventzia-Commercial
+# Copyright (c) 2013-2026 Magrino Bini, Paola Apruzzese, Inventzia Science and Technology Ltd.
+#
+# This file is part of pulse-data.
+#
+# pulse-data is dual-licensed:
+#   - Under the GNU Affero General Public License v3.0 or later (see LICENSE-AGPL-3.0).
+#   - Under a commercial license (see LICENSE-COMMERCIAL.txt).
+#     Contact operations@inventzia.com.
+"""Columnar (batch) representations of the generated datums.
+
+Everything under this package is opt-in and pulls dependencies the core package
+deliberately does not: the containers need the ``[columnar]`` extra (NumPy), and
+the Parquet dataset layer and the CDF CSV loader the ``[parquet]`` extra
+(PyArrow), which is imported only from their own submodules::
+
+    from inventzia.pulse.data.columnar import ColumnBatch, VectorMatrix
+    from inventzia.pulse.data.columnar.parquet import write_cdf_bars, read_cdf_bars
+    from inventzia.pulse.data.columnar.cdf_csv import read_cdf_csv
+
+Decoding JSON messages straight into a batch, without model instances, is in
+:mod:`~inventzia.pulse.data.columnar.json_decode`.
+"""
+
+from inventzia.pulse.data.columnar.batch import INT_NULL, ColumnBatch
+from inventzia.pulse.data.columnar.indicators import indicators_batch
+from inventzia.pulse.data.columnar.resample import resample_batch
+from inventzia.pulse.data.columnar.series import ColumnSeriesIndex
+from inventzia.pulse.data.columnar.vector_matrix import VectorMatrix
+
+__all__ = [
+    "INT_NULL",
+    "ColumnBatch",
+    "VectorMatrix",
+    "resample_batch",
+    "indicators_batch",
+    "ColumnSeriesIndex",
+]
@@ -0,0 +1,261 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later OR LicenseRef-Inventzia-Commercial
+# Copyright (c) 2013-2026 Magrino Bini, Paola Apruzzese, Inventzia Science and Technology Ltd.
+#
+# This file is part of pulse-data.
+#
+# pulse-data is dual-licensed:
+#   - Under the GNU Affero General Public License v3.0 or later (see LICENSE-AGPL-3.0).
+#   - Under a commercial license (see LICENSE-COMMERCIAL.txt).
+#     Contact operations@inventzia.com.
+"""
+A columnar batch of one generated model type.
+
+:class:`ColumnBatch` holds N datums of the same class as one NumPy array per
+field, keyed by the field's *wire* name (``symExp``, as on the JSON), so
+vectorised code can work on ``batch["cl"]`` instead of N Pydantic objects. The
+column layout is derived from the model's own field annotations, so it follows
+the YAML schema without a hand-maintained mapping:
+
+==========================  ======================  ======================
+field type                  column dtype            null (optional fields)
+==========================  ======================  ======================
+``int``                     ``int64``               :data:`INT_NULL`
+``Decimal``                 ``float64`` /           ``NaN`` /
+                            scaled ``int64``        :data:`INT_NULL`
+``float``                   ``float64``             ``NaN``
+``AwareDatetime``           ``datetime64[us]`` UTC  ``NaT``
+``date``                    ``datetime64[D]``       ``NaT``
+anything else (``str``,     ``object``              ``None``
+tuples)
+==========================  ======================  ======================
+
+Decimal columns are ``float64`` unless the batch has a ``scale``, in which case
+they hold exact scaled integers (see :mod:`~inventzia.pulse.data.columnar.decimals`).
+"""
+
+import typing
+from collections.abc import Iterable, Sequence
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+
+import numpy as np
+from pydantic import AwareDatetime
+
+from inventzia.pulse.data.columnar.buffers import reserve
+from inventzia.pulse.data.columnar.decimals import from_float, from_scaled, to_scaled
+
+INT_NULL = int(np.iinfo(np.int64).min)
+"""Sentinel for an absent optional value in an ``int64`` column."""
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+_EPOCH_ORDINAL = _EPOCH.toordinal()
+
+
+def _kind(annotation) -> str:
+    if typing.get_origin(annotation) is typing.Union:
+        annotation = next(a for a in typing.get_args(annotation) if a is not type(None))
+    if annotation in (AwareDatetime, datetime):
+        return "datetime"
+    for kind, python_type in (("int", int), ("decimal", Decimal), ("float", float), ("date", date)):
+        if annotation is python_type:
+            return kind
+    return "object"
+
+
+class ColumnLayout:
+    """Column names, kinds and dtypes of one model class (computed once per class)."""
+
+    _cache: dict[tuple[type, int | None], "ColumnLayout"] = {}
+
+    def __init__(self, model_class: type, scale: int | None):
+        self.model_class = model_class
+        self.scale = scale
+        self.names: list[str] = []          # wire names, in model field order
+        self.attrs: list[str] = []          # matching Python attribute names
+        self.kinds: list[str] = []
+        self.dtypes: list[np.dtype] = []
+        for attr, field in model_class.model_fields.items():
+            kind = _kind(field.annotation)
+            self.names.append(field.alias or attr)
+            self.attrs.append(attr)
+            self.kinds.append(kind)
+            self.dtypes.append(self._dtype(kind))
+
+    @classmethod
+    def of(cls, model_class: type, scale: int | None = None) -> "ColumnLayout":
+        key = (model_class, scale)
+        layout = cls._cache.get(key)
+        if layout is None:
+            layout = cls._cache[key] = cls(model_class, scale)
+        return layout
+
+    def _dtype(self, kind: str) -> np.dtype:
+        if kind == "decimal":
+            return np.dtype(np.float64 if self.scale is None else np.int64)
+        return np.dtype({"int": np.int64, "float": np.float64, "datetime": "datetime64[us]",
+                         "date": "datetime64[D]"}.get(kind, object))
+
+    # -- Python values <-> column values --------------------------------------
+
+    def to_column(self, kind: str, values: Sequence) -> np.ndarray:
+        """Convert one field's Python values (``None`` for absent) to a column array."""
+        n = len(values)
+        if kind == "int":
+            return np.fromiter((INT_NULL if v is None else v for v in values), np.int64, n)
+        if kind == "decimal" and self.scale is not None:
+            scale = self.scale
+            return np.fromiter((INT_NULL if v is None else to_scaled(v, scale) for v in values),
+                               np.int64, n)
+        if kind in ("decimal", "float"):
+            return np.fromiter((np.nan if v is None else float(v) for v in values), np.float64, n)
+        if kind == "datetime":
+            micros = np.fromiter((INT_NULL if v is None else (v - _EPOCH) // _MICROSECOND
+                                  for v in values), np.int64, n)
+            return micros.view("datetime64[us]")
+        if kind == "date":
+            days = np.fromiter((INT_NULL if v is None else v.toordinal() - _EPOCH_ORDINAL
+                                for v in values), np.int64, n)
+            return days.view("datetime64[D]")
+        return np.fromiter(values, object, n)
+
+    def from_column(self, kind: str, column: np.ndarray) -> list:
+        """Inverse of :meth:`to_column`: Python values, ``None`` where null."""
+        if kind == "int":
+            return [None if v == INT_NULL else v for v in column.tolist()]
+        if kind == "decimal" and self.scale is not None:
+            scale = self.scale
+            return [None if v == INT_NULL else from_scaled(v, scale) for v in column.tolist()]
+        if kind == "decimal":
+            return [None if v != v else from_float(v) for v in column.tolist()]
+        if kind == "float":
+            return [None if v != v else v for v in column.tolist()]
+        if kind == "datetime":
+            return [None if v == INT_NULL else _EPOCH + timedelta(microseconds=v)
+                    for v in column.view(np.int64).tolist()]
+        if kind == "date":
+            return column.astype(object).tolist()    # NaT -> None
+        return column.tolist()
+
+
+class ColumnBatch:
+    """N datums of one model class stored column-wise (see the module docstring).
+
+    A batch is growable (:meth:`extend`) with amortised O(1) appends; column
+    accessors return views of the first ``len(batch)`` rows, which stay valid
+    until the next append that has to reallocate.
+    """
+
+    def __init__(self, model_class: type, *, scale: int | None = None, capacity: int = 1024):
+        self.layout = ColumnLayout.of(model_class, scale)
+        self._rows = 0
+        self._columns = {name: np.empty(capacity, dtype=dtype)
+                         for name, dtype in zip(self.layout.names, self.layout.dtypes)}
+
+    @classmethod
+    def from_datums(cls, datums: Iterable, model_class: type | None = None, *,
+                    scale: int | None = None) -> "ColumnBatch":
+        """Build a batch from datums of one class (``model_class`` defaults to the first's)."""
+        datums = datums if isinstance(datums, list) else list(datums)
+        if model_class is None:
+            if not datums:
+                raise ValueError("model_class is required for an empty batch")
+            model_class = type(datums[0])
+        batch = cls(model_class, scale=scale, capacity=max(len(datums), 16))
+        batch.extend(datums)
+        return batch
+
+    @classmethod
+    def from_columns(cls, model_class: type, columns: dict[str, np.ndarray], *,
+                     scale: int | None = None) -> "ColumnBatch":
+        """Wrap already-built column arrays (every wire name, equal lengths) without copying."""
+        batch = cls(model_class, scale=scale, capacity=0)
+        lengths = {len(columns[name]) for name in batch.layout.names}
+        if len(lengths) != 1:
+            raise ValueError(f"columns differ in length: {sorted(lengths)}")
+        for name, dtype in zip(batch.layout.names, batch.layout.dtypes):
+            batch._columns[name] = np.asarray(columns[name], dtype=dtype)
+        batch._rows = lengths.pop()
+        return batch
+
+    # -- Shape and access -----------------------------------------------------
+
+    @property
+    def model_class(self) -> type:
+        return self.layout.model_class
+
+    @property
+    def scale(self) -> int | None:
+        return self.layout.scale
+
+    @property
+    def names(self) -> list[str]:
+        """Wire names of the columns, in model field order."""
+        return self.layout.names
+
+    def __len__(self) -> int:
+        return self._rows
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        """The column for a wire name, as a view of the filled rows."""
+        return self._columns[name][:self._rows]
+
+    def columns(self) -> dict[str, np.ndarray]:
+        """Every column, as views of the filled rows."""
+        return {name: column[:self._rows] for name, column in self._columns.items()}
+
+    def slice(self, start: int, stop: int | None = None) -> "ColumnBatch":
+        """Rows ``[start, stop)`` as a new batch sharing this batch's memory."""
+        start, stop, _ = slice(start, stop).indices(self._rows)
+        return self._derive({name: column[start:stop] for name, column in self.columns().items()})
+
+    def take(self, indices: np.ndarray) -> "ColumnBatch":
+        """The rows at ``indices`` (an integer or boolean array), copied."""
+        return self._derive({name: column[indices] for name, column in self.columns().items()})
+
+    def _derive(self, columns: dict[str, np.ndarray]) -> "ColumnBatch":
+        return ColumnBatch.from_columns(self.model_class, columns, scale=self.scale)
+
+    def __getstate__(self) -> dict:
+        # Pickle the filled rows only, not the spare capacity of the buffers.
+        return {**self.__dict__, "_columns": self.columns()}
+
+    # -- Datums in and out ----------------------------------------------------
+
+    def extend(self, datums: Sequence) -> None:
+        """Append datums of this batch's model class as new rows."""
+        if not datums:
+            return
+        start, stop = self._rows, self._rows + len(datums)
+        layout = self.layout
+        for name, attr, kind in zip(layout.names, layout.attrs, layout.kinds):
+            column = reserve(self._columns[name], start, stop)
+            column[start:stop] = layout.to_column(kind, [getattr(d, attr) for d in datums])
+            self._columns[name] = column
+        self._rows = stop
+
+    def extend_columns(self, columns: dict[str, np.ndarray]) -> None:
+        """Append rows given column-wise (every wire name, equal lengths), growing the buffers."""
+        lengths = {len(columns[name]) for name in self.layout.names}
+        if len(lengths) != 1:
+            raise ValueError(f"columns differ in length: {sorted(lengths)}")
+        start = self._rows
+        stop = start + lengths.pop()
+        for name in self.layout.names:
+            column = reserve(self._columns[name], start, stop)
+            column[start:stop] = columns[name]
+            self._columns[name] = column
+        self._rows = stop
+
+    def to_datums(self, start: int = 0, stop: int | None = None) -> list:
+        """Rebuild rows ``[start, stop)`` as model instances.
+
+        The values were validated on the way in (or produced by vectorised code
+        over validated columns), so instances are constructed without revalidation.
+        """
+        layout = self.layout
+        values = [layout.from_column(kind, self[name][start:stop])
+                  for name, kind in zip(layout.names, layout.kinds)]
+        construct = self.model_class.model_construct
+        attrs = layout.attrs
+        return [construct(**dict(zip(attrs, row))) for row in zip(*values)]
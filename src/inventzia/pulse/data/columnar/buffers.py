@@ -0,0 +1,30 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later OR LicenseRef-Inventzia-Commercial
+# Copyright (c) 2013-2026 Magrino Bini, Paola Apruzzese, Inventzia Science and Technology Ltd.
+#
+# This file is part of pulse-data.
+#
+# pulse-data is dual-licensed:
+#   - Under the GNU Affero General Public License v3.0 or later (see LICENSE-AGPL-3.0).
+#   - Under a commercial license (see LICENSE-COMMERCIAL.txt).
+#     Contact operations@inventzia.com.
+"""Growable NumPy buffers: amortised O(1) appends along the first axis."""
+
+import numpy as np
+
+
+def reserve(buffer: np.ndarray, used: int, needed: int) -> np.ndarray:
+    """Return ``buffer`` if it has room for ``needed`` rows, else a larger copy.
+
+    Capacity at least doubles on each reallocation, so a sequence of appends costs
+    amortised O(1) per row. The first ``used`` rows are carried over; the memory
+    layout (C or Fortran order) is preserved. Views taken of the old buffer keep
+    pointing at it, so they stop seeing new rows once a reallocation happens.
+    """
+    capacity = buffer.shape[0]
+    if needed <= capacity:
+        return buffer
+    capacity = max(needed, 2 * capacity, 16)
+    order = "F" if buffer.ndim > 1 and buffer.flags.f_contiguous else "C"
+    grown = np.empty((capacity, *buffer.shape[1:]), dtype=buffer.dtype, order=order)
+    grown[:used] = buffer[:used]
+    return grown
@@ -0,0 +1,147 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later OR LicenseRef-Inventzia-Commercial
+# Copyright (c) 2013-2026 Magrino Bini, Paola Apruzzese, Inventzia Science and Technology Ltd.
+#
+# This file is part of pulse-data.
+#
+# pulse-data is dual-licensed:
+#   - Under the GNU Affero General Public License v3.0 or later (see LICENSE-AGPL-3.0).
+#   - Under a commercial license (see LICENSE-COMMERCIAL.txt).
+#     Contact operations@inventzia.com.
+"""
+Bulk loading of CDF CSV files into a :class:`ColumnBatch` of :class:`CdfBar`.
+
+A vendor CDF file is a CSV whose header names the bar fields by their *wire*
+names (``symb,timestamp,op,hi,lo,cl,vlm,...,symExp``), in any order; unknown
+columns are ignored and absent optional ones are null. Parsing is PyArrow's
+multi-threaded CSV reader — the file is cut into blocks converted in parallel —
+with every column typed up front from :data:`~.parquet.CDF_BAR_SCHEMA`, so the
+schema is checked once per column (a non-numeric price, or a null in a required
+field, fails the load naming the column) instead of once per row::
+
+    batch = read_cdf_csv("bars-2024-01.csv.gz", scale=8)   # exact scaled decimals
+    closes = batch["cl"]                                     # int64, 8 implied decimals
+    bars = batch.to_datums(0, 10)                            # CdfBar only when asked
+
+Decimals are parsed straight into ``decimal128`` — never through a float — and
+land in the batch as exact scaled ``int64`` when ``scale`` is given (a value with
+more fractional digits than ``scale``, or too large for ``int64``, is rejected
+rather than rounded), or as ``float64`` otherwise. A file without ``datetime``
+or ``date`` columns gets them derived from ``timestamp`` in UTC; a file whose
+trading date is not the UTC date must carry ``date``.
+Compressed files (``.gz``, ``.bz2``, ...) are read transparently.
+
+Requires the ``[parquet]`` extra (PyArrow) as well as NumPy.
+"""
+
+from collections.abc import Iterator
+from pathlib import Path
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+
+from inventzia.pulse.data.columnar.batch import INT_NULL, ColumnBatch
+from inventzia.pulse.data.columnar.parquet import CDF_BAR_SCHEMA
+from inventzia.pulse.data.schemas.marketdata.cdf_bar import CdfBar
+
+_DERIVED = ("datetime", "date")          # computable from timestamp when absent
+_BLOCK_SIZE = 16 << 20                   # bytes of CSV converted per parallel block
+
+
+def _present_columns(path: Path, parse_options: pa_csv.ParseOptions) -> list[str]:
+    with pa_csv.open_csv(path, parse_options=parse_options,
+                         read_options=pa_csv.ReadOptions(block_size=1 << 16)) as reader:
+        return reader.schema.names
+
+
+def _options(path: Path, delimiter: str, use_threads: bool, block_size: int):
+    parse_options = pa_csv.ParseOptions(delimiter=delimiter)
+    present = set(_present_columns(path, parse_options))
+    missing = [f.name for f in CDF_BAR_SCHEMA
+               if not f.nullable and f.name not in present and f.name not in _DERIVED]
+    if missing:
+        raise ValueError(f"{path}: CDF CSV lacks required columns {missing}")
+    convert_options = pa_csv.ConvertOptions(
+        column_types={f.name: f.type for f in CDF_BAR_SCHEMA},
+        include_columns=[name for name in CDF_BAR_SCHEMA.names if name in present],
+        strings_can_be_null=True,
+    )
+    read_options = pa_csv.ReadOptions(use_threads=use_threads, block_size=block_size)
+    return read_options, parse_options, convert_options
+
+
+def _scaled(column: pa.Array, scale: int, name: str) -> np.ndarray:
+    try:
+        column = column.cast(pa.decimal128(38, scale))
+    except pa.ArrowInvalid:
+        raise ValueError(f"column {name!r} has values with more than {scale} decimals") from None
+    # decimal128 is a little-endian two's-complement int128: the scaled integer is
+    # the low word whenever the high word is just its sign extension.
+    start = 2 * column.offset
+    words = np.frombuffer(column.buffers()[1], dtype=np.int64)[start:start + 2 * len(column)]
+    low, high = words[0::2], words[1::2]
+    valid = ~column.is_null().to_numpy(zero_copy_only=False)
+    if not np.array_equal(high[valid], low[valid] >> 63):
+        raise ValueError(f"column {name!r} has values too large for int64 at scale {scale}")
+    return np.where(valid, low, INT_NULL)
+
+
+def _to_numpy(column: pa.Array, kind: str, scale: int | None, name: str) -> np.ndarray:
+    if kind == "decimal":
+        if scale is not None:
+            return _scaled(column, scale, name)
+        return column.cast(pa.float64()).to_numpy(zero_copy_only=False)
+    if kind == "int":
+        return column.fill_null(INT_NULL).to_numpy()
+    if kind == "datetime":        # int64 min is NaT, so INT_NULL doubles as the null
+        return column.cast(pa.int64()).fill_null(INT_NULL).to_numpy().view("datetime64[us]")
+    if kind == "date":
+        days = column.cast(pa.int32()).cast(pa.int64()).fill_null(INT_NULL)
+        return days.to_numpy().view("datetime64[D]")
+    return column.to_numpy(zero_copy_only=False)
+
+
+def _to_batch(table: pa.Table | pa.RecordBatch, scale: int | None) -> ColumnBatch:
+    layout = ColumnBatch(CdfBar, scale=scale, capacity=0).layout
+    for f in CDF_BAR_SCHEMA:
+        if not f.nullable and f.name in table.schema.names and table.column(f.name).null_count:
+            raise ValueError(f"required column {f.name!r} has {table.column(f.name).null_count} "
+                             f"empty values")
+    n = table.num_rows
+    columns: dict[str, np.ndarray] = {}
+    for name, kind in zip(layout.names, layout.kinds):
+        if name in table.schema.names:
+            column = table.column(name)
+            if isinstance(column, pa.ChunkedArray):
+                column = column.combine_chunks()
+            columns[name] = _to_numpy(column, kind, scale, name)
+    millis = columns["timestamp"].view("datetime64[ms]")
+    columns.setdefault("datetime", millis.astype("datetime64[us]"))
+    columns.setdefault("date", millis.astype("datetime64[D]"))
+    for name, kind, dtype in zip(layout.names, layout.kinds, layout.dtypes):
+        if name not in columns:               # absent optional column: all null
+            fill = INT_NULL if dtype == np.int64 else (np.nan if dtype == np.float64 else None)
+            columns[name] = np.full(n, fill, dtype=dtype)
+    return ColumnBatch.from_columns(CdfBar, columns, scale=scale)
+
+
+def read_cdf_csv(path: str | Path, *, scale: int | None = None, delimiter: str = ",",
+                 use_threads: bool = True, block_size: int = _BLOCK_SIZE) -> ColumnBatch:
+    """Load a whole CDF CSV file into one :class:`CdfBar` column batch."""
+    path = Path(path)
+    read_options, parse_options, convert_options = _options(path, delimiter, use_threads,
+                                                            block_size)
+    table = pa_csv.read_csv(path, read_options=read_options, parse_options=parse_options,
+                            convert_options=convert_options)
+    return _to_batch(table, scale)
+
+
+def iter_cdf_csv(path: str | Path, *, scale: int | None = None, delimiter: str = ",",
+                 block_size: int = _BLOCK_SIZE) -> Iterator[ColumnBatch]:
+    """Stream a CDF CSV file as one column batch per ``block_size`` bytes, in file order."""
+    path = Path(path)
+    read_options, parse_options, convert_options = _options(path, delimiter, True, block_size)
+    with pa_csv.open_csv(path, read_options=read_options, parse_options=parse_options,
+                         convert_options=convert_options) as reader:
+        for record_batch in reader:
+            yield _to_batch(record_batch, scale)
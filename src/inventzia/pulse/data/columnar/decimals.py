@@ -0,0 +1,44 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later OR LicenseRef-Inventzia-Commercial
+# Copyright (c) 2013-2026 Magrino Bini, Paola Apruzzese, Inventzia Science and Technology Ltd.
+#
+# This file is part of pulse-data.
+#
+# pulse-data is dual-licensed:
+#   - Under the GNU Affero General Public License v3.0 or later (see LICENSE-AGPL-3.0).
+#   - Under a commercial license (see LICENSE-COMMERCIAL.txt).
+#     Contact operations@inventzia.com.
+"""
+``Decimal`` <-> numeric column conversions.
+
+The generated models carry every ``format: decimal`` field as an exact
+:class:`~decimal.Decimal`. A numeric column holds them in one of two forms:
+
+* ``float64`` — for vectorised analytics; converted back with the shortest
+  ``repr`` that round-trips, so a value that came in as ``"101.25"`` comes out as
+  ``Decimal("101.25")``, not the binary expansion of the float;
+* scaled ``int64`` — exact: ``value * 10**scale`` as an integer, for callers that
+  cannot tolerate binary rounding. A value with more fractional digits than
+  ``scale`` is rejected, never rounded.
+"""
+
+from decimal import Decimal
+
+
+def to_scaled(value: Decimal, scale: int) -> int:
+    """Return ``value * 10**scale`` as an int, raising if that is not exact."""
+    scaled = value.scaleb(scale)
+    as_int = int(scaled)
+    if as_int != scaled:
+        raise ValueError(f"{value} has more than {scale} fractional digits")
+    return as_int
+
+
+def from_scaled(value: int, scale: int) -> Decimal:
+    """Inverse of :func:`to_scaled`."""
+    return Decimal(value).scaleb(-scale)
+
+
+def from_float(value: float) -> Decimal:
+    """Return the shortest decimal that round-trips to ``value`` (``2.0`` -> ``Decimal("2")``)."""
+    text = repr(value)
+    return Decimal(text[:-2] if text.endswith(".0") else text)
@@ -0,0 +1,125 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later OR LicenseRef-Inventzia-Commercial
+# Copyright (c) 2013-2026 Magrino Bini, Paola Apruzzese, Inventzia Science and Technology Ltd.
+#
+# This file is part of pulse-data.
+#
+# pulse-data is dual-licensed:
+#   - Under the GNU Affero General Public License v3.0 or later (see LICENSE-AGPL-3.0).
+#   - Under a commercial license (see LICENSE-COMMERCIAL.txt).
+#     Contact operations@inventzia.com.
+"""
+Vectorised indicator backfill over columnar :class:`CdfBar` data.
+
+The batch counterpart of :class:`~inventzia.pulse.data.stream.indicators.IndicatorEngine`
+— the same indicator objects, the same kernels — for a whole
+:class:`~inventzia.pulse.data.columnar.batch.ColumnBatch` at once. Rows are
+sorted by symbol and time, then the kernels advance every symbol's state one bar
+at a time as NumPy arrays (element *k* is symbol *k*): the Python loop runs once
+per bar *position*, not once per bar, so a backfill over many symbols costs
+about as many NumPy calls as the longest symbol has bars::
+
+    matrices = indicators_batch(batch, [Ema(20), Macd()])
+    matrices["ES.macd"].column("histogram")            # float64, one row per output
+    matrices["ES.macd"].to_vector_values()             # == what the engine emits
+
+Each operation is the one the stream performs on a Python float, in the same
+order, so the values are bit-identical to feeding the same bars to an
+:class:`IndicatorEngine` in time order (equal times in batch order). A scaled
+batch is read as ``value / 10**scale``, which is exactly ``float(Decimal)``.
+"""
+
+from collections.abc import Sequence
+
+import numpy as np
+
+from inventzia.pulse.data.columnar.batch import INT_NULL, ColumnBatch
+from inventzia.pulse.data.columnar.vector_matrix import VectorMatrix
+from inventzia.pulse.data.schemas.marketdata.cdf_bar import CdfBar
+from inventzia.pulse.data.stream.indicators import Indicator
+
+
+def _inputs(batch: ColumnBatch, fields: set[str]) -> dict[str, np.ndarray]:
+    """Each field as the float64 column an indicator reads (see ``bar_input``)."""
+    layout = batch.layout
+    wire = dict(zip(layout.attrs, layout.names))
+    kinds = dict(zip(layout.attrs, layout.kinds))
+    inputs = {}
+    for field in fields:
+        column, kind = batch[wire[field]], kinds[field]
+        if kind == "date":
+            days = column.view(np.int64)
+            inputs[field] = np.where(days == INT_NULL, np.nan, days.astype(np.float64))
+        elif kind == "decimal" and batch.scale is not None:
+            inputs[field] = np.where(column == INT_NULL, np.nan, column / 10.0 ** batch.scale)
+        elif kind in ("int", "datetime"):
+            raw = column.view(np.int64)
+            inputs[field] = np.where(raw == INT_NULL, np.nan, raw.astype(np.float64))
+        else:
+            inputs[field] = column.astype(np.float64)
+    return inputs
+
+
+def indicators_batch(batch: ColumnBatch,
+                     indicators: Sequence[Indicator]) -> dict[str, VectorMatrix]:
+    """Run ``indicators`` over a multi-symbol ``CdfBar`` batch, one matrix per output key.
+
+    Keys are ``"<symb>.<indicator name>"``, as the engine emits; each matrix holds
+    that series' outputs in time order (``float64``). The input need not be sorted.
+    """
+    if batch.model_class is not CdfBar:
+        raise TypeError(f"indicators_batch needs a CdfBar batch, got {batch.model_class.__name__}")
+    names = [indicator.name for indicator in indicators]
+    if len(set(names)) != len(names):
+        raise ValueError(f"indicator names must be unique, got {names}")
+    if not len(batch):
+        return {}
+
+    symbols, symbol = np.unique(batch["symb"], return_inverse=True)
+    order = np.lexsort((batch["timestamp"], symbol))
+    symbol = symbol[order]
+    times = batch["timestamp"][order]
+    inputs = {name: column[order] for name, column in
+              _inputs(batch, {f for ind in indicators for f in ind.fields}).items()}
+
+    # Rows grouped by position within their symbol: step t holds the t-th bar of
+    # every symbol that has one, in symbol order.
+    first = np.searchsorted(symbol, np.arange(len(symbols)))
+    position = np.arange(len(order)) - first[symbol]
+    by_position = np.argsort(position, kind="stable")
+    steps = np.split(by_position, np.cumsum(np.bincount(position))[:-1])
+
+    matrices: dict[str, VectorMatrix] = {}
+    for indicator in indicators:
+        x_all = [inputs[field] for field in indicator.fields]
+        out = np.full((len(order), len(indicator.value_ids)), np.nan)
+        state = None
+        for t, rows in enumerate(steps):
+            n = t + 1
+            keys = symbol[rows]
+            x = tuple(column[rows] for column in x_all)
+            old = None
+            if indicator.window and n > indicator.window:
+                old = tuple(column[rows - indicator.window] for column in x_all)
+            current = None if state is None else tuple(s[keys] for s in state)
+            new = indicator.step(current, x, old, n, np.where)
+            if state is None:       # step 0 has every symbol, in order
+                state = tuple(np.array(s, dtype=np.float64) for s in new)
+            else:
+                for s, value in zip(state, new):
+                    s[keys] = value
+            if n >= indicator.warmup:
+                values = indicator.value(tuple(s[keys] for s in state), n, np.where)
+                out[rows] = np.column_stack(np.broadcast_arrays(*values))
+
+        emitted = ~np.isnan(out).any(axis=1)
+        bounds = np.append(first, len(order))
+        for k, symb in enumerate(symbols.tolist()):
+            rows = slice(bounds[k], bounds[k + 1])
+            mask = emitted[rows]
+            if not mask.any():
+                continue
+            matrix = VectorMatrix(f"{symb}.{indicator.name}", indicator.value_ids,
+                                  capacity=int(mask.sum()))
+            matrix.extend_rows(times[rows][mask], out[rows][mask])
+            matrices[matrix.key] = matrix
+    return matrices
@@ -0,0 +1,146 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later OR LicenseRef-Inventzia-Commercial
+# Copyright (c) 2013-2026 Magrino Bini, Paola Apruzzese, Inventzia Science and Technology Ltd.
+#
+# This file is part of pulse-data.
+#
+# pulse-data is dual-licensed:
+#   - Under the GNU Affero General Public License v3.0 or later (see LICENSE-AGPL-3.0).
+#   - Under a commercial license (see LICENSE-COMMERCIAL.txt).
+#     Contact operations@inventzia.com.
+"""
+Decode JSON messages of one type straight into a :class:`ColumnBatch`.
+
+Filling a batch with :meth:`ColumnBatch.extend` needs a model instance per
+message. These functions skip the instances: a chunk of messages is parsed in
+one pass, its values are gathered per field, and each column is validated and
+converted as a whole before being appended to the batch's growable buffers::
+
+    batch = ColumnBatch(CdfBar, scale=8)
+    for chunk in chunks(feed, 4096):                 # lists of tagged-JSON strings
+        extend_from_tagged_json(batch, chunk)
+
+Each column is validated with the model's own field type (the same Pydantic
+rules, run over the whole column at once), so the batch holds exactly what
+decoding to models would have produced. A model with model-level validators
+(``x-parallel-to``) cannot be checked column by column; for such a type rows are
+validated through the model, and only the per-field copy is saved. An invalid
+value raises ``ValueError`` naming its row and field, and nothing of the chunk
+is appended.
+"""
+
+import json
+from collections.abc import Sequence
+
+import numpy as np
+from pydantic import TypeAdapter, ValidationError
+
+from inventzia.pulse.data.columnar.batch import ColumnBatch, ColumnLayout
+
+_FIELD_TYPE_ID = "typeId"
+_FIELD_PAYLOAD = "payload"
+
+_ADAPTERS: dict[type, list[TypeAdapter]] = {}
+
+
+def _adapters(model_class: type) -> list[TypeAdapter]:
+    """One list validator per field, in layout order (built once per class)."""
+    adapters = _ADAPTERS.get(model_class)
+    if adapters is None:
+        adapters = _ADAPTERS[model_class] = [TypeAdapter(list[field.annotation])
+                                             for field in model_class.model_fields.values()]
+    return adapters
+
+
+def _parse(messages: Sequence[str | bytes]) -> list:
+    # One parse for the chunk: the messages joined into a JSON array.
+    if all(isinstance(m, str) for m in messages):
+        values = json.loads("[" + ",".join(messages) + "]")
+    else:
+        values = json.loads(b"[" + b",".join(m.encode() if isinstance(m, str) else m
+                                             for m in messages) + b"]")
+    if len(values) != len(messages):
+        raise ValueError(f"{len(messages)} messages held {len(values)} JSON values")
+    return values
+
+
+def _fast_column(kind: str, raw: list, scale: int | None) -> np.ndarray | None:
+    """NumPy's own parsers, for the common wire forms only (else ``None``).
+
+    Covers UTC date-times as written by ``to_json`` (``...T...Z``), ISO dates and,
+    without a scale, decimals read as ``float64``. Anything else — nulls, other
+    spellings, invalid values — takes the validating path, which also produces
+    the error message.
+    """
+    try:
+        if kind == "datetime":
+            if all(type(s) is str and s[-1:] == "Z" and s[10:11] == "T" for s in raw):
+                return np.array([s[:-1] for s in raw], dtype="datetime64[us]")
+        elif kind == "date":
+            if all(type(s) is str and len(s) == 10 for s in raw):
+                return np.array(raw, dtype="datetime64[D]")
+        elif kind == "decimal" and scale is None:
+            if all(type(v) in (str, int, float) for v in raw):
+                column = np.array(raw, dtype=np.float64)
+                if np.isfinite(column).all():
+                    return column
+    except ValueError:
+        pass
+    return None
+
+
+def _columns(layout: ColumnLayout, payloads: list[dict]) -> dict[str, np.ndarray]:
+    model_class = layout.model_class
+    if model_class.__pydantic_decorators__.model_validators:
+        validate = model_class.model_validate
+        rows = [validate(payload).__dict__ for payload in payloads]
+        return {name: layout.to_column(kind, [row[attr] for row in rows])
+                for name, attr, kind in zip(layout.names, layout.attrs, layout.kinds)}
+    columns = {}
+    for name, kind, adapter in zip(layout.names, layout.kinds, _adapters(model_class)):
+        raw = [payload.get(name) for payload in payloads]
+        column = _fast_column(kind, raw, layout.scale)
+        if column is not None:
+            columns[name] = column
+            continue
+        try:
+            values = adapter.validate_python(raw)
+        except ValidationError as e:
+            error = e.errors(include_url=False)[0]
+            raise ValueError(f"row {error['loc'][0]}, field {name!r}: {error['msg']}") from None
+        columns[name] = layout.to_column(kind, values)
+    return columns
+
+
+def extend_from_json(batch: ColumnBatch, messages: Sequence[str | bytes]) -> None:
+    """Append plain JSON payloads (``to_json`` output) of the batch's model class."""
+    if not messages:
+        return
+    payloads = _parse(messages)
+    if not all(isinstance(p, dict) for p in payloads):
+        raise ValueError("every message must be a JSON object")
+    batch.extend_columns(_columns(batch.layout, payloads))
+
+
+def extend_from_tagged_json(batch: ColumnBatch, messages: Sequence[str | bytes]) -> None:
+    """Append tagged envelopes, which must all carry the batch's model ``TYPE_ID``."""
+    if not messages:
+        return
+    type_id = batch.model_class.TYPE_ID
+    envelopes = _parse(messages)
+    payloads = []
+    for i, envelope in enumerate(envelopes):
+        if not isinstance(envelope, dict) or envelope.get(_FIELD_TYPE_ID) != type_id:
+            found = envelope.get(_FIELD_TYPE_ID) if isinstance(envelope, dict) else envelope
+            raise ValueError(f"row {i}: expected a {type_id} envelope, got {found!r}")
+        payloads.append(envelope.get(_FIELD_PAYLOAD))
+    if not all(isinstance(p, dict) for p in payloads):
+        raise ValueError("every envelope needs an object payload")
+    batch.extend_columns(_columns(batch.layout, payloads))
+
+
+def from_tagged_json(messages: Sequence[str | bytes], model_class: type, *,
+                     scale: int | None = None) -> ColumnBatch:
+    """A new batch decoded from tagged envelopes of ``model_class``."""
+    batch = ColumnBatch(model_class, scale=scale, capacity=max(len(messages), 16))
+    extend_from_tagged_json(batch, messages)
+    return batch
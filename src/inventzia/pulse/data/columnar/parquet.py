@@ -0,0 +1,204 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later OR LicenseRef-Inventzia-Commercial
+# Copyright (c) 2013-2026 Magrino Bini, Paola Apruzzese, Inventzia Science and Technology Ltd.
+#
+# This file is part of pulse-data.
+#
+# pulse-data is dual-licensed:
+#   - Under the GNU Affero General Public License v3.0 or later (see LICENSE-AGPL-3.0).
+#   - Under a commercial license (see LICENSE-COMMERCIAL.txt).
+#     Contact operations@inventzia.com.
+"""
+Hive-partitioned Parquet datasets of :class:`CdfBar` history.
+
+Bar history is laid out one directory per trading date and symbol::
+
+    <root>/date=2024-01-02/symb=AAPL/part-<uuid>-0.parquet
+
+so a query for a week of a few symbols only ever opens the files of those
+partitions — PyArrow prunes every other directory from the path alone. Inside a
+file, row groups are bounded (``rows_per_group``) and carry ``timestamp``
+min/max statistics, so a time-range filter also skips row groups that cannot
+match without decoding them.
+
+Column names are the schema's *wire* names (``symExp``, not ``sym_exp``), the
+same names :func:`~inventzia.pulse.data.datum.codec.to_json` emits, so a row
+converts to a model with ``CdfBar.model_validate`` unchanged. Decimals are stored
+as ``decimal128`` — exact, never routed through a float; a value with more
+fractional digits than :data:`DECIMAL_TYPE` holds is rejected on write rather
+than silently rounded. Values read back carry the column scale
+(``Decimal("1.5")`` returns as ``Decimal("1.500000000000000000")``), equal in value.
+
+Requires the ``[parquet]`` extra (PyArrow).
+"""
+
+import uuid
+from collections.abc import Iterable, Iterator, Sequence
+from datetime import date
+from pathlib import Path
+
+import pyarrow as pa
+import pyarrow.dataset as ds
+
+from inventzia.pulse.data.schemas.marketdata.cdf_bar import CdfBar
+
+DECIMAL_TYPE = pa.decimal128(38, 18)
+"""Storage type of every ``format: decimal`` field: 20 integer + 18 fractional digits."""
+
+CDF_BAR_SCHEMA = pa.schema([
+    pa.field("symb",      pa.string(),                  nullable=False),
+    pa.field("timestamp", pa.int64(),                   nullable=False),
+    pa.field("op",        DECIMAL_TYPE,                 nullable=False),
+    pa.field("hi",        DECIMAL_TYPE,                 nullable=False),
+    pa.field("lo",        DECIMAL_TYPE,                 nullable=False),
+    pa.field("cl",        DECIMAL_TYPE,                 nullable=False),
+    pa.field("vlm",       DECIMAL_TYPE,                 nullable=False),
+    pa.field("vwap",      DECIMAL_TYPE),
+    pa.field("datetime",  pa.timestamp("us", tz="UTC"), nullable=False),
+    pa.field("count",     pa.int64()),
+    pa.field("date",      pa.date32(),                  nullable=False),
+    pa.field("expiry",    pa.string()),
+    pa.field("strike",    DECIMAL_TYPE),
+    pa.field("symExp",    pa.string()),
+])
+"""Arrow schema of a :class:`CdfBar` row, in wire-name and YAML property order."""
+
+PARTITIONING = ds.partitioning(
+    pa.schema([pa.field("date", pa.date32()), pa.field("symb", pa.string())]),
+    flavor="hive",
+)
+"""``date=<YYYY-MM-DD>/symb=<symbol>`` directories; symbols are URI-escaped."""
+
+# Python attribute name for each wire column (only symExp differs).
+_ATTRS = {name: name for name in CDF_BAR_SCHEMA.names} | {"symExp": "sym_exp"}
+
+
+# ---------------------------------------------------------------------------
+# Write
+# ---------------------------------------------------------------------------
+
+def bars_to_record_batch(bars: Sequence[CdfBar]) -> pa.RecordBatch:
+    """Convert a sequence of bars to one :data:`CDF_BAR_SCHEMA` record batch."""
+    columns = [[getattr(bar, _ATTRS[name]) for bar in bars] for name in CDF_BAR_SCHEMA.names]
+    return pa.RecordBatch.from_arrays(
+        [pa.array(values, type=field.type) for values, field in zip(columns, CDF_BAR_SCHEMA)],
+        schema=CDF_BAR_SCHEMA,
+    )
+
+
+def _record_batches(bars: Iterable[CdfBar], batch_rows: int) -> Iterator[pa.RecordBatch]:
+    chunk: list[CdfBar] = []
+    for bar in bars:
+        chunk.append(bar)
+        if len(chunk) >= batch_rows:
+            yield bars_to_record_batch(chunk)
+            chunk = []
+    if chunk:
+        yield bars_to_record_batch(chunk)
+
+
+def write_cdf_bars(bars: Iterable[CdfBar], root: str | Path, *,
+                   rows_per_group: int = 65_536,
+                   batch_rows: int = 65_536,
+                   max_open_files: int = 512,
+                   compression: str = "zstd") -> None:
+    """Stream bars into the partitioned dataset at ``root``.
+
+    ``bars`` is consumed lazily, ``batch_rows`` at a time, so memory stays bounded
+    however long the history is. Rows are appended: every call writes new
+    uniquely-named files and never overwrites an existing partition file, so a
+    daily job can add the latest date to an existing dataset. Feeding bars in
+    time order keeps each row group's ``timestamp`` range narrow, which is what
+    makes the statistics useful for pruning.
+
+    ``rows_per_group`` caps the rows per Parquet row group (and is the target
+    size when a partition receives enough rows); ``max_open_files`` bounds the
+    number of partition files open at once.
+    """
+    file_options = ds.ParquetFileFormat().make_write_options(
+        compression=compression,
+        write_statistics=["timestamp"],
+    )
+    ds.write_dataset(
+        _record_batches(bars, batch_rows),
+        Path(root),
+        schema=CDF_BAR_SCHEMA,
+        format="parquet",
+        partitioning=PARTITIONING,
+        file_options=file_options,
+        basename_template=f"part-{uuid.uuid4().hex}-{{i}}.parquet",
+        max_partitions=max(1024, batch_rows),
+        max_open_files=max_open_files,
+        min_rows_per_group=rows_per_group,
+        max_rows_per_group=rows_per_group,
+        existing_data_behavior="overwrite_or_ignore",
+        preserve_order=True,
+    )
+
+
+# ---------------------------------------------------------------------------
+# Read
+# ---------------------------------------------------------------------------
+
+def dataset(root: str | Path) -> ds.Dataset:
+    """Open the partitioned dataset at ``root`` (no data is read)."""
+    return ds.dataset(Path(root), format="parquet", schema=CDF_BAR_SCHEMA,
+                      partitioning=PARTITIONING)
+
+
+def bar_filter(*, symbols: Iterable[str] | None = None,
+               start_date: date | None = None, end_date: date | None = None,
+               start_time: int | None = None, end_time: int | None = None) -> ds.Expression | None:
+    """Build the dataset filter for a query; ``None`` when nothing is constrained.
+
+    ``symbols`` and the inclusive ``[start_date, end_date]`` trading-date range
+    select partitions, so non-matching directories are never opened.
+    ``[start_time, end_time)`` in epoch milliseconds is checked against the
+    ``timestamp`` row-group statistics first and only then row by row.
+    """
+    terms = []
+    if symbols is not None:
+        terms.append(ds.field("symb").isin(list(symbols)))
+    if start_date is not None:
+        terms.append(ds.field("date") >= start_date)
+    if end_date is not None:
+        terms.append(ds.field("date") <= end_date)
+    if start_time is not None:
+        terms.append(ds.field("timestamp") >= start_time)
+    if end_time is not None:
+        terms.append(ds.field("timestamp") < end_time)
+    if not terms:
+        return None
+    expression = terms[0]
+    for term in terms[1:]:
+        expression = expression & term
+    return expression
+
+
+def iter_batches(root: str | Path, *, columns: Sequence[str] | None = None,
+                 batch_rows: int = 65_536, **query) -> Iterator[pa.RecordBatch]:
+    """Yield the matching rows as record batches.
+
+    ``columns`` projects the read to those wire-name columns (partition columns
+    cost nothing: they come from the path); the keyword ``query`` arguments are
+    those of :func:`bar_filter`.
+    """
+    scanner = dataset(root).scanner(columns=list(columns) if columns is not None else None,
+                                    filter=bar_filter(**query), batch_size=batch_rows)
+    yield from scanner.to_batches()
+
+
+def read_cdf_bars(root: str | Path, *, columns: Sequence[str] | None = None, **query) -> pa.Table:
+    """Read the matching rows into one table; see :func:`iter_batches`."""
+    return dataset(root).to_table(columns=list(columns) if columns is not None else None,
+                                  filter=bar_filter(**query))
+
+
+def iter_cdf_bars(root: str | Path, *, batch_rows: int = 65_536, **query) -> Iterator[CdfBar]:
+    """Yield the matching rows as validated :class:`CdfBar` datums.
+
+    Always reads every column (a model needs all its required fields); use
+    :func:`iter_batches` with ``columns`` when only a projection is needed.
+    """
+    for batch in iter_batches(root, batch_rows=batch_rows, **query):
+        for row in batch.to_pylist():
+            yield CdfBar.model_validate(row)
@@ -0,0 +1,184 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later OR LicenseRef-Inventzia-Commercial
+# Copyright (c) 2013-2026 Magrino Bini, Paola Apruzzese, Inventzia Science and Technology Ltd.
+#
+# This file is part of pulse-data.
+#
+# pulse-data is dual-licensed:
+#   - Under the GNU Affero General Public License v3.0 or later (see LICENSE-AGPL-3.0).
+#   - Under a commercial license (see LICENSE-COMMERCIAL.txt).
+#     Contact operations@inventzia.com.
+"""
+Columnar recent history per ``datum_key``, with zero-copy time windows.
+
+The columnar counterpart of :class:`~inventzia.pulse.data.stream.series.TimeSeriesIndex`:
+a :class:`ColumnSeriesIndex` keeps one growable
+:class:`~inventzia.pulse.data.columnar.batch.ColumnBatch` per key, in time
+order, so a window is a ``np.searchsorted`` on the time column and the result is
+a view of the key's buffers rather than a copy::
+
+    history = ColumnSeriesIndex(CdfBar, max_count=10_000)
+    history.extend_batch(batch)                     # any mix of symbols
+    window = history.range("ES", t0, t1)            # ColumnBatch view, O(log n)
+    window["cl"].mean()
+
+The key and time columns are the model's ``DATUM_KEY_FIELD`` and
+``DATUM_TIME_FIELD``. Retention and ordering are as for the stream index: the
+newest ``max_count`` rows and/or those within ``max_age_ms`` of the key's newest
+are kept, storage is compacted in amortised O(1), and a row older than its key's
+newest is dropped and counted in :attr:`ColumnSeriesIndex.late`. A returned
+window, like any batch view, stops seeing the key's rows once they are
+compacted or the buffers grow — copy it (``.take``) to keep it.
+"""
+
+from collections.abc import Sequence
+
+import numpy as np
+
+from inventzia.pulse.data.columnar.batch import ColumnBatch
+
+_COMPACT_MIN = 256          # dropped rows tolerated before a compaction is considered
+
+
+class _Series:
+    """One key's rows; rows before ``head`` are expired."""
+
+    __slots__ = ("batch", "head")
+
+    def __init__(self, batch: ColumnBatch):
+        self.batch = batch
+        self.head = 0
+
+    def __len__(self) -> int:
+        return len(self.batch) - self.head
+
+
+class ColumnSeriesIndex:
+    """Per-key, time-sorted column batches with searchsorted windows (see the module docstring)."""
+
+    def __init__(self, model_class: type, *, scale: int | None = None,
+                 max_count: int | None = None, max_age_ms: int | None = None):
+        if max_count is not None and max_count <= 0:
+            raise ValueError(f"max_count must be positive, got {max_count}")
+        if max_age_ms is not None and max_age_ms < 0:
+            raise ValueError(f"max_age_ms must be non-negative, got {max_age_ms}")
+        self.model_class = model_class
+        self.scale = scale
+        self.max_count = max_count
+        self.max_age_ms = max_age_ms
+        self.late = 0
+        layout = ColumnBatch(model_class, scale=scale, capacity=0).layout
+        wire = dict(zip(layout.attrs, layout.names))
+        kinds = dict(zip(layout.attrs, layout.kinds))
+        if kinds[model_class.DATUM_TIME_FIELD] != "int":
+            raise TypeError(f"{model_class.__name__}.{model_class.DATUM_TIME_FIELD} "
+                            f"is not an int millisecond time")
+        self.key_column = wire[model_class.DATUM_KEY_FIELD]
+        self.time_column = wire[model_class.DATUM_TIME_FIELD]
+        self._series: dict[str, _Series] = {}
+
+    def __len__(self) -> int:
+        """Number of keys."""
+        return len(self._series)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._series
+
+    def keys(self) -> list[str]:
+        return list(self._series)
+
+    def count(self, key: str) -> int:
+        """Rows retained for ``key``."""
+        series = self._series.get(key)
+        return 0 if series is None else len(series)
+
+    # -- Ingest ---------------------------------------------------------------
+
+    def append(self, datum) -> bool:
+        """Add one datum as a row of its key; False (and counted late) if out of order."""
+        series = self._series_for(datum.datum_key)
+        if len(series) and datum.datum_time < series.batch[self.time_column][-1]:
+            self.late += 1
+            return False
+        series.batch.extend([datum])
+        self._expire(series)
+        return True
+
+    def extend(self, datums: Sequence) -> None:
+        """Add datums of this index's model class (any mix of keys)."""
+        if datums:
+            self.extend_batch(ColumnBatch.from_datums(datums, self.model_class, scale=self.scale))
+
+    def extend_batch(self, batch: ColumnBatch) -> None:
+        """Add a batch's rows (any mix of keys), split by key column-wise."""
+        if batch.model_class is not self.model_class or batch.scale != self.scale:
+            raise TypeError(f"expected a {self.model_class.__name__} batch with scale "
+                            f"{self.scale}, got {batch.model_class.__name__} / {batch.scale}")
+        if not len(batch):
+            return
+        keys, key_index = np.unique(batch[self.key_column], return_inverse=True)
+        order = np.argsort(key_index, kind="stable")          # arrival order within a key
+        bounds = np.searchsorted(key_index[order], np.arange(len(keys) + 1))
+        all_times = batch[self.time_column]
+        for k, key in enumerate(keys.tolist()):
+            rows = order[bounds[k]:bounds[k + 1]]
+            series = self._series_for(key)
+            times = all_times[rows]
+            # A row is late if older than any row before it (the key's stored
+            # rows included); dropping those leaves the running maximum unchanged.
+            newest = series.batch[self.time_column][-1] if len(series) else np.iinfo(np.int64).min
+            before = np.maximum.accumulate(np.concatenate(([newest], times)))[:-1]
+            keep = times >= before
+            if not keep.all():
+                self.late += int((~keep).sum())
+                rows = rows[keep]
+            series.batch.extend_columns({name: column[rows]
+                                         for name, column in batch.columns().items()})
+            self._expire(series)
+
+    def _series_for(self, key: str) -> _Series:
+        series = self._series.get(key)
+        if series is None:
+            series = self._series[key] = _Series(
+                ColumnBatch(self.model_class, scale=self.scale, capacity=16))
+        return series
+
+    def _expire(self, series: _Series) -> None:
+        batch, head = series.batch, series.head
+        n = len(batch)
+        if self.max_count is not None and n - head > self.max_count:
+            head = n - self.max_count
+        if self.max_age_ms is not None and n:
+            times = batch[self.time_column]
+            head += int(np.searchsorted(times[head:], times[-1] - self.max_age_ms, "left"))
+        if head >= _COMPACT_MIN and 2 * head >= n:
+            live = batch.slice(head)            # copy the live rows into fresh buffers
+            series.batch = ColumnBatch(self.model_class, scale=self.scale, capacity=2 * len(live))
+            series.batch.extend_columns(live.columns())
+            head = 0
+        series.head = head
+
+    # -- Queries --------------------------------------------------------------
+
+    def batch(self, key: str) -> ColumnBatch | None:
+        """``key``'s retained rows as a batch view, or None for an unknown key."""
+        series = self._series.get(key)
+        return None if series is None else series.batch.slice(series.head)
+
+    def range(self, key: str, start: int | None = None, stop: int | None = None) -> ColumnBatch | None:
+        """``key``'s rows with ``start <= datum_time < stop`` (either bound open if None), as a view."""
+        series = self._series.get(key)
+        if series is None:
+            return None
+        times = series.batch[self.time_column][series.head:]
+        lo = 0 if start is None else int(np.searchsorted(times, start, "left"))
+        hi = len(times) if stop is None else int(np.searchsorted(times, stop, "left"))
+        return series.batch.slice(series.head + lo, series.head + max(lo, hi))
+
+    def asof(self, key: str, time: int):
+        """``key``'s latest row with ``datum_time <= time`` as a datum, or None."""
+        series = self._series.get(key)
+        if series is None:
+            return None
+        i = series.head + int(np.searchsorted(series.batch[self.time_column][series.head:],
+                                              time, "right"))
+        return series.batch.to_datums(i - 1, i)[0] if i > series.head else None
@@ -0,0 +1,207 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later OR LicenseRef-Inventzia-Commercial
+# Copyright (c) 2013-2026 Magrino Bini, Paola Apruzzese, Inventzia Science and Technology Ltd.
+#
+# This file is part of pulse-data.
+#
+# pulse-data is dual-licensed:
+#   - Under the GNU Affero General Public License v3.0 or later (see LICENSE-AGPL-3.0).
+#   - Under a commercial license (see LICENSE-COMMERCIAL.txt).
+#     Contact operations@inventzia.com.
+"""
+A ``time × M`` matrix view over a stream of :class:`VectorValue`.
+
+An indicator emits one ``VectorValue`` per timestamp (MACD: three components
+labelled ``macd`` / ``signal`` / ``histogram``). :class:`VectorMatrix` stacks the
+stream for one ``key`` into a growable 2-D array, one row per observation, so a
+model can work on whole columns instead of tuples of ``Decimal``::
+
+    m = VectorMatrix("SPX.MACD")
+    m.extend(stream)
+    hist = m.column("histogram")      # float64 view, no copy
+    m.times                           # int64 epoch-millisecond view
+
+The label tuple is fixed by the first row (or the constructor); later rows only
+have to carry the *same* tuple — checked by identity first, so a stream that
+reuses one label tuple per key pays a pointer comparison per row. Storage is
+column-major, so every column view is contiguous.
+"""
+
+from collections.abc import Iterable
+
+import numpy as np
+
+from inventzia.pulse.data.columnar.buffers import reserve
+from inventzia.pulse.data.columnar.decimals import from_float, from_scaled, to_scaled
+from inventzia.pulse.data.schemas.common.vector_value import VectorValue
+
+
+class VectorMatrix:
+    """Growable ``time × M`` matrix of the :class:`VectorValue` stream of one key.
+
+    ``scale=None`` stores ``float64``; an integer ``scale`` stores exact scaled
+    ``int64`` (``value * 10**scale``, see
+    :mod:`~inventzia.pulse.data.columnar.decimals`). ``value_ids`` fixes the
+    labels up front; otherwise the first ingested row fixes them (``None`` —
+    positional — is a valid label set too).
+    """
+
+    def __init__(self, key: str, value_ids: tuple[str, ...] | None = None, *,
+                 width: int | None = None, scale: int | None = None, capacity: int = 1024):
+        if value_ids is not None:
+            value_ids = tuple(value_ids)
+            if width is not None and width != len(value_ids):
+                raise ValueError(f"width {width} does not match {len(value_ids)} value_ids")
+            width = len(value_ids)
+        self.key = key
+        self.scale = scale
+        self._value_ids = value_ids
+        self._width = width
+        self._fixed = width is not None
+        self._rows = 0
+        self._capacity = capacity
+        self._times = np.empty(capacity, dtype=np.int64)
+        self._values = self._allocate(width) if self._fixed else None
+        self._index = {label: j for j, label in enumerate(value_ids or ())}
+
+    @classmethod
+    def from_vector_values(cls, values: Iterable[VectorValue], key: str | None = None, *,
+                           scale: int | None = None) -> "VectorMatrix":
+        """Build a matrix from a batch; ``key`` defaults to the first row's key."""
+        values = list(values)
+        if key is None:
+            if not values:
+                raise ValueError("key is required for an empty batch")
+            key = values[0].key
+        matrix = cls(key, scale=scale, capacity=max(len(values), 16))
+        matrix.extend(values)
+        return matrix
+
+    # -- Shape ----------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return self._rows
+
+    @property
+    def width(self) -> int | None:
+        """M, the number of components; ``None`` until the first row is ingested."""
+        return self._width
+
+    @property
+    def value_ids(self) -> tuple[str, ...] | None:
+        """The label tuple shared by every row (``None`` when positional)."""
+        return self._value_ids
+
+    @property
+    def dtype(self) -> np.dtype:
+        return np.dtype(np.float64 if self.scale is None else np.int64)
+
+    # -- Ingest ---------------------------------------------------------------
+
+    def append(self, value: VectorValue) -> None:
+        """Append one observation as the next row."""
+        self._accept(value)
+        self._reserve(self._rows + 1)
+        self._times[self._rows] = value.time
+        self._values[self._rows] = self._convert(value.values)
+        self._rows += 1
+
+    def extend(self, values: Iterable[VectorValue]) -> None:
+        """Append a batch of observations, converting them in one block."""
+        values = values if isinstance(values, list) else list(values)
+        if not values:
+            return
+        for value in values:
+            self._accept(value)
+        start, stop = self._rows, self._rows + len(values)
+        self._reserve(stop)
+        self._times[start:stop] = [value.time for value in values]
+        self._values[start:stop] = [self._convert(value.values) for value in values]
+        self._rows = stop
+
+    def extend_rows(self, times: np.ndarray, rows: np.ndarray) -> None:
+        """Append rows given as arrays: ``times`` (N,) and ``rows`` (N × M) in this matrix's dtype."""
+        if not self._fixed:
+            raise ValueError(f"matrix {self.key!r} needs value_ids or width before array rows")
+        if rows.shape != (len(times), self._width):
+            raise ValueError(f"rows of shape {rows.shape} do not fit {len(times)} times "
+                             f"x width {self._width}")
+        start, stop = self._rows, self._rows + len(times)
+        self._reserve(stop)
+        self._times[start:stop] = times
+        self._values[start:stop] = rows
+        self._rows = stop
+
+    def _accept(self, value: VectorValue) -> None:
+        if value.key != self.key:
+            raise ValueError(f"VectorValue key {value.key!r} does not belong to matrix {self.key!r}")
+        if not self._fixed:
+            self._value_ids = value.value_ids
+            self._width = len(value.values)
+            self._index = {label: j for j, label in enumerate(self._value_ids or ())}
+            self._values = self._allocate(self._width)
+            self._fixed = True
+            return
+        ids = value.value_ids
+        if ids is not self._value_ids and ids != self._value_ids:
+            raise ValueError(f"value_ids {ids!r} differ from {self._value_ids!r} for key {self.key!r}")
+        if len(value.values) != self._width:
+            raise ValueError(f"{len(value.values)} values differ from width {self._width} for key {self.key!r}")
+
+    def _convert(self, values):
+        if self.scale is None:
+            return [float(v) for v in values]
+        return [to_scaled(v, self.scale) for v in values]
+
+    def _allocate(self, width: int) -> np.ndarray:
+        return np.empty((self._capacity, width), dtype=self.dtype, order="F")
+
+    def _reserve(self, needed: int) -> None:
+        self._times = reserve(self._times, self._rows, needed)
+        self._values = reserve(self._values, self._rows, needed)
+        self._capacity = self._times.shape[0]
+
+    # -- Views (no copy; invalidated by a growing append) ---------------------
+
+    @property
+    def times(self) -> np.ndarray:
+        """``int64`` epoch-millisecond time of each row."""
+        return self._times[:self._rows]
+
+    @property
+    def matrix(self) -> np.ndarray:
+        """The ``rows × M`` value matrix."""
+        if self._values is None:
+            return np.empty((0, 0), dtype=self.dtype)
+        return self._values[:self._rows]
+
+    def column(self, label: str | int) -> np.ndarray:
+        """One component over time, by label or by position."""
+        j = label if isinstance(label, int) else self._column_index(label)
+        return self.matrix[:, j]
+
+    def _column_index(self, label: str) -> int:
+        try:
+            return self._index[label]
+        except KeyError:
+            raise KeyError(f"No value_id {label!r} in {self._value_ids!r}") from None
+
+    # -- Back to datums -------------------------------------------------------
+
+    def to_vector_values(self, start: int = 0, stop: int | None = None) -> list[VectorValue]:
+        """Rebuild rows ``[start, stop)`` as :class:`VectorValue` datums.
+
+        Rows were validated on the way in, so models are constructed without
+        revalidation, and every one shares the matrix's single label tuple.
+        """
+        times = self.times[start:stop].tolist()
+        rows = self.matrix[start:stop].tolist()
+        if self.scale is None:
+            convert = from_float
+        else:
+            scale = self.scale
+            convert = lambda v: from_scaled(v, scale)  # noqa: E731
+        key, ids = self.key, self._value_ids
+        return [
+            VectorValue.model_construct(key=key, time=t, values=tuple(map(convert, row)), value_ids=ids)
+            for t, row in zip(times, rows)
+        ]
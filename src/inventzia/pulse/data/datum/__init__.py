@@ -19,6 +19,17 @@ from inventzia.pulse.data.datum.codec import (
     to_json,
     to_tagged_json,
 )
+from inventzia.pulse.data.datum.batch import (
+    BatchResult,
+    DecodeFailure,
+    decode_tagged_batch,
+    ndjson_quarantine,
+)
+from inventzia.pulse.data.datum.cache import CacheInfo, DecodeCache
+from inventzia.pulse.data.datum.labels import LabelDecoder, LabelEncoder
+from inventzia.pulse.data.datum.lazy import LazyDatum, lazy_from_json, lazy_from_tagged_json
+from inventzia.pulse.data.datum.pickling import DatumBlock
+from inventzia.pulse.data.datum.session import TypeTable, schema_fingerprint
 
 __all__ = [
     "Datum",
@@ -26,4 +37,18 @@ __all__ = [
     "from_json",
     "to_tagged_json",
     "from_tagged_json",
+    "TypeTable",
+    "schema_fingerprint",
+    "DecodeCache",
+    "CacheInfo",
+    "decode_tagged_batch",
+    "ndjson_quarantine",
+    "BatchResult",
+    "DecodeFailure",
+    "LabelEncoder",
+    "LabelDecoder",
+    "DatumBlock",
+    "LazyDatum",
+    "lazy_from_json",
+    "lazy_from_tagged_json",
 ]
@@ -0,0 +1,144 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later OR LicenseRef-Inventzia-Commercial
+# Copyright (c) 2013-2026 Magrino Bini, Paola Apruzzese, Inventzia Science and Technology Ltd.
+#
+# This file is part of pulse-data.
+#
+# pulse-data is dual-licensed:
+#   - Under the GNU Affero General Public License v3.0 or later (see LICENSE-AGPL-3.0).
+#   - Under a commercial license (see LICENSE-COMMERCIAL.txt).
+#     Contact operations@inventzia.com.
+"""
+Error-collecting batch decode of tagged envelopes.
+
+:func:`decode_tagged_batch` decodes many tagged-JSON messages at once and never
+raises for a bad one: it returns the datums that decoded plus a
+:class:`DecodeFailure` (index, raw message, ``typeId``, error summary) for each
+that did not, and hands every failure to an optional quarantine sink::
+
+    with open("quarantine.ndjson", "a") as q:
+        result = decode_tagged_batch(lines, quarantine=ndjson_quarantine(q))
+    for datum in result.datums:
+        ...
+
+A clean batch is decoded in a single pass of the Pydantic core: the messages
+are joined into one JSON array and validated as a list of envelopes
+discriminated on ``typeId``, which is faster than decoding message by message.
+When that pass reports errors, the batch is parsed message by message instead,
+so every failure is pinned to its own message, and the valid ones are validated
+again without the failures.
+"""
+
+import json
+from collections.abc import Callable, Sequence
+from functools import cache
+from typing import Annotated, Literal, NamedTuple, TextIO, Union
+
+from pydantic import Field, TypeAdapter, ValidationError, create_model
+
+from inventzia.pulse.data.schemas.registry import REGISTRY
+
+_FIELD_TYPE_ID = "typeId"
+_FIELD_PAYLOAD = "payload"
+_MAX_ERRORS = 3                 # validation errors kept in one failure's summary
+
+
+class DecodeFailure(NamedTuple):
+    """One message that did not decode."""
+
+    index: int
+    """Position of the message in the batch"""
+    raw: str | bytes
+    """The message as given"""
+    type_id: str | None
+    """Its ``typeId``, if it had a textual one"""
+    error: str
+    """Short summary of what was wrong"""
+
+
+class BatchResult(NamedTuple):
+    """The outcome of :func:`decode_tagged_batch`."""
+
+    datums: list
+    """Decoded datums, in batch order (failures left out)"""
+    failures: list[DecodeFailure]
+    """The messages that did not decode, in batch order"""
+
+
+@cache
+def _envelopes() -> TypeAdapter:
+    # One envelope model per registered type, discriminated on the typeId literal.
+    models = [create_model(f"{model_class.__name__}Envelope",
+                           **{_FIELD_TYPE_ID: (Literal[type_id], ...),
+                              _FIELD_PAYLOAD: (model_class, ...)})
+              for type_id, model_class in REGISTRY.items()]
+    envelope = Annotated[Union[tuple(models)], Field(discriminator=_FIELD_TYPE_ID)]
+    return TypeAdapter(list[envelope])
+
+
+def _summary(errors: list[dict]) -> str:
+    parts = []
+    for error in errors[:_MAX_ERRORS]:
+        loc = ".".join(str(p) for p in error["loc"][2:] if p != _FIELD_PAYLOAD)
+        parts.append(f"{loc}: {error['msg']}" if loc else error["msg"])
+    if len(errors) > _MAX_ERRORS:
+        parts.append(f"(+{len(errors) - _MAX_ERRORS} more)")
+    return "; ".join(parts)
+
+
+def _joined(messages: Sequence[str | bytes]) -> str | bytes:
+    if all(isinstance(m, str) for m in messages):
+        return "[" + ",".join(messages) + "]"
+    return b"[" + b",".join(m.encode("utf-8") if isinstance(m, str) else m for m in messages) + b"]"
+
+
+def decode_tagged_batch(messages: Sequence[str | bytes], *,
+                        quarantine: Callable[[DecodeFailure], None] | None = None) -> BatchResult:
+    """Decode tagged-JSON messages, collecting failures instead of raising.
+
+    Each failure is also passed to ``quarantine`` (if given), in batch order.
+    """
+    if not messages:
+        return BatchResult([], [])
+    adapter = _envelopes()
+    try:
+        envelopes = adapter.validate_json(_joined(messages))
+        if len(envelopes) == len(messages):
+            return BatchResult([envelope.payload for envelope in envelopes], [])
+    except ValidationError:
+        pass    # a message is malformed or one "message" held several values: go one by one
+
+    failures: list[DecodeFailure] = []
+    parsed, positions = [], []
+    for index, message in enumerate(messages):
+        try:
+            parsed.append(json.loads(message))
+            positions.append(index)
+        except ValueError as e:
+            failures.append(DecodeFailure(index, message, None, f"invalid JSON: {e}"))
+    try:
+        envelopes = adapter.validate_python(parsed)
+    except ValidationError as e:
+        errors_at: dict[int, list[dict]] = {}
+        for error in e.errors(include_url=False):
+            errors_at.setdefault(error["loc"][0], []).append(error)
+        for i, errors in errors_at.items():
+            envelope = parsed[i]
+            type_id = envelope.get(_FIELD_TYPE_ID) if isinstance(envelope, dict) else None
+            failures.append(DecodeFailure(positions[i], messages[positions[i]],
+                                          type_id if isinstance(type_id, str) else None,
+                                          _summary(errors)))
+        envelopes = adapter.validate_python([p for i, p in enumerate(parsed) if i not in errors_at])
+    failures.sort(key=lambda failure: failure.index)
+    if quarantine is not None:
+        for failure in failures:
+            quarantine(failure)
+    return BatchResult([envelope.payload for envelope in envelopes], failures)
+
+
+def ndjson_quarantine(out: TextIO) -> Callable[[DecodeFailure], None]:
+    """A quarantine sink writing each failure to ``out`` as one JSON line."""
+    def write(failure: DecodeFailure) -> None:
+        raw = failure.raw.decode("utf-8", "replace") if isinstance(failure.raw, bytes) else failure.raw
+        out.write(json.dumps({"index": failure.index, _FIELD_TYPE_ID: failure.type_id,
+                              "error": failure.error, "raw": raw}) + "\n")
+    return write
@@ -0,0 +1,115 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later OR LicenseRef-Inventzia-Commercial
+# Copyright (c) 2013-2026 Magrino Bini, Paola Apruzzese, Inventzia Science and Technology Ltd.
+#
+# This file is part of pulse-data.
+#
+# pulse-data is dual-licensed:
+#   - Under the GNU Affero General Public License v3.0 or later (see LICENSE-AGPL-3.0).
+#   - Under a commercial license (see LICENSE-COMMERCIAL.txt).
+#     Contact operations@inventzia.com.
+"""
+Opt-in cache of decoded datums for messages that repeat byte for byte.
+
+Heartbeats fanned out to many consumers, retransmits and snapshot replays decode
+the same text again and again. The generated models are frozen, so one decoded
+instance can be handed to every caller; a :class:`DecodeCache` in front of the
+codec turns a repeated decode into a dictionary lookup::
+
+    cache = DecodeCache(max_entries=10_000, max_bytes=8 << 20)
+    datum = cache.from_tagged_json(message)     # same result as codec.from_tagged_json
+    cache.cache_info()                          # CacheInfo(hits=..., misses=..., ...)
+
+Entries are keyed by the raw message (``str`` and ``bytes`` hash their contents
+once and cache the hash, so the key costs no more than the lookup) and evicted
+least-recently-used when either limit is exceeded; ``max_bytes`` counts the
+messages' UTF-8 lengths in bytes, whether they arrive as ``str`` or ``bytes``.
+A message longer than ``max_bytes`` is decoded but not cached.
+Errors are not cached: an invalid message raises on every attempt.
+"""
+
+from collections import OrderedDict
+from typing import NamedTuple, TypeVar
+
+from inventzia.pulse.data.datum.codec import from_json, from_tagged_json
+
+T = TypeVar("T")
+
+
+def _size(json_str: str | bytes) -> int:
+    """The message's length in bytes, as UTF-8."""
+    if isinstance(json_str, str) and not json_str.isascii():
+        return len(json_str.encode("utf-8"))
+    return len(json_str)
+
+
+class CacheInfo(NamedTuple):
+    """Counters of a :class:`DecodeCache`, in the manner of ``functools.lru_cache``."""
+
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    bytes: int
+
+
+class DecodeCache:
+    """A bounded LRU of decoded datums keyed by their raw message (see the module docstring)."""
+
+    def __init__(self, max_entries: int = 4096, max_bytes: int | None = None):
+        if max_entries <= 0:
+            raise ValueError(f"max_entries must be positive, got {max_entries}")
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict = OrderedDict()
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def from_json(self, json_str: str | bytes, model_class: type[T]) -> T:
+        """Cached :func:`~inventzia.pulse.data.datum.codec.from_json`."""
+        key = (model_class, json_str)
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[0]
+        datum = from_json(json_str, model_class)
+        self._store(key, _size(json_str), datum)
+        return datum
+
+    def from_tagged_json(self, json_str: str | bytes):
+        """Cached :func:`~inventzia.pulse.data.datum.codec.from_tagged_json`."""
+        entry = self._entries.get(json_str)
+        if entry is not None:
+            self._entries.move_to_end(json_str)
+            self._hits += 1
+            return entry[0]
+        datum = from_tagged_json(json_str)
+        self._store(json_str, _size(json_str), datum)
+        return datum
+
+    def _store(self, key, size: int, datum) -> None:
+        self._misses += 1
+        max_bytes = self.max_bytes
+        if max_bytes is not None and size > max_bytes:
+            return
+        entries = self._entries
+        entries[key] = (datum, size)
+        self._bytes += size
+        while len(entries) > self.max_entries or (max_bytes is not None and self._bytes > max_bytes):
+            _, (_, old_size) = entries.popitem(last=False)
+            self._bytes -= old_size
+            self._evictions += 1
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def cache_info(self) -> CacheInfo:
+        """Hit, miss and eviction counts, and the current size."""
+        return CacheInfo(self._hits, self._misses, self._evictions, len(self._entries), self._bytes)
+
+    def clear(self) -> None:
+        """Drop every entry and reset the counters."""
+        self._entries.clear()
+        self._bytes = self._hits = self._misses = self._evictions = 0
@@ -28,6 +28,9 @@ forms the transport layer uses:
 The tagged envelope is identical to the Java side::
 
     {"typeId": "<TYPE_ID>", "payload": { ...fields... }}
+
+For a view that decodes each field only when it is read, see
+:mod:`~inventzia.pulse.data.datum.lazy`.
 """
 
 import json
@@ -0,0 +1,100 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later OR LicenseRef-Inventzia-Commercial
+# Copyright (c) 2013-2026 Magrino Bini, Paola Apruzzese, Inventzia Science and Technology Ltd.
+#
+# This file is part of pulse-data.
+#
+# pulse-data is dual-licensed:
+#   - Under the GNU Affero General Public License v3.0 or later (see LICENSE-AGPL-3.0).
+#   - Under a commercial license (see LICENSE-COMMERCIAL.txt).
+#     Contact operations@inventzia.com.
+"""
+Label elision for :class:`VectorValue` streams.
+
+The ``valueIds`` of a series (``["macd", "signal", "histogram"]``) are the same
+on every message, and often as long as the values themselves. Within one
+session or file, a :class:`LabelEncoder` sends each distinct label tuple once
+and a small integer afterwards; a :class:`LabelDecoder` reading the same stream
+restores them::
+
+    encoder = LabelEncoder()
+    lines = [encoder.encode(datum) for datum in datums]   # tagged JSON, any datum type
+
+    decoder = LabelDecoder()
+    datums = [decoder.decode(line) for line in lines]
+
+Both ends number label tuples in order of first appearance, so the stream needs
+no side table: the first message with a given tuple carries it in full, later
+ones carry its number in place of the list::
+
+    {"typeId": "...VectorValue", "payload": {"key": "ES.macd", ..., "valueIds": 0}}
+
+A numbered ``valueIds`` fails validation in the plain codec, so an elided
+stream cannot be silently misread without its decoder. The stream must be
+decoded in order and completely (a file, or one connection) — the numbering is
+its state. Decoded instances are equal to the originals, and every instance
+with the same labels shares one tuple, so a long decoded stream holds each
+label tuple once. Other datum types pass through as ordinary tagged JSON.
+"""
+
+import json
+
+from inventzia.pulse.data.datum.codec import from_tagged_json, to_tagged_json
+from inventzia.pulse.data.schemas.common.vector_value import VectorValue
+
+_FIELD_TYPE_ID = "typeId"
+_FIELD_PAYLOAD = "payload"
+_FIELD_VALUE_IDS = "valueIds"
+
+
+class LabelEncoder:
+    """Encodes datums to tagged JSON, eliding repeated ``VectorValue`` labels."""
+
+    def __init__(self):
+        self._numbers: dict[tuple[str, ...], int] = {}
+        self._prefix = f'{{"{_FIELD_TYPE_ID}":"{VectorValue.TYPE_ID}","{_FIELD_PAYLOAD}":'
+
+    def encode(self, datum) -> str:
+        """Tagged JSON of ``datum``; a ``VectorValue`` with known labels gets their number."""
+        labels = datum.value_ids if type(datum) is VectorValue else None
+        if labels is None:
+            return to_tagged_json(datum)
+        number = self._numbers.get(labels)
+        if number is None:
+            self._numbers[labels] = len(self._numbers)
+            return to_tagged_json(datum)
+        payload = datum.model_dump_json(by_alias=True, exclude_none=True, exclude={"value_ids"})
+        return f'{self._prefix}{payload[:-1]},"{_FIELD_VALUE_IDS}":{number}}}}}'
+
+
+class LabelDecoder:
+    """Decodes a :class:`LabelEncoder` stream, sharing one tuple per distinct label set."""
+
+    def __init__(self):
+        self._labels: list[tuple[str, ...]] = []
+        self._numbers: dict[tuple[str, ...], int] = {}
+
+    def decode(self, json_str: str | bytes):
+        """Inverse of :meth:`LabelEncoder.encode`; must see the stream in order."""
+        envelope = json.loads(json_str)
+        if envelope.get(_FIELD_TYPE_ID) != VectorValue.TYPE_ID:
+            return from_tagged_json(json_str)
+        payload = envelope.get(_FIELD_PAYLOAD)
+        labels = payload.get(_FIELD_VALUE_IDS) if isinstance(payload, dict) else None
+        if type(labels) is int:
+            if not 0 <= labels < len(self._labels):
+                raise ValueError(f"valueIds refers to label set {labels}, but only "
+                                 f"{len(self._labels)} have been seen")
+            shared = payload[_FIELD_VALUE_IDS] = self._labels[labels]
+        elif isinstance(labels, list):
+            shared = tuple(labels)
+            number = self._numbers.get(shared)
+            if number is None:
+                self._numbers[shared] = len(self._labels)
+                self._labels.append(shared)
+            else:
+                shared = self._labels[number]
+        else:
+            return VectorValue.model_validate(payload)
+        datum = VectorValue.model_validate(payload)
+        datum.__dict__["value_ids"] = shared    # the validated copy's equal, shared twin
+        return datum
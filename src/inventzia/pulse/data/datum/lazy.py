@@ -0,0 +1,257 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later OR LicenseRef-Inventzia-Commercial
+# Copyright (c) 2013-2026 Magrino Bini, Paola Apruzzese, Inventzia Science and Technology Ltd.
+#
+# This file is part of pulse-data.
+#
+# pulse-data is dual-licensed:
+#   - Under the GNU Affero General Public License v3.0 or later (see LICENSE-AGPL-3.0).
+#   - Under a commercial license (see LICENSE-COMMERCIAL.txt).
+#     Contact operations@inventzia.com.
+"""
+Lazy views: decode a datum one field at a time, on first access.
+
+A full decode parses and validates every field — each decimal, datetime, date
+and optional — although many consumers read only the key, the time and a price.
+A :class:`LazyDatum` keeps the message text instead and decodes a field only
+when it is read::
+
+    bar = lazy_from_tagged_json(message)        # finds the type; nothing else parsed
+    if bar.datum_key in watched:                # scans for "symb", validates one str
+        process(bar.cl)                         # one Decimal
+    bar.materialize()                           # the full, validated CdfBar
+
+Reading a field finds its key among the payload's top-level keys, cuts out the
+value and validates that fragment alone against the field's type (the same
+Pydantic rules, in JSON mode, as the model's own decode), then caches it. A field missing from the message
+takes its default; a missing required field raises the ``ValidationError`` the
+full decode would. Checks across fields (``VectorValue``'s parallel lengths) run
+only in :meth:`LazyDatum.materialize`, which validates the whole payload once
+and serves every later read from the model.
+
+A view satisfies the :class:`~inventzia.pulse.data.datum.datum.Datum` protocol
+and exposes the model's fields by their Python names; anything else — a model
+method, or code that keys on ``type(datum)`` such as the stream caches — needs
+the model from :meth:`~LazyDatum.materialize`. Generated payloads are flat, so
+the first match of a quoted key name is normally the field; a key is only
+checked against the payload's nesting (one scan of its top level, cached) when
+an object opens or closes before that match, as in an unknown extra field whose
+value happens to contain the same key.
+"""
+
+import json
+import re
+import typing
+
+from pydantic import BaseModel, TypeAdapter
+
+from inventzia.pulse.data.schemas.registry import class_for
+
+_FIELD_TYPE_ID = "typeId"
+_FIELD_PAYLOAD = "payload"
+_DECODER = json.JSONDecoder()
+
+
+# A JSON string (with its escapes), optionally followed by the colon of a key;
+# or a bracket.
+_TOKEN = re.compile(r'("(?:[^"\\]|\\.)*")(\s*:\s*)?|[{}\[\]]')
+
+
+def _key_pattern(wire_name: str) -> re.Pattern:
+    # Inside a JSON string every quote is escaped, so in valid JSON a quoted name
+    # followed by a colon is a key — of this object or of one nested in it. The
+    # match ends where its value starts.
+    return re.compile(re.escape(json.dumps(wire_name)) + r"\s*:\s*")
+
+
+_TYPE_ID_KEY = _key_pattern(_FIELD_TYPE_ID)
+_PAYLOAD_KEY = _key_pattern(_FIELD_PAYLOAD)
+
+
+def _top_level(text: str, start: int) -> dict[str, int]:
+    """Where the value of each key of the object at ``start`` begins (nested keys excluded)."""
+    offsets = {}
+    depth = 0
+    for token in _TOKEN.finditer(text, start):
+        if token.group(1) is not None:
+            if depth == 1 and token.group(2) is not None:
+                offsets[json.loads(token.group(1))] = token.end()    # a repeated key: the last wins
+        elif token.group() in "{[":
+            depth += 1
+        else:
+            depth -= 1
+            if not depth:
+                break
+    return offsets
+
+
+def _flat_end(text: str, start: int) -> int:
+    """Where the first nested object of the object at ``start`` opens, or the object closes.
+
+    A key that matches before this point is one of the object's own.
+    """
+    opens, closes = text.find("{", start + 1), text.find("}", start + 1)
+    return closes if opens < 0 or closes < opens else opens     # closes < 0: not JSON, never flat
+
+
+def _find_value(text: str, key: re.Pattern, wire_name: str, start: int, flat_end: int) -> int | None:
+    """Where the value of the top-level key ``wire_name`` of the object at ``start`` begins."""
+    match = key.search(text, start)
+    if match is None:
+        return None
+    if match.start() < flat_end:
+        return match.end()
+    return _top_level(text, start).get(wire_name)
+
+
+class _LazyField:
+    """Descriptor decoding one field on first read into the view's ``__dict__``.
+
+    It is a non-data descriptor, so once the value is stored the instance
+    attribute shadows it and later reads never come back here.
+    """
+
+    __slots__ = ("name", "wire_name", "key", "exact", "adapter", "required", "default")
+
+    def __init__(self, name: str, field):
+        self.name = name
+        self.wire_name = field.alias or name
+        self.key = _key_pattern(self.wire_name)
+        annotation = field.annotation
+        # A JSON string for a str field, or a JSON integer for an int field, is
+        # the validated value as decoded; anything else goes through Pydantic.
+        self.exact = annotation if annotation in (str, int) and not field.metadata else None
+        if field.metadata:
+            annotation = typing.Annotated[(annotation, *field.metadata)]
+        self.adapter = TypeAdapter(annotation)
+        self.required = field.is_required()
+        self.default = None if self.required else field.get_default(call_default_factory=True)
+
+    def __get__(self, view, owner=None):
+        if view is None:
+            return self
+        text = view._text
+        i = view._value_start(self)
+        if i is None:
+            if self.required:
+                view.materialize()          # raises the model's own ValidationError
+            value = self.default
+        else:
+            value, end = _DECODER.raw_decode(text, i)
+            if type(value) is not self.exact:
+                value = self.adapter.validate_json(text[i:end])
+        view.__dict__[self.name] = value
+        return value
+
+
+_VIEW_CLASSES: dict[type, type] = {}
+
+
+def _view_class(model_class: type[BaseModel]) -> type:
+    """The ``LazyDatum`` subclass with one ``_LazyField`` per model field (built once per class)."""
+    view_class = _VIEW_CLASSES.get(model_class)
+    if view_class is None:
+        fields = {name: _LazyField(name, field) for name, field in model_class.model_fields.items()}
+        view_class = _VIEW_CLASSES[model_class] = type(
+            f"Lazy{model_class.__name__}View", (LazyDatum,), {"__slots__": (), **fields})
+    return view_class
+
+
+class LazyDatum:
+    """A datum decoded field by field on first access (see the module docstring).
+
+    ``text`` is the model's JSON object (``str`` or UTF-8 bytes); ``start`` is
+    where it begins, when it is embedded in a larger message. The instance is of
+    a per-model subclass carrying the field accessors.
+    """
+
+    def __new__(cls, model_class: type[BaseModel], text: str | bytes | bytearray | memoryview,
+                start: int = 0):
+        return object.__new__(_view_class(model_class) if cls is LazyDatum else cls)
+
+    def __init__(self, model_class: type[BaseModel], text: str | bytes | bytearray | memoryview,
+                 start: int = 0):
+        self.model_class = model_class
+        self._text = text if isinstance(text, str) else str(text, "utf-8")
+        self._start = start
+        self._model = None
+        self._flat_end = None
+        self._offsets = None
+
+    @property
+    def TYPE_ID(self) -> str:
+        return self.model_class.TYPE_ID
+
+    # -- Datum protocol -------------------------------------------------------
+
+    @property
+    def datum_key(self) -> str:
+        return getattr(self, self.model_class.DATUM_KEY_FIELD)
+
+    @property
+    def datum_time(self) -> int:
+        return getattr(self, self.model_class.DATUM_TIME_FIELD)
+
+    # -- Fields ---------------------------------------------------------------
+
+    def _value_start(self, field: _LazyField) -> int | None:
+        """Where ``field``'s value begins in the payload, or None if it is absent."""
+        offsets = self._offsets
+        if offsets is None:
+            text, start = self._text, self._start
+            match = field.key.search(text, start)
+            if match is None:
+                return None
+            flat_end = self._flat_end
+            if flat_end is None:
+                flat_end = self._flat_end = _flat_end(text, start)
+            if match.start() < flat_end:
+                return match.end()
+            offsets = self._offsets = _top_level(text, start)
+        return offsets.get(field.wire_name)
+
+    @property
+    def decoded_fields(self) -> tuple[str, ...]:
+        """Fields decoded so far (all of them once materialised)."""
+        fields = self.model_class.model_fields
+        return tuple(name for name in self.__dict__ if name in fields)
+
+    def materialize(self):
+        """The full model, validated from the whole payload (once; cached)."""
+        if self._model is None:
+            text, start = self._text, self._start
+            payload = text[start:_DECODER.raw_decode(text, start)[1]] if start else text
+            self._model = self.model_class.model_validate_json(payload)
+            self.__dict__.update(self._model.__dict__)
+        return self._model
+
+    def __reduce__(self):
+        return LazyDatum, (self.model_class, self._text, self._start)
+
+    def __repr__(self) -> str:
+        decoded = ", ".join(f"{name}={self.__dict__[name]!r}" for name in self.decoded_fields)
+        return f"LazyDatum({self.model_class.__name__}, {decoded or '...'})"
+
+
+def lazy_from_json(json_str: str | bytes, model_class: type[BaseModel]) -> LazyDatum:
+    """A lazy view of a JSON object of ``model_class``; no field is parsed yet."""
+    return LazyDatum(model_class, json_str)
+
+
+def lazy_from_tagged_json(json_str: str | bytes) -> LazyDatum:
+    """A lazy view of a tagged envelope's payload; only the ``typeId`` is parsed."""
+    text = json_str if isinstance(json_str, str) else str(json_str, "utf-8")
+    start = text.find("{")
+    flat_end = _flat_end(text, start)
+    type_id = None
+    i = _find_value(text, _TYPE_ID_KEY, _FIELD_TYPE_ID, start, flat_end) if start >= 0 else None
+    if i is not None:
+        end = text.find('"', i + 1)
+        type_id = text[i + 1:end] if end > 0 and text.startswith('"', i) else None
+        if type_id is None or "\\" in type_id:           # not a plain string: decode properly
+            type_id = _DECODER.raw_decode(text, i)[0]
+    if not isinstance(type_id, str):
+        raise ValueError(f"Tagged JSON missing textual {_FIELD_TYPE_ID!r}: {text}")
+    i = _find_value(text, _PAYLOAD_KEY, _FIELD_PAYLOAD, start, flat_end)
+    if i is None or not text.startswith("{", i):
+        raise ValueError(f"Tagged JSON missing object {_FIELD_PAYLOAD!r}: {text}")
+    return LazyDatum(class_for(type_id), text, i)
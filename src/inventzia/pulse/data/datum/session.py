@@ -0,0 +1,146 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later OR LicenseRef-Inventzia-Commercial
+# Copyright (c) 2013-2026 Magrino Bini, Paola Apruzzese, Inventzia Science and Technology Ltd.
+#
+# This file is part of pulse-data.
+#
+# pulse-data is dual-licensed:
+#   - Under the GNU Affero General Public License v3.0 or later (see LICENSE-AGPL-3.0).
+#   - Under a commercial license (see LICENSE-COMMERCIAL.txt).
+#     Contact operations@inventzia.com.
+"""
+Session-negotiated compact type IDs for tagged envelopes.
+
+A tagged envelope repeats the fully qualified ``TYPE_ID`` in every frame — often
+more bytes than a small payload such as a ``HeartBeat``. A :class:`TypeTable`
+numbers the registry types for one connection, so frames carry a small integer
+instead::
+
+    {"typeId": 0, "payload": { ...fields... }}
+
+The two ends agree on the numbering once, with a handshake message::
+
+    # sender                                   # receiver
+    table = TypeTable.local()
+    send(table.handshake())          ──▶       table = TypeTable.from_handshake(message)
+    send(table.to_compact_json(bar)) ──▶       bar = table.from_compact_json(frame)
+
+The handshake lists the type IDs in number order with a fingerprint of their
+schemas (:func:`schema_fingerprint`); the receiver rebuilds the same table from
+its own registry and refuses the session (``ValueError``) if a type is unknown
+or any schema differs, instead of mis-decoding frames later. Decoding a frame is
+a list index instead of a dictionary lookup on a 50-byte string, and a frame
+with a textual ``typeId`` is still accepted, so a compact session can carry
+ordinary tagged envelopes too.
+"""
+
+import hashlib
+import json
+from collections.abc import Iterable, Sequence
+
+from inventzia.pulse.data.datum.codec import to_json
+from inventzia.pulse.data.schemas.registry import REGISTRY, class_for
+
+_FIELD_TYPE_ID = "typeId"
+_FIELD_PAYLOAD = "payload"
+_FIELD_TYPE_IDS = "typeIds"
+_FIELD_FINGERPRINT = "fingerprint"
+
+
+def schema_fingerprint(model_classes: Iterable[type]) -> str:
+    """SHA-256 (hex) of the models' ``SCHEMA`` strings, in the given order.
+
+    ``SCHEMA`` is the canonical form of the YAML schema (type ID, version and,
+    per field, wire name, YAML type and whether it is required) that the
+    generators emit for every language, so a Java peer computes the same value:
+    the hash of ``"[" + ",".join(schemas) + "]"``.
+    """
+    canonical = "[" + ",".join(c.SCHEMA for c in model_classes) + "]"
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class TypeTable:
+    """A per-connection numbering of registry types (see the module docstring)."""
+
+    def __init__(self, type_ids: Sequence[str]):
+        if len(set(type_ids)) != len(type_ids):
+            raise ValueError("duplicate TYPE_ID in type table")
+        self._classes: list[type] = [class_for(type_id) for type_id in type_ids]
+        self._numbers: dict[type, int] = {c: n for n, c in enumerate(self._classes)}
+        self._prefixes = [f'{{"{_FIELD_TYPE_ID}":{n},"{_FIELD_PAYLOAD}":' for n in range(len(type_ids))]
+        self.fingerprint = schema_fingerprint(self._classes)
+
+    @classmethod
+    def local(cls) -> "TypeTable":
+        """Every registered type, numbered in ``TYPE_ID`` order."""
+        return cls(sorted(REGISTRY))
+
+    @property
+    def type_ids(self) -> list[str]:
+        """The ``TYPE_ID``s in number order."""
+        return [c.TYPE_ID for c in self._classes]
+
+    def __len__(self) -> int:
+        return len(self._classes)
+
+    # -- Handshake ------------------------------------------------------------
+
+    def handshake(self) -> str:
+        """The message that lets the peer rebuild this table (:meth:`from_handshake`)."""
+        return json.dumps({_FIELD_TYPE_IDS: self.type_ids, _FIELD_FINGERPRINT: self.fingerprint})
+
+    @classmethod
+    def from_handshake(cls, message: str) -> "TypeTable":
+        """Rebuild the peer's table, checking its schemas against the local registry."""
+        offer = json.loads(message)
+        type_ids = offer.get(_FIELD_TYPE_IDS)
+        if not isinstance(type_ids, list) or not all(isinstance(t, str) for t in type_ids):
+            raise ValueError(f"Handshake missing a {_FIELD_TYPE_IDS!r} list: {message}")
+        unknown = [t for t in type_ids if t not in REGISTRY]
+        if unknown:
+            raise ValueError(f"Handshake lists unknown TYPE_IDs: {unknown}")
+        table = cls(type_ids)
+        if offer.get(_FIELD_FINGERPRINT) != table.fingerprint:
+            raise ValueError(f"Handshake schema fingerprint {offer.get(_FIELD_FINGERPRINT)!r} "
+                             f"does not match the local schemas ({table.fingerprint!r})")
+        return table
+
+    # -- Frames ---------------------------------------------------------------
+
+    def number_of(self, model_class: type) -> int:
+        """The number this session assigned to ``model_class``, or to its ``TYPE_ID``.
+
+        The ``TYPE_ID`` lookup covers a subclass of a registered model.
+        """
+        number = self._numbers.get(model_class)
+        if number is None:
+            number = self._numbers.get(REGISTRY.get(getattr(model_class, "TYPE_ID", None)))
+            if number is None:
+                raise KeyError(f"Type not in this session: {model_class.__name__}")
+        return number
+
+    def to_compact_json(self, datum) -> str:
+        """Serialise a datum to a tagged envelope carrying its session number.
+
+        The payload is :func:`~inventzia.pulse.data.datum.codec.to_json` spliced in
+        as is, without the parse-and-redump of a textual envelope.
+        """
+        numbers = self._numbers
+        model_class = type(datum)
+        number = numbers.get(model_class)
+        if number is None:
+            number = self.number_of(model_class)        # a subclass of a registered model
+        return self._prefixes[number] + to_json(datum) + "}"
+
+    def from_compact_json(self, json_str: str | bytes):
+        """Deserialise an envelope whose ``typeId`` is a session number or a ``TYPE_ID``."""
+        envelope = json.loads(json_str)
+        type_id = envelope.get(_FIELD_TYPE_ID)
+        if type(type_id) is int:
+            if not 0 <= type_id < len(self._classes):
+                raise ValueError(f"Type number {type_id} not in this session ({len(self)} types)")
+            model_class = self._classes[type_id]
+        elif isinstance(type_id, str):
+            model_class = class_for(type_id)
+        else:
+            raise ValueError(f"Tagged JSON missing {_FIELD_TYPE_ID!r}: {json_str}")
+        return model_class.model_validate(envelope.get(_FIELD_PAYLOAD))
@@ -0,0 +1,269 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later OR LicenseRef-Inventzia-Commercial
+# Copyright (c) 2013-2026 Magrino Bini, Paola Apruzzese, Inventzia Science and Technology Ltd.
+#
+# This file is part of pulse-data.
+#
+# pulse-data is dual-licensed:
+#   - Under the GNU Affero General Public License v3.0 or later (see LICENSE-AGPL-3.0).
+#   - Under a commercial license (see LICENSE-COMMERCIAL.txt).
+#     Contact operations@inventzia.com.
+"""
+Synthetic datum traffic for load tests, driven by the generated schemas.
+
+Usage:
+    python -m inventzia.pulse.data.loadgen --type CdfBar --keys 500 --rate 50000 --count 1000000
+    python -m inventzia.pulse.data.loadgen --type CdfBar --type HeartBeat --out tcp://127.0.0.1:9000
+    python -m inventzia.pulse.data.loadgen --type VectorValue --format compact --out unix:///tmp/feed
+
+Any registered type can be generated: a :class:`DatumFactory` derives a value
+generator for every field from the model's own fields (which the generator
+projects from the YAML schema), so a new schema needs no changes here. The
+routing fields get the load-test controls — the key cycles through ``--keys``
+distinct values, the time advances by ``--step-ms`` (plus up to ``--jitter-ms``)
+per message — and every optional field is present with probability
+``--optional-density``. Date-time and date fields follow the routing time, and
+a bar's ``hi`` / ``lo`` bracket its ``op`` and ``cl``. Array fields have
+``--width`` elements, so parallel arrays match.
+
+Messages are written one per line as tagged JSON, or as compact frames of a
+:class:`~inventzia.pulse.data.datum.session.TypeTable` (preceded by its
+handshake line) with ``--format compact``. ``--out`` is a file path, ``-`` for
+stdout (a pipe), ``tcp://host:port`` or ``unix:///path``. ``--rate`` paces the
+output to a target msg/s (0 = as fast as possible); the achieved rate is
+reported on stderr.
+"""
+
+import argparse
+import random
+import socket
+import sys
+import time
+import typing
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+
+from pydantic import AwareDatetime
+
+from inventzia.pulse.data.datum.codec import to_tagged_json
+from inventzia.pulse.data.datum.session import TypeTable
+from inventzia.pulse.data.schemas.registry import class_for_name
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_OHLC = ("op", "hi", "lo", "cl")
+
+
+def _unwrap(annotation) -> tuple[object, bool]:
+    """(inner annotation, optional?) of a field annotation."""
+    if typing.get_origin(annotation) is typing.Union:
+        inner = [a for a in typing.get_args(annotation) if a is not type(None)]
+        return inner[0], True
+    return annotation, False
+
+
+class DatumFactory:
+    """Produces valid, varied instances of one registered model class.
+
+    ``keys`` distinct routing keys are used round-robin; the routing time
+    starts at ``start_time`` and advances ``step_ms`` (+ uniform ``0..jitter_ms``)
+    per instance. ``seed`` makes the sequence reproducible.
+    """
+
+    def __init__(self, model_class: type, *, keys: int = 100, start_time: int | None = None,
+                 step_ms: int = 1, jitter_ms: int = 0, optional_density: float = 0.5,
+                 width: int = 3, seed: int | None = None):
+        if keys <= 0:
+            raise ValueError(f"keys must be positive, got {keys}")
+        self.model_class = model_class
+        self._random = random.Random(seed)
+        self._key_field, self._time_field = model_class.DATUM_KEY_FIELD, model_class.DATUM_TIME_FIELD
+        self._keys = [f"{model_class.__name__[:3].upper()}{i:05d}" for i in range(keys)]
+        self._n = 0
+        self._time = int(time.time() * 1000) if start_time is None else start_time
+        self._step_ms = step_ms
+        self._jitter_ms = jitter_ms
+        self._density = optional_density
+        self._width = width
+        self._fields = [(field.alias or name, *_unwrap(field.annotation),
+                         self._values_for(name, field))
+                        for name, field in model_class.model_fields.items()]
+        fields = model_class.model_fields
+        self._ohlc = (tuple(fields[name].alias or name for name in _OHLC)
+                      if all(name in fields and fields[name].annotation is Decimal for name in _OHLC)
+                      else None)
+
+    def _values_for(self, name: str, field) -> Callable[[int], object]:
+        """A generator of wire values for one field, given the message time."""
+        annotation, _ = _unwrap(field.annotation)
+        if name == self._key_field:
+            return lambda t: self._keys[self._n % len(self._keys)]
+        if name == self._time_field:
+            return lambda t: t
+        if typing.get_origin(annotation) is tuple:
+            item = typing.get_args(annotation)[0]
+            if item is str:
+                labels = tuple(f"{name}{i}" for i in range(self._width))
+                return lambda t: labels
+            scalar = self._scalar(name, item)
+            return lambda t: tuple(scalar(t) for _ in range(self._width))
+        return self._scalar(name, annotation)
+
+    def _scalar(self, name: str, annotation) -> Callable[[int], object]:
+        rnd = self._random
+        if annotation is Decimal:
+            return lambda t: Decimal(rnd.randint(1, 10_000_000)).scaleb(-4)
+        if annotation is int:
+            return lambda t: rnd.randint(0, 1_000_000)
+        if annotation is float:
+            return lambda t: rnd.random()
+        if annotation is bool:
+            return lambda t: rnd.random() < 0.5
+        if annotation in (AwareDatetime, datetime):
+            return lambda t: _EPOCH + timedelta(milliseconds=t)
+        if annotation is date:
+            return lambda t: (_EPOCH + timedelta(milliseconds=t)).date()
+        return lambda t: f"{name}-{rnd.randint(0, 9999)}"
+
+    def make(self):
+        """The next instance."""
+        t = self._time
+        rnd, density = self._random, self._density
+        data = {wire: value(t) for wire, _, optional, value in self._fields
+                if not optional or rnd.random() < density}
+        if self._ohlc is not None:
+            # Prices are drawn independently; widen the random extremes to
+            # cover the open and close so the bar is consistent.
+            op, hi, lo, cl = self._ohlc
+            data[hi] = max(data[op], data[cl], data[hi])
+            data[lo] = min(data[op], data[cl], data[lo])
+        self._n += 1
+        self._time = t + self._step_ms + (rnd.randint(0, self._jitter_ms) if self._jitter_ms else 0)
+        return self.model_class.model_validate(data)
+
+    def __iter__(self) -> Iterator:
+        while True:
+            yield self.make()
+
+
+def mix(factories: Sequence[DatumFactory], seed: int | None = None) -> Iterator:
+    """An endless stream drawing uniformly from several factories."""
+    if len(factories) == 1:
+        yield from factories[0]
+        return
+    rnd = random.Random(seed)
+    while True:
+        yield rnd.choice(factories).make()
+
+
+def paced(items: Iterable, rate: float, deadline: float | None = None) -> Iterator:
+    """Yield ``items`` at no more than ``rate`` per second (``0``: unpaced).
+
+    Pacing follows an absolute schedule, so short stalls are caught up. A paced
+    stream ends before the first item scheduled at or after ``deadline`` (a
+    ``time.perf_counter()`` value); unpaced, the caller checks the time.
+    """
+    if rate <= 0:
+        yield from items
+        return
+    interval = 1.0 / rate
+    start = time.perf_counter()
+    for n, item in enumerate(items):
+        due = start + n * interval
+        if deadline is not None and due >= deadline:
+            return
+        delay = due - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+        yield item
+
+
+# ---------------------------------------------------------------------------
+# Output
+# ---------------------------------------------------------------------------
+
+def open_sink(target: str):
+    """A binary writable for ``target``: a path, ``-``, ``tcp://host:port`` or ``unix:///path``."""
+    if target == "-":
+        return sys.stdout.buffer
+    if target.startswith("tcp://"):
+        host, _, port = target[len("tcp://"):].rpartition(":")
+        return socket.create_connection((host, int(port))).makefile("wb")
+    if target.startswith("unix://"):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.connect(target[len("unix://"):])
+        return sock.makefile("wb")
+    return open(target, "wb")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m inventzia.pulse.data.loadgen",
+                                     description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--type", action="append", required=True, dest="types",
+                        help="class name or TYPE_ID; repeat to mix types")
+    parser.add_argument("--keys", type=int, default=100, help="distinct routing keys per type")
+    parser.add_argument("--start-time", type=int, default=None, help="first epoch ms (default: now)")
+    parser.add_argument("--step-ms", type=int, default=1)
+    parser.add_argument("--jitter-ms", type=int, default=0)
+    parser.add_argument("--optional-density", type=float, default=0.5)
+    parser.add_argument("--width", type=int, default=3, help="elements per array field")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--rate", type=float, default=0, help="target msg/s (0 = unpaced)")
+    parser.add_argument("--count", type=int, default=None, help="messages to send")
+    parser.add_argument("--duration", type=float, default=None, help="seconds to run")
+    parser.add_argument("--format", choices=("tagged", "compact"), default="tagged")
+    parser.add_argument("--out", default="-", help="path, -, tcp://host:port or unix:///path")
+    args = parser.parse_args(argv)
+    if args.count is None and args.duration is None:
+        parser.error("one of --count / --duration is required")
+    if args.count is not None and args.count < 1:
+        parser.error(f"--count must be at least 1, got {args.count}")
+    if args.duration is not None and args.duration <= 0:
+        parser.error(f"--duration must be positive, got {args.duration}")
+
+    try:
+        classes = [class_for_name(name) for name in args.types]
+    except KeyError as e:
+        print(f"❌  {e.args[0]}", file=sys.stderr)
+        return 1
+    factories = [DatumFactory(c, keys=args.keys, start_time=args.start_time, step_ms=args.step_ms,
+                              jitter_ms=args.jitter_ms, optional_density=args.optional_density,
+                              width=args.width, seed=None if args.seed is None else args.seed + i)
+                 for i, c in enumerate(classes)]
+    if args.format == "compact":
+        table = TypeTable.local()
+        encode = table.to_compact_json
+    else:
+        table, encode = None, to_tagged_json
+
+    sink = open_sink(args.out)
+    sent = nbytes = 0
+    start = time.perf_counter()
+    deadline = None if args.duration is None else start + args.duration
+    try:
+        if table is not None:
+            sink.write(table.handshake().encode("utf-8") + b"\n")
+        for datum in paced(mix(factories, args.seed), args.rate, deadline):
+            line = encode(datum).encode("utf-8") + b"\n"
+            sink.write(line)
+            sent += 1
+            nbytes += len(line)
+            # Unpaced, the clock is read every 256 messages only; paced() stops at the deadline.
+            if sent == args.count or (deadline is not None and not sent % 256
+                                      and time.perf_counter() >= deadline):
+                break
+        sink.flush()
+    except (BrokenPipeError, ConnectionError) as e:
+        print(f"⚠  output closed: {e}", file=sys.stderr)
+    finally:
+        if sink is not sys.stdout.buffer:
+            sink.close()
+    elapsed = time.perf_counter() - start
+    print(f"{sent} messages, {nbytes / 1e6:.1f} MB in {elapsed:.2f}s: "
+          f"{sent / elapsed:,.0f} msg/s ({nbytes / elapsed / 1e6:.1f} MB/s)"
+          + (f", target {args.rate:,.0f} msg/s" if args.rate else ""), file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,182 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later OR LicenseRef-Inventzia-Commercial
+# Copyright (c) 2013-2026 Magrino Bini, Paola Apruzzese, Inventzia Science and Technology Ltd.
+#
+# This file is part of pulse-data.
+#
+# pulse-data is dual-licensed:
+#   - Under the GNU Affero General Public License v3.0 or later (see LICENSE-AGPL-3.0).
+#   - Under a commercial license (see LICENSE-COMMERCIAL.txt).
+#     Contact operations@inventzia.com.
+"""
+Replay a captured tagged stream through the codec and report where time goes.
+
+Usage:
+    python -m inventzia.pulse.data.profile capture.ndjson
+    python -m inventzia.pulse.data.profile capture.ndjson --repeat 5 --cprofile decode.prof
+
+The capture is NDJSON: one tagged envelope (``{"typeId": ..., "payload": ...}``,
+as written by ``to_tagged_json``) per line. Messages are grouped by ``TYPE_ID``
+and each decode stage is timed over the whole group, so the numbers reflect
+the real message mix rather than one synthetic message:
+
+  parse       ``json.loads`` of the envelope
+  validate    ``model_validate`` of the payload — Pydantic validates and builds
+              the instance in one pass, so this includes construction
+  construct   ``model_construct`` from the validated values: what building an
+              instance costs with validation skipped (in Pydantic v2 often more
+              than ``validate``, whose construction runs in the Rust core)
+  encode      ``to_tagged_json`` of the decoded datum
+
+Times are microseconds per message (best of ``--repeat`` runs); ``msg/s`` is the
+end-to-end ``from_tagged_json`` rate. ``--cprofile`` additionally writes
+``cProfile`` statistics of that end-to-end decode for ``pstats`` / snakeviz.
+Lines that do not decode (not UTF-8, malformed, unknown type, invalid payload)
+are counted and skipped.
+"""
+
+import argparse
+import cProfile
+import json
+import sys
+import time
+from pathlib import Path
+
+from inventzia.pulse.data.datum.codec import from_tagged_json, to_tagged_json
+from inventzia.pulse.data.datum.lazy import lazy_from_tagged_json
+from inventzia.pulse.data.schemas.registry import REGISTRY
+
+
+def _load(path: Path, limit: int | None) -> tuple[dict[str, list[str]], int]:
+    """Capture lines grouped by TYPE_ID, in capture order; plus the skipped count.
+
+    Only the ``typeId`` is read here; :func:`profile_group` drops the lines whose
+    payload does not validate.
+    """
+    groups: dict[str, list[str]] = {}
+    skipped = 0
+    with open(path, "rb") as f:
+        for n, raw in enumerate(f):
+            if limit is not None and n >= limit:
+                break
+            try:
+                line = raw.decode("utf-8").strip()
+                if not line:
+                    continue
+                type_id = lazy_from_tagged_json(line).TYPE_ID
+            except (ValueError, KeyError):      # UnicodeDecodeError is a ValueError
+                skipped += 1
+                continue
+            groups.setdefault(type_id, []).append(line)
+    return groups, skipped
+
+
+def _best(run, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _percentile(sorted_values: list[int], q: float) -> int:
+    return sorted_values[min(len(sorted_values) - 1, int(q * len(sorted_values)))]
+
+
+def profile_group(model_class: type, lines: list[str], repeat: int) -> dict:
+    """Stage timings (seconds, whole group) and size statistics for one type's messages.
+
+    Lines that do not decode are left out of every stage: the result's ``lines``
+    are those profiled, and ``skipped`` counts the rest.
+    """
+    validate = model_class.model_validate
+    kept, payloads, datums = [], [], []
+    for line in lines:
+        try:
+            payload = json.loads(line).get("payload")
+            datum = validate(payload)
+        except (ValueError, AttributeError):    # JSONDecodeError and ValidationError are ValueErrors
+            continue
+        kept.append(line)
+        payloads.append(payload)
+        datums.append(datum)
+    skipped, lines = len(lines) - len(kept), kept
+    if not lines:
+        return {"count": 0, "skipped": skipped, "lines": lines}
+    values = [datum.__dict__ for datum in datums]
+    construct = model_class.model_construct
+    sizes = sorted(len(line.encode("utf-8")) for line in lines)
+    return {
+        "count": len(lines),
+        "skipped": skipped,
+        "lines": lines,
+        "sizes": sizes,
+        "parse": _best(lambda: [json.loads(line) for line in lines], repeat),
+        "validate": _best(lambda: [validate(payload) for payload in payloads], repeat),
+        "construct": _best(lambda: [construct(**v) for v in values], repeat),
+        "encode": _best(lambda: [to_tagged_json(datum) for datum in datums], repeat),
+        "total": _best(lambda: [from_tagged_json(line) for line in lines], repeat),
+    }
+
+
+def _report(results: dict[str, dict], skipped: int, out) -> None:
+    header = (f"{'type':<14} {'count':>8} {'bytes p50':>9} {'p99':>6} {'max':>6}  "
+              f"{'parse':>7} {'validate':>8} {'construct':>9} {'encode':>7}  {'msg/s':>9}")
+    print(header, file=out)
+    print("-" * len(header), file=out)
+    totals = {"count": 0, "time": 0.0}
+    for type_id, r in sorted(results.items(), key=lambda item: -item[1]["count"]):
+        n, sizes = r["count"], r["sizes"]
+        us = {stage: r[stage] / n * 1e6 for stage in ("parse", "validate", "construct", "encode")}
+        print(f"{REGISTRY[type_id].__name__:<14} {n:>8} {_percentile(sizes, 0.5):>9} "
+              f"{_percentile(sizes, 0.99):>6} {sizes[-1]:>6}  {us['parse']:>7.2f} "
+              f"{us['validate']:>8.2f} {us['construct']:>9.2f} {us['encode']:>7.2f}  "
+              f"{n / r['total']:>9,.0f}", file=out)
+        totals["count"] += n
+        totals["time"] += r["total"]
+    if totals["count"]:
+        print(f"\n{totals['count']} messages, {totals['count'] / totals['time']:,.0f} msg/s "
+              f"end-to-end decode (times in µs per message)", file=out)
+    if skipped:
+        print(f"{skipped} lines skipped (not a decodable tagged envelope)", file=out)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m inventzia.pulse.data.profile",
+                                     description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("capture", type=Path, help="NDJSON file of tagged envelopes")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per stage; the best is kept")
+    parser.add_argument("--limit", type=int, default=None, help="read at most this many lines")
+    parser.add_argument("--cprofile", type=Path, default=None, metavar="FILE",
+                        help="write cProfile stats of the end-to-end decode to FILE")
+    args = parser.parse_args(argv)
+
+    if not args.capture.exists():
+        print(f"❌  capture not found: {args.capture}", file=sys.stderr)
+        return 1
+    groups, skipped = _load(args.capture, args.limit)
+    if not groups:
+        print(f"❌  no decodable messages in {args.capture}", file=sys.stderr)
+        return 1
+
+    results = {type_id: profile_group(REGISTRY[type_id], lines, max(1, args.repeat))
+               for type_id, lines in groups.items()}
+    skipped += sum(r["skipped"] for r in results.values())
+    results = {type_id: r for type_id, r in results.items() if r["count"]}
+    if not results:
+        print(f"❌  no decodable messages in {args.capture}", file=sys.stderr)
+        return 1
+    _report(results, skipped, sys.stdout)
+
+    if args.cprofile:
+        lines = [line for r in results.values() for line in r["lines"]]
+        profiler = cProfile.Profile()
+        profiler.runcall(lambda: [from_tagged_json(line) for line in lines])
+        profiler.dump_stats(args.cprofile)
+        print(f"cProfile stats written to {args.cprofile}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
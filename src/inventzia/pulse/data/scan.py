@@ -0,0 +1,271 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later OR LicenseRef-Inventzia-Commercial
+# Copyright (c) 2013-2026 Magrino Bini, Paola Apruzzese, Inventzia Science and Technology Ltd.
+#
+# This file is part of pulse-data.
+#
+# pulse-data is dual-licensed:
+#   - Under the GNU Affero General Public License v3.0 or later (see LICENSE-AGPL-3.0).
+#   - Under a commercial license (see LICENSE-COMMERCIAL.txt).
+#     Contact operations@inventzia.com.
+"""
+Find datums in captured tagged streams by type, key and time, without decoding the rest.
+
+Usage:
+    python -m inventzia.pulse.data.scan capture.ndjson --type HeartBeat --key HB01
+    python -m inventzia.pulse.data.scan day-*.ndjson --type CdfBar --key ES --key NQ \\
+        --since 2026-10-19T13:30:00Z --until 2026-10-19T14:00:00Z -j 0 --out hits.ndjson
+
+The captures are NDJSON, one tagged envelope per line (as written by
+``to_tagged_json`` or ``loadgen``). The predicates are applied to the raw line,
+cheapest first: a substring test for the ``TYPE_ID``, then a lazy view
+(:mod:`~inventzia.pulse.data.datum.lazy`) that decodes only the ``x-datum-key``
+and ``x-datum-time`` fields. Only a line that passes every predicate is decoded
+in full, so a line that fails one costs a few microseconds, not a full decode;
+the key and time predicates are checked again on the decoded datum.
+A line that does not decode as far as the predicates read it is counted as
+skipped, and so is a match that fails full validation.
+
+Files are split into byte ranges of about ``--chunk-mb`` megabytes, scanned by
+``-j`` worker processes (0: one per CPU). A range owns the lines that *start*
+inside it, so every line is read exactly once, and results come back in file
+order. The matching lines are written as captured; the counts go to stderr.
+
+In code::
+
+    scanner = CaptureScanner(types=[CdfBar], keys={"ES", "NQ"}, start=t1, stop=t2)
+    for bar in scanner.scan(paths, jobs=8):
+        ...
+    scanner.lines, scanner.matched, scanner.skipped
+"""
+
+import argparse
+import os
+import sys
+import time
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+
+from pydantic import ValidationError
+
+from inventzia.pulse.data.datum.lazy import lazy_from_tagged_json
+from inventzia.pulse.data.schemas.registry import class_for_name
+
+_CHUNK_BYTES = 16 << 20
+
+
+def _type_id(model: type | str) -> str:
+    return model if isinstance(model, str) else model.TYPE_ID
+
+
+class CaptureScanner:
+    """Type / key / time predicates over tagged NDJSON captures (see the module docstring).
+
+    ``types`` are model classes or ``TYPE_ID`` strings, ``keys`` ``datum_key``
+    values, and ``start`` / ``stop`` bound ``datum_time`` (``start <= t < stop``);
+    ``None`` leaves a predicate out. ``lines``, ``matched`` and ``skipped`` count
+    what the scans so far have read.
+    """
+
+    def __init__(self, *, types: Iterable[type | str] | None = None,
+                 keys: Iterable[str] | None = None,
+                 start: int | None = None, stop: int | None = None):
+        self.types = None if types is None else frozenset(map(_type_id, types))
+        self._needles = None if types is None else tuple(f'"{type_id}"' for type_id in self.types)
+        self.keys = None if keys is None else frozenset(keys)
+        self.start = start
+        self.stop = stop
+        self.lines = 0
+        self.matched = 0
+        self.skipped = 0
+
+    def match(self, line: str):
+        """The datum ``line`` holds if it passes every predicate, else None.
+
+        Raises ``ValueError`` (or ``ValidationError``) for a line that does not
+        decode as far as the predicates needed to read.
+        """
+        types = self.types
+        if types is not None and not any(needle in line for needle in self._needles):
+            return None
+        view = lazy_from_tagged_json(line)
+        if types is not None and view.TYPE_ID not in types:
+            return None
+        if not self._passes(view):
+            return None
+        datum = view.materialize()
+        return datum if self._passes(datum) else None
+
+    def _passes(self, datum) -> bool:
+        """Whether ``datum`` (a view or the decoded model) meets the key and time predicates."""
+        if self.keys is not None and datum.datum_key not in self.keys:
+            return False
+        if self.start is not None or self.stop is not None:
+            t = datum.datum_time
+            if (self.start is not None and t < self.start) or (self.stop is not None and t >= self.stop):
+                return False
+        return True
+
+    def scan(self, paths: Iterable[str | os.PathLike], *, jobs: int = 1, raw: bool = False,
+             chunk_bytes: int = _CHUNK_BYTES) -> Iterator:
+        """Yield the matches in ``paths``, in file order: datums, or their lines if ``raw``.
+
+        ``jobs`` worker processes scan byte ranges of about ``chunk_bytes``
+        (0: one per CPU; 1: in this process). Every match is decoded in full
+        either way, so a line that does not decode is skipped rather than yielded.
+        """
+        jobs = jobs or os.cpu_count() or 1
+        chunks = [(os.fspath(path), lo, min(lo + chunk_bytes, size))
+                  for path in paths
+                  for size in [os.path.getsize(path)]
+                  for lo in range(0, size, chunk_bytes)]
+        if jobs == 1 or len(chunks) <= 1:
+            for chunk in chunks:
+                yield from self._collect(_scan_range(self, *chunk, raw))
+            return
+        with ProcessPoolExecutor(min(jobs, len(chunks))) as pool:
+            pending = deque()
+            for chunk in chunks:
+                pending.append(pool.submit(_scan_range, self, *chunk, raw))
+                if len(pending) >= 2 * jobs:        # bound what is held in memory
+                    yield from self._collect(pending.popleft().result())
+            while pending:
+                yield from self._collect(pending.popleft().result())
+
+    def candidates(self, lines: list[str]) -> list[str]:
+        """The lines that could match: those naming a wanted ``TYPE_ID`` (all if no type filter)."""
+        needles = self._needles
+        if needles is None:
+            return lines
+        if len(needles) == 1:
+            needle = needles[0]
+            return [line for line in lines if needle in line]
+        return [line for line in lines if any(needle in line for needle in needles)]
+
+    def _collect(self, result: tuple[int, int, list]) -> list:
+        lines, skipped, matches = result
+        self.lines += lines
+        self.skipped += skipped
+        self.matched += len(matches)
+        return matches
+
+    def __getstate__(self) -> dict:
+        # Workers need the predicates only.
+        return {**self.__dict__, "lines": 0, "matched": 0, "skipped": 0}
+
+
+def _read_range(path: str, lo: int, hi: int) -> bytes:
+    """The lines of ``path`` that start in ``[lo, hi)``."""
+    with open(path, "rb") as f:
+        if lo:
+            f.seek(lo - 1)
+            f.readline()            # the line under way at lo belongs to the previous range
+        start = f.tell()
+        if start >= hi:
+            return b""
+        data = f.read(hi - start)
+        if not data.endswith(b"\n"):
+            data += f.readline()
+        return data
+
+
+def _scan_range(scanner: CaptureScanner, path: str, lo: int, hi: int,
+                raw: bool) -> tuple[int, int, list]:
+    """Scan one byte range: ``(lines read, lines skipped as undecodable, matches)``."""
+    data = _read_range(path, lo, hi)
+    try:
+        lines = data.decode("utf-8").split("\n")
+    except UnicodeDecodeError:
+        lines = [_utf8(line) for line in data.split(b"\n")]
+    count = len(lines) - lines.count("")
+    skipped = lines.count(None)
+    matches = []
+    match = scanner.match
+    for line in scanner.candidates([line for line in lines if line]):
+        try:
+            datum = match(line)
+        except (ValueError, KeyError, ValidationError):
+            skipped += 1
+            continue
+        if datum is not None:
+            matches.append(line.rstrip("\r") if raw else datum)
+    return count, skipped, matches
+
+
+def _utf8(line: bytes) -> str | None:
+    try:
+        return line.decode("utf-8")
+    except UnicodeDecodeError:
+        return None
+
+
+# ---------------------------------------------------------------------------
+# Command line
+# ---------------------------------------------------------------------------
+
+def _epoch_ms(value: str) -> int:
+    """Epoch milliseconds, or an ISO 8601 date-time (UTC unless it says otherwise)."""
+    try:
+        return int(value)
+    except ValueError:
+        pass
+    moment = datetime.fromisoformat(value)
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return int(moment.timestamp() * 1000)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m inventzia.pulse.data.scan",
+                                     description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("captures", type=Path, nargs="+", help="NDJSON files of tagged envelopes")
+    parser.add_argument("--type", action="append", dest="types", default=None,
+                        help="class name or TYPE_ID; repeat for several")
+    parser.add_argument("--key", action="append", dest="keys", default=None,
+                        help="datum_key to keep; repeat for several")
+    parser.add_argument("--since", type=_epoch_ms, default=None,
+                        help="first datum_time kept: epoch ms or ISO 8601 (UTC by default)")
+    parser.add_argument("--until", type=_epoch_ms, default=None,
+                        help="datum_time bound, exclusive: epoch ms or ISO 8601")
+    parser.add_argument("-j", "--jobs", type=int, default=1, help="worker processes (0 = one per CPU)")
+    parser.add_argument("--chunk-mb", type=float, default=_CHUNK_BYTES / (1 << 20),
+                        help="byte range per work unit, in MiB")
+    parser.add_argument("--out", default="-", help="file for the matching lines (- = stdout)")
+    args = parser.parse_args(argv)
+
+    missing = [str(path) for path in args.captures if not path.exists()]
+    if missing:
+        print(f"❌  capture not found: {', '.join(missing)}", file=sys.stderr)
+        return 1
+    try:
+        types = None if args.types is None else [class_for_name(name) for name in args.types]
+    except KeyError as e:
+        print(f"❌  {e.args[0]}", file=sys.stderr)
+        return 1
+
+    scanner = CaptureScanner(types=types, keys=args.keys, start=args.since, stop=args.until)
+    out = sys.stdout if args.out == "-" else open(args.out, "w", encoding="utf-8")
+    nbytes = sum(path.stat().st_size for path in args.captures)
+    begin = time.perf_counter()
+    try:
+        for line in scanner.scan(args.captures, jobs=args.jobs, raw=True,
+                                 chunk_bytes=max(1, int(args.chunk_mb * (1 << 20)))):
+            out.write(line + "\n")
+    except BrokenPipeError:
+        pass
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    elapsed = time.perf_counter() - begin
+    print(f"{scanner.matched} of {scanner.lines} lines matched"
+          + (f", {scanner.skipped} skipped (not decodable)" if scanner.skipped else "")
+          + f"; {nbytes / 1e6:.1f} MB in {elapsed:.2f}s ({nbytes / elapsed / 1e6:.1f} MB/s)",
+          file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
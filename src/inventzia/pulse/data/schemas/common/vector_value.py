@@ -17,6 +17,33 @@ from decimal import Decimal
 from pydantic import BaseModel, ConfigDict, Field, model_validator
 from typing import ClassVar, Optional
 
+_FIELDS = ("key", "time", "values", "value_ids")
+"""Field names in declaration order: the layout of a pickled instance."""
+
+
+def _restore(model_class: type, values: tuple):
+    """An instance from already-valid field values in _FIELDS order, without validation.
+
+    Unpickling and the package's bulk constructors (DatumBlock, HeartBeatClock) build
+    instances here; the literal dict and set beat dict(zip(_FIELDS, values)).
+    """
+    datum = model_class.__new__(model_class)
+    object.__setattr__(datum, "__dict__", {
+        "key": values[0],
+        "time": values[1],
+        "values": values[2],
+        "value_ids": values[3],
+    })
+    object.__setattr__(datum, "__pydantic_fields_set__", {
+        "key",
+        "time",
+        "values",
+        "value_ids",
+    })
+    object.__setattr__(datum, "__pydantic_extra__", None)
+    object.__setattr__(datum, "__pydantic_private__", None)
+    return datum
+
 
 class VectorValue(BaseModel):
     """
@@ -27,6 +54,12 @@ class VectorValue(BaseModel):
 
     TYPE_ID:      ClassVar[str] = "com.inventzia.pulse.data.schemas.common.VectorValue"
     TYPE_VERSION: ClassVar[int] = 1
+    SCHEMA:       ClassVar[str] = "[\"com.inventzia.pulse.data.schemas.common.VectorValue\",1,[[\"key\",\"string\",true],[\"time\",\"integer/int64\",true],[\"values\",\"array<number/decimal>\",true],[\"valueIds\",\"array<string>\",false]]]"
+    """Canonical wire schema (canonical.py), hashed into TypeTable fingerprints"""
+
+    DATUM_KEY_FIELD:  ClassVar[str] = "key"
+    DATUM_TIME_FIELD: ClassVar[str] = "time"
+    """Python fields behind datum_key / datum_time (x-datum-key / x-datum-time)"""
 
     key: str
     """The series or observation-source identifier"""
@@ -54,3 +87,9 @@ class VectorValue(BaseModel):
     @property
     def datum_time(self) -> int:
         return self.time
+
+    # -- Pickling ---------------------------------------------------------
+
+    def __reduce__(self):
+        # The field values only: no field names, and no revalidation on load.
+        return _restore, (type(self), tuple(self.__dict__.values()))
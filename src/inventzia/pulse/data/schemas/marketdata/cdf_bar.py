@@ -18,6 +18,53 @@ from decimal import Decimal
 from pydantic import AwareDatetime, BaseModel, ConfigDict, Field
 from typing import ClassVar, Optional
 
+_FIELDS = ("symb", "timestamp", "op", "hi", "lo", "cl", "vlm", "datetime", "date", "vwap", "count", "expiry", "strike", "sym_exp")
+"""Field names in declaration order: the layout of a pickled instance."""
+
+
+def _restore(model_class: type, values: tuple):
+    """An instance from already-valid field values in _FIELDS order, without validation.
+
+    Unpickling and the package's bulk constructors (DatumBlock, HeartBeatClock) build
+    instances here; the literal dict and set beat dict(zip(_FIELDS, values)).
+    """
+    datum = model_class.__new__(model_class)
+    object.__setattr__(datum, "__dict__", {
+        "symb": values[0],
+        "timestamp": values[1],
+        "op": values[2],
+        "hi": values[3],
+        "lo": values[4],
+        "cl": values[5],
+        "vlm": values[6],
+        "datetime": values[7],
+        "date": values[8],
+        "vwap": values[9],
+        "count": values[10],
+        "expiry": values[11],
+        "strike": values[12],
+        "sym_exp": values[13],
+    })
+    object.__setattr__(datum, "__pydantic_fields_set__", {
+        "symb",
+        "timestamp",
+        "op",
+        "hi",
+        "lo",
+        "cl",
+        "vlm",
+        "datetime",
+        "date",
+        "vwap",
+        "count",
+        "expiry",
+        "strike",
+        "sym_exp",
+    })
+    object.__setattr__(datum, "__pydantic_extra__", None)
+    object.__setattr__(datum, "__pydantic_private__", None)
+    return datum
+
 
 class CdfBar(BaseModel):
     """
@@ -28,6 +75,12 @@ class CdfBar(BaseModel):
 
     TYPE_ID:      ClassVar[str] = "com.inventzia.pulse.data.schemas.marketdata.CdfBar"
     TYPE_VERSION: ClassVar[int] = 1
+    SCHEMA:       ClassVar[str] = "[\"com.inventzia.pulse.data.schemas.marketdata.CdfBar\",1,[[\"symb\",\"string\",true],[\"timestamp\",\"integer/int64\",true],[\"op\",\"number/decimal\",true],[\"hi\",\"number/decimal\",true],[\"lo\",\"number/decimal\",true],[\"cl\",\"number/decimal\",true],[\"vlm\",\"number/decimal\",true],[\"vwap\",\"number/decimal\",false],[\"datetime\",\"string/date-time\",true],[\"count\",\"integer\",false],[\"date\",\"string/date\",true],[\"expiry\",\"string\",false],[\"strike\",\"number/decimal\",false],[\"symExp\",\"string\",false]]]"
+    """Canonical wire schema (canonical.py), hashed into TypeTable fingerprints"""
+
+    DATUM_KEY_FIELD:  ClassVar[str] = "symb"
+    DATUM_TIME_FIELD: ClassVar[str] = "timestamp"
+    """Python fields behind datum_key / datum_time (x-datum-key / x-datum-time)"""
 
     symb: str
     """Instrument symbol or identifier"""
@@ -68,3 +121,9 @@ class CdfBar(BaseModel):
     @property
     def datum_time(self) -> int:
         return self.timestamp
+
+    # -- Pickling ---------------------------------------------------------
+
+    def __reduce__(self):
+        # The field values only: no field names, and no revalidation on load.
+        return _restore, (type(self), tuple(self.__dict__.values()))
@@ -16,6 +16,29 @@ from __future__ import annotations
 from pydantic import BaseModel, ConfigDict, Field
 from typing import ClassVar, Optional
 
+_FIELDS = ("beat_key", "beat_time")
+"""Field names in declaration order: the layout of a pickled instance."""
+
+
+def _restore(model_class: type, values: tuple):
+    """An instance from already-valid field values in _FIELDS order, without validation.
+
+    Unpickling and the package's bulk constructors (DatumBlock, HeartBeatClock) build
+    instances here; the literal dict and set beat dict(zip(_FIELDS, values)).
+    """
+    datum = model_class.__new__(model_class)
+    object.__setattr__(datum, "__dict__", {
+        "beat_key": values[0],
+        "beat_time": values[1],
+    })
+    object.__setattr__(datum, "__pydantic_fields_set__", {
+        "beat_key",
+        "beat_time",
+    })
+    object.__setattr__(datum, "__pydantic_extra__", None)
+    object.__setattr__(datum, "__pydantic_private__", None)
+    return datum
+
 
 class HeartBeat(BaseModel):
     """
@@ -26,6 +49,12 @@ class HeartBeat(BaseModel):
 
     TYPE_ID:      ClassVar[str] = "com.inventzia.pulse.data.schemas.platform.HeartBeat"
     TYPE_VERSION: ClassVar[int] = 1
+    SCHEMA:       ClassVar[str] = "[\"com.inventzia.pulse.data.schemas.platform.HeartBeat\",1,[[\"beatKey\",\"string\",true],[\"beatTime\",\"integer/int64\",true]]]"
+    """Canonical wire schema (canonical.py), hashed into TypeTable fingerprints"""
+
+    DATUM_KEY_FIELD:  ClassVar[str] = "beat_key"
+    DATUM_TIME_FIELD: ClassVar[str] = "beat_time"
+    """Python fields behind datum_key / datum_time (x-datum-key / x-datum-time)"""
 
     beat_key: str = Field(alias="beatKey")
     """Heartbeat identifier. Typically a fixed label (e.g. "PERIODIC") or a group key when multiple independent heartbeat streams are needed"""
@@ -41,3 +70,9 @@ class HeartBeat(BaseModel):
     @property
     def datum_time(self) -> int:
         return self.beat_time
+
+    # -- Pickling ---------------------------------------------------------
+
+    def __reduce__(self):
+        # The field values only: no field names, and no revalidation on load.
+        return _restore, (type(self), tuple(self.__dict__.values()))
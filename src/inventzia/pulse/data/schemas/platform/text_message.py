@@ -16,6 +16,31 @@ from __future__ import annotations
 from pydantic import BaseModel, ConfigDict, Field
 from typing import ClassVar, Optional
 
+_FIELDS = ("msg_key", "msg_time", "text")
+"""Field names in declaration order: the layout of a pickled instance."""
+
+
+def _restore(model_class: type, values: tuple):
+    """An instance from already-valid field values in _FIELDS order, without validation.
+
+    Unpickling and the package's bulk constructors (DatumBlock, HeartBeatClock) build
+    instances here; the literal dict and set beat dict(zip(_FIELDS, values)).
+    """
+    datum = model_class.__new__(model_class)
+    object.__setattr__(datum, "__dict__", {
+        "msg_key": values[0],
+        "msg_time": values[1],
+        "text": values[2],
+    })
+    object.__setattr__(datum, "__pydantic_fields_set__", {
+        "msg_key",
+        "msg_time",
+        "text",
+    })
+    object.__setattr__(datum, "__pydantic_extra__", None)
+    object.__setattr__(datum, "__pydantic_private__", None)
+    return datum
+
 
 class TextMessage(BaseModel):
     """
@@ -26,6 +51,12 @@ class TextMessage(BaseModel):
 
     TYPE_ID:      ClassVar[str] = "com.inventzia.pulse.data.schemas.platform.TextMessage"
     TYPE_VERSION: ClassVar[int] = 1
+    SCHEMA:       ClassVar[str] = "[\"com.inventzia.pulse.data.schemas.platform.TextMessage\",1,[[\"msgKey\",\"string\",true],[\"msgTime\",\"integer/int64\",true],[\"text\",\"string\",true]]]"
+    """Canonical wire schema (canonical.py), hashed into TypeTable fingerprints"""
+
+    DATUM_KEY_FIELD:  ClassVar[str] = "msg_key"
+    DATUM_TIME_FIELD: ClassVar[str] = "msg_time"
+    """Python fields behind datum_key / datum_time (x-datum-key / x-datum-time)"""
 
     msg_key: str = Field(alias="msgKey")
     """Routing key for this message — e.g. a channel, source identifier, or logical stream name"""
@@ -43,3 +74,9 @@ class TextMessage(BaseModel):
     @property
     def datum_time(self) -> int:
         return self.msg_time
+
+    # -- Pickling ---------------------------------------------------------
+
+    def __reduce__(self):
+        # The field values only: no field names, and no revalidation on load.
+        return _restore, (type(self), tuple(self.__dict__.values()))
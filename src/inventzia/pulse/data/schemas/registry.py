@@ -36,6 +36,14 @@ def class_for(type_id: str) -> type:
         raise KeyError(f"Unknown TYPE_ID: {type_id!r}") from None
 
 
+def class_for_name(name: str) -> type:
+    """Return the model class registered under a TYPE_ID or a class name (command-line lookups)."""
+    for type_id, model_class in REGISTRY.items():
+        if name in (type_id, model_class.__name__):
+            return model_class
+    raise KeyError(f"Unknown type {name!r}; registered: {sorted(c.__name__ for c in REGISTRY.values())}")
+
+
 def type_id_of(datum) -> str:
     """Return the TYPE_ID of a datum instance."""
     return type(datum).TYPE_ID
@@ -0,0 +1,50 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later OR LicenseRef-Inventzia-Commercial
+# Copyright (c) 2013-2026 Magrino Bini, Paola Apruzzese, Inventzia Science and Technology Ltd.
+#
+# This file is part of pulse-data.
+#
+# pulse-data is dual-licensed:
+#   - Under the GNU Affero General Public License v3.0 or later (see LICENSE-AGPL-3.0).
+#   - Under a commercial license (see LICENSE-COMMERCIAL.txt).
+#     Contact operations@inventzia.com.
+"""Incremental operators over streams of datums.
+
+Each operator consumes datums one at a time, keeps O(keys) state, and is driven
+purely by the ``Datum`` contract (``datum_key`` / ``datum_time``) plus the fields
+of the types it specialises in. Standard library only — no extra needed::
+
+    from inventzia.pulse.data.stream import BarResampler
+"""
+
+from inventzia.pulse.data.stream.conflate import ConflatingQueue
+from inventzia.pulse.data.stream.heartbeat import HeartBeatClock
+from inventzia.pulse.data.stream.indicators import (
+    Ema,
+    Indicator,
+    IndicatorEngine,
+    Macd,
+    RollingMean,
+    RollingVariance,
+    Vwap,
+)
+from inventzia.pulse.data.stream.last_value import LastValueCache
+from inventzia.pulse.data.stream.reorder import ReorderBuffer
+from inventzia.pulse.data.stream.resample import BarResampler, window_start
+from inventzia.pulse.data.stream.series import TimeSeriesIndex
+
+__all__ = [
+    "BarResampler",
+    "HeartBeatClock",
+    "ReorderBuffer",
+    "window_start",
+    "IndicatorEngine",
+    "Indicator",
+    "Ema",
+    "Macd",
+    "RollingMean",
+    "RollingVariance",
+    "Vwap",
+    "LastValueCache",
+    "ConflatingQueue",
+    "TimeSeriesIndex",
+]
@@ -0,0 +1,103 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later OR LicenseRef-Inventzia-Commercial
+# Copyright (c) 2013-2026 Magrino Bini, Paola Apruzzese, Inventzia Science and Technology Ltd.
+#
+# This file is part of pulse-data.
+#
+# pulse-data is dual-licensed:
+#   - Under the GNU Affero General Public License v3.0 or later (see LICENSE-AGPL-3.0).
+#   - Under a commercial license (see LICENSE-COMMERCIAL.txt).
+#     Contact operations@inventzia.com.
+"""
+A conflating delivery queue: at most one pending datum per key.
+
+Between a fast feed and a slow consumer, a plain queue grows without bound and
+delivers ever staler data. A :class:`ConflatingQueue` holds at most one pending
+datum per ``(TYPE_ID, datum_key)``: a datum for a key that is already waiting
+is combined with it by a per-type ``merge`` function or, without one, the one
+with the later ``datum_time`` is kept (the arriving one on a tie). Memory is
+bounded by the number of keys and the consumer always receives the freshest
+state::
+
+    queue = ConflatingQueue(merge={CdfBar: merge_bars})
+    # producer thread
+    for datum in feed:
+        queue.put(datum)
+    # consumer thread
+    while True:
+        datum = queue.get()
+
+Keys are delivered in FIFO order of their *first* pending update — a key that
+keeps updating keeps its place in line rather than starving the others. A
+datum replaced or dropped before delivery is counted in :attr:`conflated`;
+:attr:`conflation_ratio` is the fraction of input that was never delivered on
+its own. ``put`` and ``get`` are O(1) and thread-safe.
+"""
+
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Mapping
+
+
+class ConflatingQueue:
+    """At most one pending datum per ``(TYPE_ID, datum_key)``, delivered FIFO by key.
+
+    ``merge`` maps a model class or ``TYPE_ID`` to ``f(pending, newer) -> datum``;
+    types without one keep whichever datum has the later ``datum_time``.
+    """
+
+    def __init__(self, merge: Mapping[type | str, Callable] | None = None):
+        self._merge = {(m if isinstance(m, str) else m.TYPE_ID): f for m, f in (merge or {}).items()}
+        self._pending: OrderedDict[tuple[str, str], object] = OrderedDict()
+        self._ready = threading.Condition(threading.Lock())
+        self.received = 0
+        self.delivered = 0
+        self.conflated = 0
+        self.high_water = 0
+
+    def __len__(self) -> int:
+        """Number of keys with a pending datum."""
+        return len(self._pending)
+
+    @property
+    def conflation_ratio(self) -> float:
+        """Fraction of received datums that were conflated away (0.0 before any input)."""
+        return self.conflated / self.received if self.received else 0.0
+
+    def put(self, datum) -> None:
+        """Enqueue ``datum``, conflating it with its key's pending datum if there is one."""
+        type_id = type(datum).TYPE_ID
+        key = (type_id, datum.datum_key)
+        with self._ready:
+            self.received += 1
+            pending = self._pending.get(key)
+            if pending is None:
+                self._pending[key] = datum
+                if len(self._pending) > self.high_water:
+                    self.high_water = len(self._pending)
+                self._ready.notify()
+                return
+            merge = self._merge.get(type_id)
+            if merge is not None:
+                self._pending[key] = merge(pending, datum)
+            elif datum.datum_time >= pending.datum_time:
+                self._pending[key] = datum
+            self.conflated += 1             # one of the two is never delivered on its own
+
+    def get(self, timeout: float | None = None):
+        """The oldest pending key's datum, waiting up to ``timeout`` seconds (None: forever).
+
+        Raises ``TimeoutError`` if nothing arrives in time.
+        """
+        with self._ready:
+            if not self._ready.wait_for(lambda: self._pending, timeout):
+                raise TimeoutError("no datum pending")
+            self.delivered += 1
+            return self._pending.popitem(last=False)[1]
+
+    def drain(self, limit: int | None = None) -> list:
+        """Take up to ``limit`` pending datums (all if None) without waiting, oldest key first."""
+        with self._ready:
+            n = len(self._pending) if limit is None else min(limit, len(self._pending))
+            out = [self._pending.popitem(last=False)[1] for _ in range(n)]
+            self.delivered += n
+            return out
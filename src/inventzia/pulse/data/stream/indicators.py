@@ -0,0 +1,301 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later OR LicenseRef-Inventzia-Commercial
+# Copyright (c) 2013-2026 Magrino Bini, Paola Apruzzese, Inventzia Science and Technology Ltd.
+#
+# This file is part of pulse-data.
+#
+# pulse-data is dual-licensed:
+#   - Under the GNU Affero General Public License v3.0 or later (see LICENSE-AGPL-3.0).
+#   - Under a commercial license (see LICENSE-COMMERCIAL.txt).
+#     Contact operations@inventzia.com.
+"""
+Incremental technical indicators over :class:`CdfBar` streams.
+
+An :class:`IndicatorEngine` runs a set of indicators over a multi-symbol bar
+stream, with O(1) state per symbol and indicator (plus the window for rolling
+ones), and emits each result as a :class:`VectorValue`::
+
+    engine = IndicatorEngine([Ema(20), Macd(), RollingVariance(50), Vwap()])
+    for bar in bars:
+        for value in engine.update(bar):      # key "ES.macd", value_ids ("macd", "signal", "histogram")
+            ...
+
+=======================  ==============  ==========================================
+indicator                ``value_ids``   definition (``x``: the ``field``, ``cl`` by default)
+=======================  ==============  ==========================================
+``Ema(n)``               ``ema``         ``e += 2 / (n + 1) * (x - e)``, seeded with the first ``x``
+``Macd(f, s, g)``        ``macd``,       ``ema_f - ema_s``; its ``ema_g``;
+                         ``signal``,     their difference
+                         ``histogram``
+``RollingMean(n)``       ``mean``        mean of the last ``n`` bars
+``RollingVariance(n)``   ``mean``,       mean and sample variance of the last ``n`` bars
+                         ``variance``
+``Vwap()``               ``vwap``        session VWAP: ``sum(p * vlm) / sum(vlm)`` since the bar
+                                         ``date`` last changed, ``p`` the bar ``vwap`` if present,
+                                         else ``(hi + lo + cl) / 3``
+=======================  ==============  ==========================================
+
+Each output is keyed ``"<symb>.<indicator name>"`` (``ES.ema20``), timed at the
+bar's ``timestamp``, and shares its indicator's one ``value_ids`` tuple. Rolling
+indicators emit once their window is full; VWAP once the session has traded.
+Bars must arrive in time order per symbol (see
+:class:`~inventzia.pulse.data.stream.reorder.ReorderBuffer`); an older bar is
+dropped and counted in :attr:`IndicatorEngine.late`.
+
+Arithmetic is ``float``. Every indicator is written as update *kernels* that
+use only ``+ - * /`` and a ``where`` selection, so the same code runs on Python
+floats here and on NumPy arrays — one element per symbol — in the vectorised
+backfill :func:`inventzia.pulse.data.columnar.indicators.indicators_batch`,
+which therefore produces bit-identical values.
+"""
+
+import math
+from abc import ABC, abstractmethod
+from collections import deque
+from collections.abc import Callable, Sequence
+from datetime import date
+from decimal import Decimal
+
+from inventzia.pulse.data.schemas.common.vector_value import VectorValue
+from inventzia.pulse.data.schemas.marketdata.cdf_bar import CdfBar
+
+_NAN = float("nan")
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+
+def _where(condition, if_true, if_false):
+    return if_true if condition else if_false
+
+
+def _to_decimal(value: float) -> Decimal:
+    # As columnar.decimals.from_float (the shortest round-tripping decimal),
+    # which this standard-library package cannot import.
+    text = repr(value)
+    return Decimal(text[:-2] if text.endswith(".0") else text)
+
+
+class Indicator(ABC):
+    """One indicator, as kernels over a tuple of float state.
+
+    ``fields`` are the :class:`CdfBar` attributes read per bar, as floats
+    (``NaN`` when absent; ``date`` as days since the epoch). ``window`` is the
+    number of bars whose inputs must be kept to be handed back, as ``old``, when
+    they leave the window. ``warmup`` is the bar count before the first output.
+    """
+
+    name: str
+    value_ids: tuple[str, ...]
+    fields: tuple[str, ...] = ("cl",)
+    window: int = 0
+    warmup: int = 1
+
+    @abstractmethod
+    def step(self, state: tuple | None, x: tuple, old: tuple | None, n: int,
+             where: Callable) -> tuple:
+        """The state after the ``n``-th bar (``state`` is ``None`` for the first)."""
+
+    @abstractmethod
+    def value(self, state: tuple, n: int, where: Callable) -> tuple:
+        """The output components for ``state``; a ``NaN`` component suppresses the output."""
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.name!r})"
+
+
+class Ema(Indicator):
+    """Exponential moving average of ``field`` over ``period`` bars."""
+
+    value_ids = ("ema",)
+
+    def __init__(self, period: int, *, field: str = "cl", name: str | None = None):
+        if period <= 0:
+            raise ValueError(f"period must be positive, got {period}")
+        self.alpha = 2 / (period + 1)
+        self.fields = (field,)
+        self.name = name or f"ema{period}"
+
+    def step(self, state, x, old, n, where):
+        if n == 1:
+            return x
+        (ema,), (price,) = state, x
+        return (ema + self.alpha * (price - ema),)
+
+    def value(self, state, n, where):
+        return state
+
+
+class Macd(Indicator):
+    """MACD line, its signal line and their difference (the histogram)."""
+
+    value_ids = ("macd", "signal", "histogram")
+
+    def __init__(self, fast: int = 12, slow: int = 26, signal: int = 9, *, field: str = "cl",
+                 name: str = "macd"):
+        if not 0 < fast < slow or signal <= 0:
+            raise ValueError(f"need 0 < fast < slow and signal > 0, got {fast}, {slow}, {signal}")
+        self.alphas = (2 / (fast + 1), 2 / (slow + 1), 2 / (signal + 1))
+        self.fields = (field,)
+        self.name = name
+
+    def step(self, state, x, old, n, where):
+        (price,) = x
+        if n == 1:
+            return price, price, price - price
+        fast, slow, signal = state
+        a_fast, a_slow, a_signal = self.alphas
+        fast = fast + a_fast * (price - fast)
+        slow = slow + a_slow * (price - slow)
+        macd = fast - slow
+        return fast, slow, signal + a_signal * (macd - signal)
+
+    def value(self, state, n, where):
+        fast, slow, signal = state
+        macd = fast - slow
+        return macd, signal, macd - signal
+
+
+class RollingMean(Indicator):
+    """Mean of ``field`` over the last ``window`` bars."""
+
+    value_ids = ("mean",)
+
+    def __init__(self, window: int, *, field: str = "cl", name: str | None = None):
+        if window <= 0:
+            raise ValueError(f"window must be positive, got {window}")
+        self.window = self.warmup = window
+        self.fields = (field,)
+        self.name = name or f"mean{window}"
+
+    def step(self, state, x, old, n, where):
+        (price,) = x
+        if n == 1:
+            return x
+        (mean,) = state
+        if old is None:
+            return (mean + (price - mean) / n,)
+        return (mean + (price - old[0]) / self.window,)
+
+    def value(self, state, n, where):
+        return state
+
+
+class RollingVariance(Indicator):
+    """Mean and sample variance of ``field`` over the last ``window`` bars (Welford)."""
+
+    value_ids = ("mean", "variance")
+
+    def __init__(self, window: int, *, field: str = "cl", name: str | None = None):
+        if window < 2:
+            raise ValueError(f"window must be at least 2, got {window}")
+        self.window = self.warmup = window
+        self.fields = (field,)
+        self.name = name or f"var{window}"
+
+    def step(self, state, x, old, n, where):
+        (price,) = x
+        if n == 1:
+            return price, price - price
+        mean, m2 = state
+        if old is None:
+            delta = price - mean
+            mean = mean + delta / n
+            return mean, m2 + delta * (price - mean)
+        leaving = old[0]
+        new_mean = mean + (price - leaving) / self.window
+        return new_mean, m2 + (price - leaving) * (price - new_mean + leaving - mean)
+
+    def value(self, state, n, where):
+        mean, m2 = state
+        return mean, where(m2 > 0, m2, 0.0) / (self.window - 1)
+
+
+class Vwap(Indicator):
+    """Volume-weighted average price since the start of the bar's trading ``date``."""
+
+    value_ids = ("vwap",)
+    fields = ("hi", "lo", "cl", "vlm", "vwap", "date")
+
+    def __init__(self, *, name: str = "vwap"):
+        self.name = name
+
+    def step(self, state, x, old, n, where):
+        hi, lo, cl, vlm, bar_vwap, day = x
+        price = where(bar_vwap != bar_vwap, (hi + lo + cl) / 3, bar_vwap)   # NaN: no bar vwap
+        if n == 1:
+            return day, price * vlm, vlm
+        session, pv, volume = state
+        new_session = day != session
+        return (day, where(new_session, price * vlm, pv + price * vlm),
+                where(new_session, vlm, volume + vlm))
+
+    def value(self, state, n, where):
+        _, pv, volume = state
+        traded = volume != 0
+        return (where(traded, pv / where(traded, volume, 1.0), _NAN),)
+
+
+def bar_input(bar: CdfBar, field: str) -> float:
+    """The float an indicator reads for one bar field (see :class:`Indicator`)."""
+    value = getattr(bar, field)
+    if value is None:
+        return _NAN
+    if field == "date":
+        return float(value.toordinal() - _EPOCH_ORDINAL)      # days since 1970-01-01
+    return float(value)
+
+
+class _Series:
+    """One symbol's state for one indicator."""
+
+    __slots__ = ("state", "n", "history")
+
+    def __init__(self, window: int):
+        self.state = None
+        self.n = 0
+        self.history = deque(maxlen=window) if window else None
+
+
+class IndicatorEngine:
+    """Runs ``indicators`` over a multi-symbol :class:`CdfBar` stream (see the module docstring)."""
+
+    def __init__(self, indicators: Sequence[Indicator]):
+        names = [indicator.name for indicator in indicators]
+        if len(set(names)) != len(names):
+            raise ValueError(f"indicator names must be unique, got {names}")
+        self.indicators = tuple(indicators)
+        self.late = 0
+        self._series: dict[str, list[_Series]] = {}
+        self._last: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        """Number of symbols seen."""
+        return len(self._series)
+
+    def update(self, bar: CdfBar) -> list[VectorValue]:
+        """Feed one bar; return one value per indicator that has an output for it."""
+        symb = bar.symb
+        series = self._series.get(symb)
+        if series is None:
+            series = self._series[symb] = [_Series(ind.window) for ind in self.indicators]
+        elif bar.timestamp < self._last[symb]:
+            self.late += 1
+            return []
+        self._last[symb] = bar.timestamp
+        out: list[VectorValue] = []
+        for indicator, s in zip(self.indicators, series):
+            x = tuple(bar_input(bar, field) for field in indicator.fields)
+            old = None
+            if s.history is not None:
+                if len(s.history) == indicator.window:
+                    old = s.history[0]
+                s.history.append(x)
+            s.n += 1
+            s.state = indicator.step(s.state, x, old, s.n, _where)
+            if s.n < indicator.warmup:
+                continue
+            values = indicator.value(s.state, s.n, _where)
+            if any(math.isnan(v) for v in values):
+                continue
+            out.append(VectorValue.model_construct(
+                key=f"{symb}.{indicator.name}", time=bar.timestamp,
+                values=tuple(map(_to_decimal, values)), value_ids=indicator.value_ids))
+        return out
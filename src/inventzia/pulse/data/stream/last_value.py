@@ -0,0 +1,122 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later OR LicenseRef-Inventzia-Commercial
+# Copyright (c) 2013-2026 Magrino Bini, Paola Apruzzese, Inventzia Science and Technology Ltd.
+#
+# This file is part of pulse-data.
+#
+# pulse-data is dual-licensed:
+#   - Under the GNU Affero General Public License v3.0 or later (see LICENSE-AGPL-3.0).
+#   - Under a commercial license (see LICENSE-COMMERCIAL.txt).
+#     Contact operations@inventzia.com.
+"""
+The latest datum per ``(TYPE_ID, datum_key)``, for snapshots and late joiners.
+
+A :class:`LastValueCache` follows a feed of any datum types and keeps the most
+recent datum of every key, with O(1) update and lookup::
+
+    cache = LastValueCache()
+    for message in feed:
+        cache.update(from_tagged_json(message), message)   # keep the bytes we already have
+
+    cache.get(CdfBar, "ES")                  # latest ES bar, or None
+    cache.export(sock_file, CdfBar)          # NDJSON snapshot of every bar key
+
+The cache only moves forward: a datum older (by ``datum_time``) than the one it
+holds for its key is ignored and counted in :attr:`stale`; one at the same time
+replaces it, so a correction wins. Each entry keeps its tagged-JSON encoding
+next to the object — the message it arrived as, when given, else encoded once on
+first use — so serving a snapshot writes stored bytes and never re-encodes.
+"""
+
+from collections.abc import Iterator
+from typing import BinaryIO
+
+from inventzia.pulse.data.datum.codec import to_tagged_json
+
+
+def _type_id(model: type | str) -> str:
+    return model if isinstance(model, str) else model.TYPE_ID
+
+
+class _Entry:
+    __slots__ = ("datum", "time", "encoded")
+
+    def __init__(self, datum, time: int, encoded: bytes | None):
+        self.datum = datum
+        self.time = time
+        self.encoded = encoded
+
+
+class LastValueCache:
+    """Latest datum and its tagged-JSON bytes per ``(TYPE_ID, datum_key)``.
+
+    Lookups take the model class or its ``TYPE_ID`` string.
+    """
+
+    def __init__(self):
+        self.stale = 0
+        self._entries: dict[tuple[str, str], _Entry] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, type_and_key: tuple) -> bool:
+        model, key = type_and_key
+        return (_type_id(model), key) in self._entries
+
+    def update(self, datum, encoded: str | bytes | None = None) -> bool:
+        """Record ``datum`` (``encoded``: its tagged JSON, if at hand); False if it was stale."""
+        key = (type(datum).TYPE_ID, datum.datum_key)
+        time = datum.datum_time
+        entry = self._entries.get(key)
+        if isinstance(encoded, str):
+            encoded = encoded.encode("utf-8")
+        if entry is None:
+            self._entries[key] = _Entry(datum, time, encoded)
+            return True
+        if time < entry.time:
+            self.stale += 1
+            return False
+        entry.datum, entry.time, entry.encoded = datum, time, encoded
+        return True
+
+    def get(self, model: type | str, key: str, default=None):
+        """The latest datum of ``model`` for ``key``, or ``default``."""
+        entry = self._entries.get((_type_id(model), key))
+        return default if entry is None else entry.datum
+
+    def get_encoded(self, model: type | str, key: str) -> bytes | None:
+        """The latest datum's tagged JSON (UTF-8, no newline), or None."""
+        entry = self._entries.get((_type_id(model), key))
+        return None if entry is None else self._encoded(entry)
+
+    def discard(self, model: type | str, key: str) -> None:
+        """Forget a key, e.g. an expired instrument."""
+        self._entries.pop((_type_id(model), key), None)
+
+    # -- Snapshots ------------------------------------------------------------
+
+    def items(self, model: type | str | None = None) -> Iterator[tuple[tuple[str, str], object]]:
+        """``((TYPE_ID, datum_key), datum)`` pairs, of one type or all."""
+        type_id = None if model is None else _type_id(model)
+        for key, entry in list(self._entries.items()):
+            if type_id is None or key[0] == type_id:
+                yield key, entry.datum
+
+    def snapshot(self, model: type | str | None = None) -> list:
+        """The latest datum of every key, of one type or all."""
+        return [datum for _, datum in self.items(model)]
+
+    def export(self, out: BinaryIO, model: type | str | None = None) -> int:
+        """Write every entry (of one type or all) to ``out`` as NDJSON; return the count."""
+        type_id = None if model is None else _type_id(model)
+        lines = [self._encoded(entry) for key, entry in list(self._entries.items())
+                 if type_id is None or key[0] == type_id]
+        if lines:
+            out.write(b"\n".join(lines) + b"\n")
+        return len(lines)
+
+    @staticmethod
+    def _encoded(entry: _Entry) -> bytes:
+        if entry.encoded is None:
+            entry.encoded = to_tagged_json(entry.datum).encode("utf-8")
+        return entry.encoded
@@ -0,0 +1,133 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later OR LicenseRef-Inventzia-Commercial
+# Copyright (c) 2013-2026 Magrino Bini, Paola Apruzzese, Inventzia Science and Technology Ltd.
+#
+# This file is part of pulse-data.
+#
+# pulse-data is dual-licensed:
+#   - Under the GNU Affero General Public License v3.0 or later (see LICENSE-AGPL-3.0).
+#   - Under a commercial license (see LICENSE-COMMERCIAL.txt).
+#     Contact operations@inventzia.com.
+"""
+Reordering and de-duplication of datum streams behind a watermark.
+
+A :class:`ReorderBuffer` accepts datums of any type in arrival order and emits
+them in ``datum_time`` order. It holds each datum until the *watermark* — the
+highest ``datum_time`` seen, minus ``lateness_ms`` — passes it::
+
+    buffer = ReorderBuffer(lateness_ms=500)
+    for datum in feed:
+        for ordered in buffer.update(datum):
+            ...
+    remaining = buffer.flush()
+
+Datums below the watermark when they arrive are *late*: emitting them would
+break the order, so they are dropped and counted in :attr:`late`. A datum *at*
+the watermark — exactly ``lateness_ms`` behind the newest, or tied with what was
+just emitted — is still in order and is accepted. Exact
+duplicates — the same ``(TYPE_ID, datum_key, datum_time)`` — are dropped and
+counted in :attr:`duplicates`; the first copy wins.
+
+Memory is bounded by what can still be reordered: the pending datums, and the
+duplicate keys of times not below the watermark (older keys are forgotten,
+since anything that old is rejected as late anyway). That is O(input rate ×
+``lateness_ms``). ``max_pending`` caps it under bursts: beyond it the oldest
+pending datums are emitted early, advancing the watermark (counted in
+:attr:`forced`).
+"""
+
+import heapq
+
+_NO_WATERMARK = -(1 << 63)
+
+
+class ReorderBuffer:
+    """Emits datums in ``datum_time`` order once the watermark passes them.
+
+    Equal times are emitted in arrival order. :meth:`advance` moves the
+    watermark without a datum — drive it with wall-clock or heartbeat time so a
+    quiet feed still drains.
+    """
+
+    def __init__(self, lateness_ms: int, *, max_pending: int | None = None):
+        if lateness_ms < 0:
+            raise ValueError(f"lateness_ms must be non-negative, got {lateness_ms}")
+        self.lateness_ms = lateness_ms
+        self.max_pending = max_pending
+        self.late = 0
+        self.duplicates = 0
+        self.forced = 0
+        self._pending: list[tuple[int, int, object]] = []     # (time, arrival seq, datum)
+        self._seq = 0
+        self._seen: dict[int, set[tuple[str, str]]] = {}       # time -> (TYPE_ID, key) pending or emitted
+        self._seen_times: list[int] = []                       # heap of the times in _seen
+        self._max_time = _NO_WATERMARK
+        self._watermark = _NO_WATERMARK                         # everything below was emitted
+
+    @property
+    def watermark(self) -> int | None:
+        """Time up to which the stream has been emitted (``None`` before the first emission)."""
+        return None if self._watermark == _NO_WATERMARK else self._watermark
+
+    def __len__(self) -> int:
+        """Number of pending datums."""
+        return len(self._pending)
+
+    def update(self, datum) -> list:
+        """Accept one datum; return the datums the new watermark releases, in order."""
+        time = datum.datum_time
+        if time < self._watermark:
+            self.late += 1
+            return []
+        key = (type(datum).TYPE_ID, datum.datum_key)
+        seen = self._seen.get(time)
+        if seen is None:
+            seen = self._seen[time] = set()
+            heapq.heappush(self._seen_times, time)
+        elif key in seen:
+            self.duplicates += 1
+            return []
+        seen.add(key)
+        heapq.heappush(self._pending, (time, self._seq, datum))
+        self._seq += 1
+        if time > self._max_time:
+            self._max_time = time
+        released = self._release(self._max_time - self.lateness_ms)
+        if self.max_pending is not None and len(self._pending) > self.max_pending:
+            self.forced += len(self._pending) - self.max_pending
+            released.extend(self._release_oldest(len(self._pending) - self.max_pending))
+        return released
+
+    def advance(self, time: int) -> list:
+        """Move the watermark to at least ``time - lateness_ms``; return what it releases."""
+        if time > self._max_time:
+            self._max_time = time
+        return self._release(self._max_time - self.lateness_ms)
+
+    def flush(self) -> list:
+        """Emit every pending datum (e.g. at the end of a replay)."""
+        return self._release_oldest(len(self._pending))
+
+    def _release(self, watermark: int) -> list:
+        pending = self._pending
+        released = []
+        while pending and pending[0][0] <= watermark:
+            released.append(heapq.heappop(pending)[2])
+        if watermark > self._watermark:
+            self._set_watermark(watermark)
+        return released
+
+    def _release_oldest(self, n: int) -> list:
+        pending = self._pending
+        released = []
+        for _ in range(n):
+            time, _, datum = heapq.heappop(pending)
+            released.append(datum)
+            if time > self._watermark:
+                self._set_watermark(time)
+        return released
+
+    def _set_watermark(self, watermark: int) -> None:
+        self._watermark = watermark
+        seen, times = self._seen, self._seen_times
+        while times and times[0] < watermark:       # keys at the watermark can still repeat
+            del seen[heapq.heappop(times)]
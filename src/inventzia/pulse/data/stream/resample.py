@@ -0,0 +1,176 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later OR LicenseRef-Inventzia-Commercial
+# Copyright (c) 2013-2026 Magrino Bini, Paola Apruzzese, Inventzia Science and Technology Ltd.
+#
+# This file is part of pulse-data.
+#
+# pulse-data is dual-licensed:
+#   - Under the GNU Affero General Public License v3.0 or later (see LICENSE-AGPL-3.0).
+#   - Under a commercial license (see LICENSE-COMMERCIAL.txt).
+#     Contact operations@inventzia.com.
+"""
+Incremental resampling of :class:`CdfBar` streams into coarser bars.
+
+Windows are a fixed grid in epoch milliseconds: a bar belongs to the window
+starting at :func:`window_start` of its ``timestamp``, and the output bar's
+``timestamp`` / ``datetime`` are that window start (a bar's time is its open
+time). ``offset_ms`` shifts the grid, e.g. to start daily windows at a session
+boundary other than UTC midnight; a fixed grid does not follow DST changes.
+
+Aggregation, per symbol and window:
+
+=========  ===================================================================
+``op``     open of the first bar
+``hi``     highest ``hi``
+``lo``     lowest ``lo``
+``cl``     close of the last bar
+``vlm``    sum of ``vlm``
+``vwap``   ``sum(vwap * vlm) / sum(vlm)``; absent if any input lacks ``vwap``
+           or the window traded no volume
+``count``  sum of ``count``; absent if any input lacks it
+others     ``date``, ``expiry``, ``strike``, ``symExp`` of the first bar
+=========  ===================================================================
+
+The vectorised batch counterpart over a columnar batch is
+:func:`inventzia.pulse.data.columnar.resample.resample_batch`; it aggregates the
+same way, with ``vwap`` computed in ``float64`` instead of ``Decimal``.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+from inventzia.pulse.data.schemas.marketdata.cdf_bar import CdfBar
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def window_start(time: int, period_ms: int, offset_ms: int = 0) -> int:
+    """Start of the ``period_ms`` grid window containing epoch-millisecond ``time``."""
+    return time - (time - offset_ms) % period_ms
+
+
+class _OpenBar:
+    """Running aggregate of one symbol's current window."""
+
+    __slots__ = ("start", "end", "first", "hi", "lo", "cl", "vlm", "pv", "count")
+
+    def __init__(self, bar: CdfBar, start: int, end: int):
+        self.start = start
+        self.end = end
+        self.first = bar
+        self.hi = bar.hi
+        self.lo = bar.lo
+        self.cl = bar.cl
+        self.vlm = bar.vlm
+        self.pv = None if bar.vwap is None else bar.vwap * bar.vlm
+        self.count = bar.count
+
+    def add(self, bar: CdfBar) -> None:
+        if bar.hi > self.hi:
+            self.hi = bar.hi
+        if bar.lo < self.lo:
+            self.lo = bar.lo
+        self.cl = bar.cl
+        self.vlm += bar.vlm
+        if self.pv is not None:
+            self.pv = None if bar.vwap is None else self.pv + bar.vwap * bar.vlm
+        if self.count is not None:
+            self.count = None if bar.count is None else self.count + bar.count
+
+    def to_bar(self) -> CdfBar:
+        first = self.first
+        return CdfBar.model_construct(
+            symb=first.symb,
+            timestamp=self.start,
+            op=first.op,
+            hi=self.hi,
+            lo=self.lo,
+            cl=self.cl,
+            vlm=self.vlm,
+            datetime=_EPOCH + timedelta(milliseconds=self.start),
+            date=first.date,
+            vwap=self.pv / self.vlm if self.pv is not None and self.vlm else None,
+            count=self.count,
+            expiry=first.expiry,
+            strike=first.strike,
+            sym_exp=first.sym_exp,
+        )
+
+
+class BarResampler:
+    """Rolls a multi-symbol :class:`CdfBar` stream into ``period_ms`` bars.
+
+    State is one running aggregate per symbol with an open window. A window is
+    emitted when it closes, which happens
+
+    * on :meth:`update`, when the symbol's next bar falls in a later window;
+    * on :meth:`update`, as soon as the bar that completes the window arrives, if
+      the input bar length ``input_period_ms`` is known (a 1-minute bar opening at
+      09:04 completes the 09:00–09:05 window) — no waiting for the next bar;
+    * on :meth:`advance`, for every symbol whose window ends at or before the
+      given time — drive it with the ``datum_time`` of the wider stream (another
+      symbol's bars, heartbeats) so quiet symbols still emit on time;
+    * on :meth:`flush`, for everything still open.
+
+    A bar for a window that has already been emitted is late: it is dropped and
+    counted in :attr:`late`.
+    """
+
+    def __init__(self, period_ms: int, *, offset_ms: int = 0, input_period_ms: int | None = None):
+        if period_ms <= 0:
+            raise ValueError(f"period_ms must be positive, got {period_ms}")
+        self.period_ms = period_ms
+        self.offset_ms = offset_ms
+        self.input_period_ms = input_period_ms
+        self.late = 0
+        self._open: dict[str, _OpenBar] = {}
+        self._by_end: dict[int, dict[str, None]] = {}    # window end -> symbols open in it
+        self._emitted: dict[str, int] = {}         # symbol -> start of its last emitted window
+
+    def __len__(self) -> int:
+        """Number of symbols with an open window."""
+        return len(self._open)
+
+    def update(self, bar: CdfBar) -> list[CdfBar]:
+        """Aggregate one input bar; return the bars it closed (usually none)."""
+        symb = bar.symb
+        start = bar.timestamp - (bar.timestamp - self.offset_ms) % self.period_ms
+        closed: list[CdfBar] = []
+        current = self._open.get(symb)
+        last = self._emitted.get(symb)
+        if (current is not None and start < current.start) or (last is not None and start <= last):
+            self.late += 1
+            return closed
+        if current is not None and start == current.start:
+            current.add(bar)
+        else:
+            if current is not None:
+                closed.append(self._close(symb, current))
+            current = self._open[symb] = _OpenBar(bar, start, start + self.period_ms)
+            self._by_end.setdefault(current.end, {})[symb] = None
+        if self.input_period_ms is not None and bar.timestamp + self.input_period_ms >= current.end:
+            closed.append(self._close(symb, current))
+        return closed
+
+    def advance(self, time: int) -> list[CdfBar]:
+        """Close every window ending at or before epoch-millisecond ``time``."""
+        closed: list[CdfBar] = []
+        for end in sorted(end for end in self._by_end if end <= time):
+            for symb in list(self._by_end[end]):
+                closed.append(self._close(symb, self._open[symb]))
+        return closed
+
+    def flush(self) -> list[CdfBar]:
+        """Close every open window, e.g. at the end of a replay."""
+        closed: list[CdfBar] = []
+        for end in sorted(self._by_end):
+            for symb in list(self._by_end[end]):
+                closed.append(self._close(symb, self._open[symb]))
+        return closed
+
+    def _close(self, symb: str, current: _OpenBar) -> CdfBar:
+        del self._open[symb]
+        symbols = self._by_end[current.end]
+        del symbols[symb]
+        if not symbols:
+            del self._by_end[current.end]
+        self._emitted[symb] = current.start
+        return current.to_bar()
@@ -0,0 +1,152 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later OR LicenseRef-Inventzia-Commercial
+# Copyright (c) 2013-2026 Magrino Bini, Paola Apruzzese, Inventzia Science and Technology Ltd.
+#
+# This file is part of pulse-data.
+#
+# pulse-data is dual-licensed:
+#   - Under the GNU Affero General Public License v3.0 or later (see LICENSE-AGPL-3.0).
+#   - Under a commercial license (see LICENSE-COMMERCIAL.txt).
+#     Contact operations@inventzia.com.
+"""
+Recent history per ``datum_key``, indexed by ``datum_time``.
+
+A :class:`TimeSeriesIndex` keeps, for every key, its datums in time order next to
+a sorted list of their ``datum_time``, so window and as-of lookups are a binary
+search instead of a scan::
+
+    history = TimeSeriesIndex(max_age_ms=3_600_000)     # the last hour per key
+    for datum in feed:
+        history.append(datum)
+
+    history.range("ES", t0, t1)          # datums with t0 <= datum_time < t1, O(log n + k)
+    history.asof("ES", t)                # the latest datum at or before t, O(log n)
+
+Retention is a ring buffer per key: ``max_count`` keeps the newest N datums,
+``max_age_ms`` those within that many milliseconds of the key's newest — either
+or both. Expired datums are dropped as new ones arrive, and the storage behind
+them is reclaimed in amortised O(1), so memory stays bounded by the retention.
+Datums must arrive in time order per key (see
+:class:`~inventzia.pulse.data.stream.reorder.ReorderBuffer`); an older one is
+dropped and counted in :attr:`TimeSeriesIndex.late`. Equal times keep arrival
+order.
+
+For columnar storage with zero-copy window slices, see
+:class:`inventzia.pulse.data.columnar.series.ColumnSeriesIndex`.
+"""
+
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable
+
+_COMPACT_MIN = 256          # dropped entries tolerated before a compaction is considered
+
+
+class _Series:
+    """One key's datums and times; entries before ``head`` are expired."""
+
+    __slots__ = ("times", "datums", "head")
+
+    def __init__(self):
+        self.times: list[int] = []
+        self.datums: list = []
+        self.head = 0
+
+    def __len__(self) -> int:
+        return len(self.times) - self.head
+
+    def expire(self, max_count: int | None, max_age_ms: int | None) -> None:
+        head = self.head
+        if max_count is not None and len(self.times) - head > max_count:
+            head = len(self.times) - max_count
+        if max_age_ms is not None:
+            head = bisect_left(self.times, self.times[-1] - max_age_ms, head)
+        if head >= _COMPACT_MIN and 2 * head >= len(self.times):
+            del self.times[:head], self.datums[:head]      # amortised: half the list is dead
+            head = 0
+        self.head = head
+
+
+class TimeSeriesIndex:
+    """Per-key, time-sorted datum history with bisect lookups (see the module docstring)."""
+
+    def __init__(self, *, max_count: int | None = None, max_age_ms: int | None = None):
+        if max_count is not None and max_count <= 0:
+            raise ValueError(f"max_count must be positive, got {max_count}")
+        if max_age_ms is not None and max_age_ms < 0:
+            raise ValueError(f"max_age_ms must be non-negative, got {max_age_ms}")
+        self.max_count = max_count
+        self.max_age_ms = max_age_ms
+        self.late = 0
+        self._series: dict[str, _Series] = {}
+
+    def __len__(self) -> int:
+        """Number of keys."""
+        return len(self._series)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._series
+
+    def keys(self) -> list[str]:
+        return list(self._series)
+
+    def count(self, key: str) -> int:
+        """Datums retained for ``key``."""
+        series = self._series.get(key)
+        return 0 if series is None else len(series)
+
+    # -- Ingest ---------------------------------------------------------------
+
+    def append(self, datum) -> bool:
+        """Add ``datum`` to its key's history; False (and counted late) if out of order."""
+        key, time = datum.datum_key, datum.datum_time
+        series = self._series.get(key)
+        if series is None:
+            series = self._series[key] = _Series()
+        elif len(series) and time < series.times[-1]:
+            self.late += 1
+            return False
+        series.times.append(time)
+        series.datums.append(datum)
+        series.expire(self.max_count, self.max_age_ms)
+        return True
+
+    def extend(self, datums: Iterable) -> None:
+        for datum in datums:
+            self.append(datum)
+
+    # -- Queries --------------------------------------------------------------
+
+    def range(self, key: str, start: int | None = None, stop: int | None = None) -> list:
+        """``key``'s datums with ``start <= datum_time < stop`` (either bound open if None)."""
+        series = self._series.get(key)
+        if series is None:
+            return []
+        lo, hi = self._bounds(series, start, stop)
+        return series.datums[lo:hi]
+
+    def times(self, key: str, start: int | None = None, stop: int | None = None) -> list[int]:
+        """The ``datum_time`` values matching :meth:`range`."""
+        series = self._series.get(key)
+        if series is None:
+            return []
+        lo, hi = self._bounds(series, start, stop)
+        return series.times[lo:hi]
+
+    def asof(self, key: str, time: int):
+        """``key``'s latest datum with ``datum_time <= time``, or None."""
+        series = self._series.get(key)
+        if series is None:
+            return None
+        i = bisect_right(series.times, time, series.head)
+        return series.datums[i - 1] if i > series.head else None
+
+    def latest(self, key: str):
+        """``key``'s newest datum, or None."""
+        series = self._series.get(key)
+        return series.datums[-1] if series is not None and len(series) else None
+
+    @staticmethod
+    def _bounds(series: _Series, start: int | None, stop: int | None) -> tuple[int, int]:
+        times, head = series.times, series.head
+        lo = head if start is None else bisect_left(times, start, head)
+        hi = len(times) if stop is None else bisect_left(times, stop, lo)
+        return lo, hi
@@ -0,0 +1,21 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later OR LicenseRef-Inventzia-Commercial
+# Copyright (c) 2013-2026 Magrino Bini, Paola Apruzzese, Inventzia Science and Technology Ltd.
+#
+# This file is part of pulse-data.
+#
+# pulse-data is dual-licensed:
+#   - Under the GNU Affero General Public License v3.0 or later (see LICENSE-AGPL-3.0).
+#   - Under a commercial license (see LICENSE-COMMERCIAL.txt).
+#     Contact operations@inventzia.com.
+"""Same-host carriers for encoded datums. Standard library only.
+
+    from inventzia.pulse.data.transport import RingProducer, RingConsumer
+"""
+
+from inventzia.pulse.data.transport.shm_ring import RingConsumer, RingProducer, SlowConsumerError
+
+__all__ = [
+    "RingProducer",
+    "RingConsumer",
+    "SlowConsumerError",
+]
@@ -0,0 +1,292 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later OR LicenseRef-Inventzia-Commercial
+# Copyright (c) 2013-2026 Magrino Bini, Paola Apruzzese, Inventzia Science and Technology Ltd.
+#
+# This file is part of pulse-data.
+#
+# pulse-data is dual-licensed:
+#   - Under the GNU Affero General Public License v3.0 or later (see LICENSE-AGPL-3.0).
+#   - Under a commercial license (see LICENSE-COMMERCIAL.txt).
+#     Contact operations@inventzia.com.
+"""
+Single-producer / multi-consumer ring buffer over ``multiprocessing.shared_memory``.
+
+One process publishes framed messages — typically encoded datums (tagged JSON
+from :mod:`~inventzia.pulse.data.datum.codec`, compact frames from
+:class:`~inventzia.pulse.data.datum.session.TypeTable`) — and any number of
+processes on the same host read every message, straight out of the shared
+segment::
+
+    ring = RingProducer("bars", capacity=1 << 24)       # creates the segment
+    ring.publish(to_tagged_json(bar))
+
+    reader = RingConsumer("bars")                         # in another process
+    for view in reader.read_batch():                      # memoryviews, no copy
+        handle(from_tagged_json(bytes(view)))
+    reader.confirm()
+
+The producer never waits for consumers (a broadcast feed must not stall on its
+slowest reader). A consumer that falls more than ``capacity`` bytes behind has
+lost messages: :class:`SlowConsumerError` is raised as soon as that is
+detectable, and :meth:`RingConsumer.resync` skips to the live end.
+
+Layout. A 64-byte header (magic, capacity, *claim*, *tail*) precedes the data
+area. Frames are 8-byte aligned — ``u32 length, u32 flags, u64 sequence``, then
+the payload — and a frame that does not fit before the end of the data area is
+preceded by a padding frame and written at its start. Byte positions are
+absolute (they grow without wrapping; the ring offset is ``position %
+capacity``). The producer raises *claim* to the end of what it is about to
+write, writes, then raises *tail* to publish; a consumer reads frames below
+*tail* and, afterwards, checks that *claim* has not reached ``capacity`` past
+where it started — if it has, the bytes it read may have been overwritten.
+This relies on the header words being written with single aligned 8-byte
+stores, and on every store becoming visible to other processes in program
+order. x86-64 guarantees that; weakly ordered CPUs (ARM, POWER) do not, and
+Python has no memory fences to enforce it, so both ends raise ``RuntimeError``
+on any other architecture.
+"""
+
+import platform
+import struct
+import sys
+from collections.abc import Callable, Iterable
+from multiprocessing import shared_memory
+
+_MAGIC = 0x31474E4952534C50                 # "PLSRING1", little-endian
+_HEADER_SIZE = 64
+_H_MAGIC, _H_CAPACITY, _H_CLAIM, _H_TAIL = range(4)   # u64 slots of the header
+
+_FRAME = struct.Struct("<IIQ")              # length, flags, sequence
+_FRAME_SIZE = _FRAME.size
+_FLAG_PADDING = 1
+
+_ORDERED_STORES = frozenset({"x86_64", "amd64"})   # platform.machine(), lower-cased
+
+
+def _aligned(n: int) -> int:
+    return (n + 7) & ~7
+
+
+def _require_ordered_stores() -> None:
+    machine = platform.machine()
+    if machine.lower() not in _ORDERED_STORES:
+        raise RuntimeError(f"the shared-memory ring needs x86-64 store ordering; "
+                           f"this machine is {machine or 'unknown'!r}")
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name, track=False)
+    # Before 3.13 attaching registers the segment with the resource tracker, which
+    # then unlinks it (under the producer) when this process exits; unregistering
+    # afterwards is no better when the tracker is shared with the producer (fork).
+    from multiprocessing import resource_tracker
+    register = resource_tracker.register
+    resource_tracker.register = lambda name, rtype: None
+    try:
+        return shared_memory.SharedMemory(name)
+    finally:
+        resource_tracker.register = register
+
+
+class SlowConsumerError(Exception):
+    """The producer overwrote messages a :class:`RingConsumer` had not read yet."""
+
+    def __init__(self, position: int, claim: int, capacity: int):
+        super().__init__(f"consumer at byte {position} lapped by the producer (claimed up to "
+                         f"{claim}, ring capacity {capacity}); call resync()")
+        self.position = position
+
+
+class _Ring:
+    """The mapped segment shared by both ends."""
+
+    def __init__(self, shm: shared_memory.SharedMemory):
+        self._shm = shm
+        self._buf = shm.buf
+        self._header = shm.buf[:_HEADER_SIZE].cast("Q")
+        self._data = shm.buf[_HEADER_SIZE:]
+
+    @property
+    def name(self) -> str:
+        """The shared-memory segment name consumers attach to."""
+        return self._shm.name
+
+    @property
+    def capacity(self) -> int:
+        """Size of the data area in bytes."""
+        return self._header[_H_CAPACITY]
+
+    def close(self) -> None:
+        """Unmap the segment. Views handed out by :meth:`RingConsumer.read_batch`
+        must have been released first."""
+        self._header.release()
+        self._data.release()
+        self._buf = None
+        self._shm.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class RingProducer(_Ring):
+    """The single writer of a ring: creates the segment and publishes frames.
+
+    ``capacity`` (bytes, a multiple of 8) bounds both the backlog a consumer
+    may have before it is lapped and the largest frame. Raises ``RuntimeError``
+    off x86-64 (see the module docstring).
+    """
+
+    def __init__(self, name: str | None = None, *, capacity: int = 1 << 20):
+        if capacity <= 0 or capacity % 8:
+            raise ValueError(f"capacity must be a positive multiple of 8, got {capacity}")
+        _require_ordered_stores()
+        super().__init__(shared_memory.SharedMemory(name, create=True,
+                                                    size=_HEADER_SIZE + capacity))
+        header = self._header
+        header[_H_CAPACITY] = capacity
+        header[_H_CLAIM] = header[_H_TAIL] = 0
+        header[_H_MAGIC] = _MAGIC
+        self._capacity = capacity
+        self._position = 0
+        self._sequence = 0
+
+    @property
+    def sequence(self) -> int:
+        """Sequence number the next published frame will carry (frames count from 0)."""
+        return self._sequence
+
+    def publish(self, message: bytes | bytearray | memoryview | str) -> int:
+        """Publish one message (``str`` is UTF-8 encoded); return its sequence number."""
+        sequence = self._sequence
+        self._write(message)
+        self._header[_H_TAIL] = self._position
+        return sequence
+
+    def publish_batch(self, messages: Iterable[bytes | bytearray | memoryview | str]) -> int:
+        """Publish several messages with one tail update; return how many were written."""
+        first = self._sequence
+        for message in messages:
+            self._write(message)
+        self._header[_H_TAIL] = self._position
+        return self._sequence - first
+
+    def _write(self, message) -> None:
+        if isinstance(message, str):
+            message = message.encode("utf-8")
+        length = len(message)
+        size = _aligned(_FRAME_SIZE + length)
+        capacity = self._capacity
+        if size > capacity:
+            raise ValueError(f"message of {length} bytes does not fit a ring of {capacity} bytes")
+        position = self._position
+        offset = position % capacity
+        padding = capacity - offset if offset + size > capacity else 0
+        self._header[_H_CLAIM] = position + padding + size
+        data = self._data
+        if padding >= _FRAME_SIZE:
+            _FRAME.pack_into(data, offset, 0, _FLAG_PADDING, 0)
+        if padding:
+            position += padding
+            offset = 0
+        _FRAME.pack_into(data, offset, length, 0, self._sequence)
+        data[offset + _FRAME_SIZE:offset + _FRAME_SIZE + length] = message
+        self._position = position + size
+        self._sequence += 1
+
+    def unlink(self) -> None:
+        """Remove the segment name; mapped consumers keep working until they close."""
+        self._shm.unlink()
+
+
+class RingConsumer(_Ring):
+    """One reader of a ring, attached by segment name.
+
+    A new consumer starts at the live end (messages published from now on);
+    every consumer sees every message, independently of the others.
+    """
+
+    def __init__(self, name: str):
+        _require_ordered_stores()
+        super().__init__(_attach(name))
+        if self._header[_H_MAGIC] != _MAGIC:
+            self.close()
+            raise ValueError(f"shared memory {name!r} is not an initialised ring")
+        self._capacity = self._header[_H_CAPACITY]
+        self._position = self._header[_H_TAIL]
+        self._batch_start = self._position
+        self._sequence: int | None = None      # next expected; unknown until the first frame
+
+    @property
+    def lag(self) -> int:
+        """Published bytes not yet read."""
+        return self._header[_H_TAIL] - self._position
+
+    def read_batch(self, limit: int = 1024) -> list[memoryview]:
+        """Up to ``limit`` published, unread messages as views into the segment.
+
+        The views alias the ring: a producer that runs ``capacity`` bytes ahead
+        overwrites them. Use them (or copy with ``bytes(view)``), then call
+        :meth:`confirm`, which raises :class:`SlowConsumerError` if that may have
+        happened in the meantime. An empty list means nothing new was published.
+        """
+        header, data, capacity = self._header, self._data, self._capacity
+        tail = header[_H_TAIL]
+        start = position = self._position
+        sequence = self._sequence
+        views: list[memoryview] = []
+        while position < tail and len(views) < limit:
+            offset = position % capacity
+            if capacity - offset < _FRAME_SIZE:
+                position += capacity - offset   # too short for a frame: implicit padding
+                continue
+            length, flags, frame_sequence = _FRAME.unpack_from(data, offset)
+            if flags & _FLAG_PADDING:
+                position += capacity - offset
+                continue
+            if sequence is not None and frame_sequence != sequence:
+                break                           # torn read of an overwritten frame
+            views.append(data[offset + _FRAME_SIZE:offset + _FRAME_SIZE + length])
+            position += _aligned(_FRAME_SIZE + length)
+            sequence = frame_sequence + 1
+        claim = header[_H_CLAIM]
+        if claim - start > capacity:
+            for view in views:
+                view.release()
+            raise SlowConsumerError(start, claim, capacity)
+        self._position = position
+        self._sequence = sequence
+        self._batch_start = start
+        return views
+
+    def confirm(self) -> None:
+        """Check the views of the last :meth:`read_batch` were not overwritten while in use."""
+        claim = self._header[_H_CLAIM]
+        if claim - self._batch_start > self._capacity:
+            raise SlowConsumerError(self._batch_start, claim, self._capacity)
+
+    def poll(self, handler: Callable[[memoryview], None], limit: int = 1024) -> int:
+        """Call ``handler`` on each message of one :meth:`read_batch`, then :meth:`confirm`.
+
+        Returns the number of messages handled. The views are released after the
+        handler returns, so it must copy anything it keeps.
+        """
+        views = self.read_batch(limit)
+        try:
+            for view in views:
+                handler(view)
+        finally:
+            for view in views:
+                view.release()
+        self.confirm()
+        return len(views)
+
+    def resync(self) -> int:
+        """Skip to the live end (after a :class:`SlowConsumerError`); return bytes skipped."""
+        tail = self._header[_H_TAIL]
+        skipped = tail - self._position
+        self._position = self._batch_start = tail
+        self._sequence = None
+        return skipped